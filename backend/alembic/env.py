@@ -13,26 +13,7 @@ from app.core.config import settings
 from app.core.database import Base
 
 # Import all models to ensure they are registered with SQLAlchemy
-from app.models import (
-    Role,
-    Region,
-    Hospital,
-    User,
-    Patient,
-    Visit,
-    Bed,
-    Vitals,
-    NurseLog,
-    LabTest,
-    Prescription,
-    Appointment,
-    Inventory,
-    EMRLocal,
-    EMRGlobal,
-    Notification,
-    AuditLog,
-    AIDraft,
-)
+import app.models.registry  # noqa: F401
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
@@ -0,0 +1,71 @@
+"""Add case_sheet_events table and backfill it from case_sheets.event_timeline
+
+Revision ID: 008
+Revises: 007
+Create Date: 2026-10-16
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.engine.reflection import Inspector
+
+# revision identifiers, used by Alembic.
+revision = '008'
+down_revision = '007'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    conn = op.get_bind()
+    inspector = Inspector.from_engine(conn)
+
+    if 'case_sheet_events' in inspector.get_table_names():
+        return
+
+    op.create_table(
+        'case_sheet_events',
+        sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column('case_sheet_id', postgresql.UUID(as_uuid=True),
+                  sa.ForeignKey('case_sheets.id', ondelete='CASCADE'), nullable=False),
+        sa.Column('event_type', sa.String(length=50), nullable=False),
+        sa.Column('timestamp', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('data', postgresql.JSONB(), nullable=True),
+        sa.Column('by_user_id', postgresql.UUID(as_uuid=True),
+                  sa.ForeignKey('users.id', ondelete='SET NULL'), nullable=True),
+        sa.Column('by_user_name', sa.String(length=200), nullable=True),
+        sa.Column('by_user_role', sa.String(length=50), nullable=True),
+    )
+    op.create_index('ix_case_sheet_events_case_sheet_timestamp', 'case_sheet_events',
+                    ['case_sheet_id', 'timestamp'])
+    op.create_index('ix_case_sheet_events_case_sheet_type', 'case_sheet_events',
+                    ['case_sheet_id', 'event_type'])
+
+    # Backfill existing timelines. log_event() wrote by_user_* keys, the
+    # events endpoints recorded_by_*; timestamps were naive UTC ISO strings.
+    op.execute("""
+        INSERT INTO case_sheet_events
+            (id, case_sheet_id, event_type, timestamp, data, by_user_id, by_user_name, by_user_role)
+        SELECT
+            gen_random_uuid(),
+            cs.id,
+            left(COALESCE(e->>'type', 'other'), 50),
+            COALESCE((e->>'timestamp')::timestamp AT TIME ZONE 'UTC', cs.updated_at),
+            e->'data',
+            NULLIF(COALESCE(e->>'by_user_id', e->>'recorded_by_user_id'), '')::uuid,
+            left(COALESCE(e->>'by_user_name', e->>'recorded_by_user_name'), 200),
+            left(COALESCE(e->>'by_user_role', e->>'recorded_by_role'), 50)
+        FROM case_sheets cs
+        CROSS JOIN LATERAL jsonb_array_elements(cs.event_timeline) AS e
+        WHERE jsonb_typeof(cs.event_timeline) = 'array'
+    """)
+
+
+def downgrade():
+    conn = op.get_bind()
+    inspector = Inspector.from_engine(conn)
+
+    if 'case_sheet_events' in inspector.get_table_names():
+        op.drop_index('ix_case_sheet_events_case_sheet_type', table_name='case_sheet_events')
+        op.drop_index('ix_case_sheet_events_case_sheet_timestamp', table_name='case_sheet_events')
+        op.drop_table('case_sheet_events')
@@ -0,0 +1,52 @@
+"""Replace the AI draft status index and add an active-appointment index, both partial
+
+Revision ID: 009
+Revises: 008
+Create Date: 2026-10-16
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.engine.reflection import Inspector
+
+# revision identifiers, used by Alembic.
+revision = '009'
+down_revision = '008'
+branch_labels = None
+depends_on = None
+
+ACTIVE_APPOINTMENT = "status IN ('scheduled', 'checked_in', 'in_progress')"
+
+
+def _index_names(inspector, table):
+    return {ix['name'] for ix in inspector.get_indexes(table)}
+
+
+def upgrade():
+    conn = op.get_bind()
+    inspector = Inspector.from_engine(conn)
+
+    ai_draft_indexes = _index_names(inspector, 'ai_drafts')
+    if 'ix_ai_draft_pending_created' not in ai_draft_indexes:
+        op.create_index('ix_ai_draft_pending_created', 'ai_drafts', ['created_at'],
+                        postgresql_where=sa.text("status = 'pending'"))
+    if 'ix_ai_draft_status_created' in ai_draft_indexes:
+        op.drop_index('ix_ai_draft_status_created', table_name='ai_drafts')
+
+    if 'ix_appointment_doctor_active_scheduled' not in _index_names(inspector, 'appointments'):
+        op.create_index('ix_appointment_doctor_active_scheduled', 'appointments',
+                        ['doctor_id', 'scheduled_at'],
+                        postgresql_where=sa.text(ACTIVE_APPOINTMENT))
+
+
+def downgrade():
+    conn = op.get_bind()
+    inspector = Inspector.from_engine(conn)
+
+    if 'ix_appointment_doctor_active_scheduled' in _index_names(inspector, 'appointments'):
+        op.drop_index('ix_appointment_doctor_active_scheduled', table_name='appointments')
+
+    ai_draft_indexes = _index_names(inspector, 'ai_drafts')
+    if 'ix_ai_draft_status_created' not in ai_draft_indexes:
+        op.create_index('ix_ai_draft_status_created', 'ai_drafts', ['status', 'created_at'])
+    if 'ix_ai_draft_pending_created' in ai_draft_indexes:
+        op.drop_index('ix_ai_draft_pending_created', table_name='ai_drafts')
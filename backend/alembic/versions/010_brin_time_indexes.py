@@ -0,0 +1,48 @@
+"""Index append-only timestamps (audit_logs.created_at, emr_global.synced_at) with BRIN
+
+Revision ID: 010
+Revises: 009
+Create Date: 2026-10-16
+"""
+from alembic import op
+from sqlalchemy.engine.reflection import Inspector
+
+# revision identifiers, used by Alembic.
+revision = '010'
+down_revision = '009'
+branch_labels = None
+depends_on = None
+
+
+def _index_names(inspector, table):
+    return {ix['name'] for ix in inspector.get_indexes(table)}
+
+
+def upgrade():
+    conn = op.get_bind()
+    inspector = Inspector.from_engine(conn)
+
+    audit_indexes = _index_names(inspector, 'audit_logs')
+    if 'ix_audit_log_created_at_brin' not in audit_indexes:
+        op.create_index('ix_audit_log_created_at_brin', 'audit_logs', ['created_at'],
+                        postgresql_using='brin')
+    if 'ix_audit_logs_created_at' in audit_indexes:
+        op.drop_index('ix_audit_logs_created_at', table_name='audit_logs')
+
+    if 'ix_emr_global_synced_at_brin' not in _index_names(inspector, 'emr_global'):
+        op.create_index('ix_emr_global_synced_at_brin', 'emr_global', ['synced_at'],
+                        postgresql_using='brin')
+
+
+def downgrade():
+    conn = op.get_bind()
+    inspector = Inspector.from_engine(conn)
+
+    if 'ix_emr_global_synced_at_brin' in _index_names(inspector, 'emr_global'):
+        op.drop_index('ix_emr_global_synced_at_brin', table_name='emr_global')
+
+    audit_indexes = _index_names(inspector, 'audit_logs')
+    if 'ix_audit_logs_created_at' not in audit_indexes:
+        op.create_index('ix_audit_logs_created_at', 'audit_logs', ['created_at'])
+    if 'ix_audit_log_created_at_brin' in audit_indexes:
+        op.drop_index('ix_audit_log_created_at_brin', table_name='audit_logs')
@@ -0,0 +1,56 @@
+"""Fold GlobalEMR's append-mostly list columns into one history document
+
+Revision ID: 011
+Revises: 010
+Create Date: 2026-10-16
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.engine.reflection import Inspector
+
+# revision identifiers, used by Alembic.
+revision = '011'
+down_revision = '010'
+branch_labels = None
+depends_on = None
+
+# history key -> legacy column
+SECTIONS = {
+    'diagnoses': 'all_diagnoses',
+    'procedures': 'all_procedures',
+    'allergies': 'all_allergies',
+    'medication_history': 'medication_history',
+    'visit_summary': 'visit_summary',
+    'immunizations': 'immunizations',
+    'emergency_contacts': 'emergency_contacts',
+}
+
+
+def upgrade():
+    conn = op.get_bind()
+    inspector = Inspector.from_engine(conn)
+
+    columns = [col['name'] for col in inspector.get_columns('global_emr')]
+    if 'history' not in columns:
+        op.add_column('global_emr', sa.Column('history', postgresql.JSONB(), nullable=True))
+
+    legacy = {key: column for key, column in SECTIONS.items() if column in columns}
+    if legacy:
+        pairs = ", ".join(f"'{key}', COALESCE({column}, '[]'::jsonb)" for key, column in legacy.items())
+        op.execute(f"UPDATE global_emr SET history = COALESCE(history, '{{}}'::jsonb) || jsonb_build_object({pairs})")
+        for column in legacy.values():
+            op.drop_column('global_emr', column)
+
+
+def downgrade():
+    conn = op.get_bind()
+    inspector = Inspector.from_engine(conn)
+
+    columns = [col['name'] for col in inspector.get_columns('global_emr')]
+    for key, column in SECTIONS.items():
+        if column not in columns:
+            op.add_column('global_emr', sa.Column(column, postgresql.JSONB(), nullable=True))
+            op.execute(f"UPDATE global_emr SET {column} = history -> '{key}'")
+    if 'history' in columns:
+        op.drop_column('global_emr', 'history')
@@ -0,0 +1,74 @@
+"""Move local visit timelines into a visit_events table
+
+Revision ID: 012
+Revises: 011
+Create Date: 2026-10-16
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.engine.reflection import Inspector
+
+# revision identifiers, used by Alembic.
+revision = '012'
+down_revision = '011'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    conn = op.get_bind()
+    inspector = Inspector.from_engine(conn)
+
+    if 'visit_events' not in inspector.get_table_names():
+        op.create_table(
+            'visit_events',
+            sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True),
+            sa.Column('visit_id', postgresql.UUID(as_uuid=True),
+                      sa.ForeignKey('visits.id', ondelete='CASCADE'), nullable=False),
+            sa.Column('event_type', sa.String(length=50), nullable=False),
+            sa.Column('event_timestamp', sa.DateTime(timezone=True), nullable=False),
+            sa.Column('data', postgresql.JSONB(), nullable=True),
+        )
+        op.create_index('ix_visit_events_visit_ts', 'visit_events', ['visit_id', 'event_timestamp'])
+
+    columns = [col['name'] for col in inspector.get_columns('local_visit_records')]
+    if 'timeline' in columns:
+        # Timeline timestamps were naive UTC ISO strings
+        op.execute("""
+            INSERT INTO visit_events (id, visit_id, event_type, event_timestamp, data)
+            SELECT
+                gen_random_uuid(),
+                r.visit_id,
+                left(COALESCE(e->>'type', 'other'), 50),
+                COALESCE((e->>'timestamp')::timestamp AT TIME ZONE 'UTC', r.updated_at),
+                e->'data'
+            FROM local_visit_records r
+            CROSS JOIN LATERAL jsonb_array_elements(r.timeline) AS e
+            WHERE jsonb_typeof(r.timeline) = 'array'
+        """)
+        op.drop_column('local_visit_records', 'timeline')
+
+
+def downgrade():
+    conn = op.get_bind()
+    inspector = Inspector.from_engine(conn)
+
+    columns = [col['name'] for col in inspector.get_columns('local_visit_records')]
+    if 'timeline' not in columns:
+        op.add_column('local_visit_records', sa.Column('timeline', postgresql.JSONB(), nullable=True))
+
+    if 'visit_events' in inspector.get_table_names():
+        op.execute("""
+            UPDATE local_visit_records r
+            SET timeline = (
+                SELECT jsonb_agg(
+                    jsonb_build_object('type', e.event_type, 'timestamp', e.event_timestamp, 'data', e.data)
+                    ORDER BY e.event_timestamp
+                )
+                FROM visit_events e
+                WHERE e.visit_id = r.visit_id
+            )
+        """)
+        op.drop_index('ix_visit_events_visit_ts', table_name='visit_events')
+        op.drop_table('visit_events')
@@ -0,0 +1,75 @@
+"""Denormalize hospital, patient and recipient onto messages
+
+Revision ID: 013
+Revises: 012
+Create Date: 2026-10-16
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.engine.reflection import Inspector
+
+# revision identifiers, used by Alembic.
+revision = '013'
+down_revision = '012'
+branch_labels = None
+depends_on = None
+
+COLUMNS = {
+    'hospital_id': ('hospitals.id', 'SET NULL'),
+    'patient_id': ('patients.id', 'CASCADE'),
+    'recipient_user_id': ('users.id', 'SET NULL'),
+}
+INDEXES = {
+    'ix_messages_hospital_read': ['hospital_id', 'read_at'],
+    'ix_messages_recipient_read': ['recipient_user_id', 'read_at'],
+}
+
+
+def upgrade():
+    conn = op.get_bind()
+    inspector = Inspector.from_engine(conn)
+
+    columns = [col['name'] for col in inspector.get_columns('messages')]
+    for name, (target, ondelete) in COLUMNS.items():
+        if name not in columns:
+            op.add_column('messages', sa.Column(
+                name, postgresql.UUID(as_uuid=True),
+                sa.ForeignKey(target, ondelete=ondelete), nullable=True,
+            ))
+
+    # Backfill from each message's thread: the recipient is whichever
+    # participant did not send it
+    op.execute("""
+        UPDATE messages m
+        SET hospital_id = su.hospital_id,
+            patient_id = t.patient_id,
+            recipient_user_id = CASE
+                WHEN m.sender_user_id = t.staff_user_id THEN p.user_id
+                ELSE t.staff_user_id
+            END
+        FROM message_threads t
+        JOIN users su ON su.id = t.staff_user_id
+        JOIN patients p ON p.id = t.patient_id
+        WHERE t.id = m.thread_id AND m.patient_id IS NULL
+    """)
+
+    indexes = {ix['name'] for ix in inspector.get_indexes('messages')}
+    for name, index_columns in INDEXES.items():
+        if name not in indexes:
+            op.create_index(name, 'messages', index_columns)
+
+
+def downgrade():
+    conn = op.get_bind()
+    inspector = Inspector.from_engine(conn)
+
+    indexes = {ix['name'] for ix in inspector.get_indexes('messages')}
+    for name in INDEXES:
+        if name in indexes:
+            op.drop_index(name, table_name='messages')
+
+    columns = [col['name'] for col in inspector.get_columns('messages')]
+    for name in COLUMNS:
+        if name in columns:
+            op.drop_column('messages', name)
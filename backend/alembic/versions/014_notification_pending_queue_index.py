@@ -0,0 +1,34 @@
+"""Add a partial index over pending notifications for the queue worker
+
+Revision ID: 014
+Revises: 013
+Create Date: 2026-10-16
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.engine.reflection import Inspector
+
+# revision identifiers, used by Alembic.
+revision = '014'
+down_revision = '013'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    conn = op.get_bind()
+    inspector = Inspector.from_engine(conn)
+
+    indexes = {ix['name'] for ix in inspector.get_indexes('notifications')}
+    if 'ix_notification_pending_queue' not in indexes:
+        op.create_index('ix_notification_pending_queue', 'notifications', ['created_at'],
+                        postgresql_where=sa.text("status = 'pending'"))
+
+
+def downgrade():
+    conn = op.get_bind()
+    inspector = Inspector.from_engine(conn)
+
+    indexes = {ix['name'] for ix in inspector.get_indexes('notifications')}
+    if 'ix_notification_pending_queue' in indexes:
+        op.drop_index('ix_notification_pending_queue', table_name='notifications')
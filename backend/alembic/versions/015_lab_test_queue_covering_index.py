@@ -0,0 +1,41 @@
+"""Replace the lab test status/urgency index with a partial covering queue index
+
+Revision ID: 015
+Revises: 014
+Create Date: 2026-10-16
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.engine.reflection import Inspector
+
+# revision identifiers, used by Alembic.
+revision = '015'
+down_revision = '014'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    conn = op.get_bind()
+    inspector = Inspector.from_engine(conn)
+
+    indexes = {ix['name'] for ix in inspector.get_indexes('lab_tests')}
+    if 'ix_lab_test_queue' not in indexes:
+        op.create_index(
+            'ix_lab_test_queue', 'lab_tests', ['status', 'urgency', 'requested_at'],
+            postgresql_include=['test_type', 'patient_id', 'assigned_to_id', 'visit_id'],
+            postgresql_where=sa.text("status IN ('pending', 'accepted', 'in_progress')"),
+        )
+    if 'ix_lab_test_status_urgency' in indexes:
+        op.drop_index('ix_lab_test_status_urgency', table_name='lab_tests')
+
+
+def downgrade():
+    conn = op.get_bind()
+    inspector = Inspector.from_engine(conn)
+
+    indexes = {ix['name'] for ix in inspector.get_indexes('lab_tests')}
+    if 'ix_lab_test_status_urgency' not in indexes:
+        op.create_index('ix_lab_test_status_urgency', 'lab_tests', ['status', 'urgency', 'requested_at'])
+    if 'ix_lab_test_queue' in indexes:
+        op.drop_index('ix_lab_test_queue', table_name='lab_tests')
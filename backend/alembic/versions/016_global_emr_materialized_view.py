@@ -0,0 +1,41 @@
+"""Add the mv_global_emr materialized view (per-patient global EMR rollup)
+
+Revision ID: 016
+Revises: 015
+Create Date: 2026-10-16
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '016'
+down_revision = '015'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.execute("""
+        CREATE MATERIALIZED VIEW IF NOT EXISTS mv_global_emr AS
+        SELECT
+            patient_id,
+            jsonb_object_agg(record_type, records) AS records,
+            sum(record_count)::int AS record_count,
+            max(last_synced_at) AS last_synced_at
+        FROM (
+            SELECT
+                patient_id,
+                record_type,
+                jsonb_agg(data ORDER BY synced_at) AS records,
+                count(*) AS record_count,
+                max(synced_at) AS last_synced_at
+            FROM emr_global
+            GROUP BY patient_id, record_type
+        ) by_type
+        GROUP BY patient_id
+    """)
+    # Unique index: required by REFRESH ... CONCURRENTLY and used for lookups
+    op.execute("CREATE UNIQUE INDEX IF NOT EXISTS ux_mv_global_emr_patient ON mv_global_emr (patient_id)")
+
+
+def downgrade():
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS mv_global_emr")
@@ -0,0 +1,44 @@
+"""Drop single-column indexes already served by composite indexes
+
+Revision ID: 017
+Revises: 016
+Create Date: 2026-10-16
+"""
+from alembic import op
+from sqlalchemy.engine.reflection import Inspector
+
+# revision identifiers, used by Alembic.
+revision = '017'
+down_revision = '016'
+branch_labels = None
+depends_on = None
+
+# (table, column): each is the leading column of a composite index, except
+# patient_hospitals.is_active, a boolean too unselective to be worth indexing
+REDUNDANT = [
+    ('inventory', 'hospital_id'),
+    ('patient_hospitals', 'patient_id'),
+    ('patient_hospitals', 'hospital_id'),
+    ('patient_hospitals', 'is_active'),
+    ('nurse_logs', 'visit_id'),
+]
+
+
+def upgrade():
+    conn = op.get_bind()
+    inspector = Inspector.from_engine(conn)
+
+    for table, column in REDUNDANT:
+        name = f'ix_{table}_{column}'
+        if name in {ix['name'] for ix in inspector.get_indexes(table)}:
+            op.drop_index(name, table_name=table)
+
+
+def downgrade():
+    conn = op.get_bind()
+    inspector = Inspector.from_engine(conn)
+
+    for table, column in REDUNDANT:
+        name = f'ix_{table}_{column}'
+        if name not in {ix['name'] for ix in inspector.get_indexes(table)}:
+            op.create_index(name, table, [column])
@@ -0,0 +1,44 @@
+"""BRIN indexes on nurse_logs.logged_at and notifications.created_at
+
+Revision ID: 018
+Revises: 017
+Create Date: 2026-10-16
+"""
+from alembic import op
+from sqlalchemy.engine.reflection import Inspector
+
+# revision identifiers, used by Alembic.
+revision = '018'
+down_revision = '017'
+branch_labels = None
+depends_on = None
+
+BRIN_INDEXES = {
+    'ix_nurse_log_logged_brin': ('nurse_logs', 'logged_at'),
+    'ix_notification_created_brin': ('notifications', 'created_at'),
+}
+
+
+def upgrade():
+    conn = op.get_bind()
+    inspector = Inspector.from_engine(conn)
+
+    for name, (table, column) in BRIN_INDEXES.items():
+        if name not in {ix['name'] for ix in inspector.get_indexes(table)}:
+            op.create_index(name, table, [column], postgresql_using='brin',
+                            postgresql_with={'pages_per_range': 32})
+
+    if 'ix_nurse_logs_logged_at' in {ix['name'] for ix in inspector.get_indexes('nurse_logs')}:
+        op.drop_index('ix_nurse_logs_logged_at', table_name='nurse_logs')
+
+
+def downgrade():
+    conn = op.get_bind()
+    inspector = Inspector.from_engine(conn)
+
+    if 'ix_nurse_logs_logged_at' not in {ix['name'] for ix in inspector.get_indexes('nurse_logs')}:
+        op.create_index('ix_nurse_logs_logged_at', 'nurse_logs', ['logged_at'])
+
+    for name, (table, column) in BRIN_INDEXES.items():
+        if name in {ix['name'] for ix in inspector.get_indexes(table)}:
+            op.drop_index(name, table_name=table)
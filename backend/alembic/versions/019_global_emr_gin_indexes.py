@@ -0,0 +1,41 @@
+"""GIN (jsonb_path_ops) indexes for containment queries on global_emr
+
+Revision ID: 019
+Revises: 018
+Create Date: 2026-10-16
+"""
+from alembic import op
+from sqlalchemy.engine.reflection import Inspector
+
+# revision identifiers, used by Alembic.
+revision = '019'
+down_revision = '018'
+branch_labels = None
+depends_on = None
+
+GIN_INDEXES = {
+    'ix_global_emr_chronic_conditions_gin': 'chronic_conditions',
+    'ix_global_emr_current_medications_gin': 'current_medications',
+    'ix_global_emr_history_gin': 'history',
+}
+
+
+def upgrade():
+    conn = op.get_bind()
+    inspector = Inspector.from_engine(conn)
+
+    existing = {ix['name'] for ix in inspector.get_indexes('global_emr')}
+    for name, column in GIN_INDEXES.items():
+        if name not in existing:
+            op.create_index(name, 'global_emr', [column], postgresql_using='gin',
+                            postgresql_ops={column: 'jsonb_path_ops'})
+
+
+def downgrade():
+    conn = op.get_bind()
+    inspector = Inspector.from_engine(conn)
+
+    existing = {ix['name'] for ix in inspector.get_indexes('global_emr')}
+    for name in GIN_INDEXES:
+        if name in existing:
+            op.drop_index(name, table_name='global_emr')
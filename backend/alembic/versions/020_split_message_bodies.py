@@ -0,0 +1,57 @@
+"""Move message text into a 1:1 message_bodies table
+
+Revision ID: 020
+Revises: 019
+Create Date: 2026-10-16
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.engine.reflection import Inspector
+
+# revision identifiers, used by Alembic.
+revision = '020'
+down_revision = '019'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    conn = op.get_bind()
+    inspector = Inspector.from_engine(conn)
+
+    if 'message_bodies' not in inspector.get_table_names():
+        op.create_table(
+            'message_bodies',
+            sa.Column('message_id', postgresql.UUID(as_uuid=True),
+                      sa.ForeignKey('messages.id', ondelete='CASCADE'), primary_key=True),
+            sa.Column('content', sa.Text(), nullable=False),
+        )
+
+    columns = [col['name'] for col in inspector.get_columns('messages')]
+    if 'content' in columns:
+        op.execute("""
+            INSERT INTO message_bodies (message_id, content)
+            SELECT id, content FROM messages
+            ON CONFLICT (message_id) DO NOTHING
+        """)
+        op.drop_column('messages', 'content')
+
+
+def downgrade():
+    conn = op.get_bind()
+    inspector = Inspector.from_engine(conn)
+
+    columns = [col['name'] for col in inspector.get_columns('messages')]
+    if 'content' not in columns:
+        op.add_column('messages', sa.Column('content', sa.Text(), nullable=True))
+
+    if 'message_bodies' in inspector.get_table_names():
+        op.execute("""
+            UPDATE messages m SET content = b.content
+            FROM message_bodies b WHERE b.message_id = m.id
+        """)
+        op.drop_table('message_bodies')
+
+    op.execute("UPDATE messages SET content = '' WHERE content IS NULL")
+    op.alter_column('messages', 'content', nullable=False)
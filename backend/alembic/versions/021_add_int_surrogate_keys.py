@@ -0,0 +1,40 @@
+"""Add integer surrogate keys to hospitals and regions
+
+Revision ID: 021
+Revises: 020
+Create Date: 2026-10-16
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.engine.reflection import Inspector
+
+# revision identifiers, used by Alembic.
+revision = '021'
+down_revision = '020'
+branch_labels = None
+depends_on = None
+
+TABLES = ('regions', 'hospitals')
+
+
+def upgrade():
+    conn = op.get_bind()
+    inspector = Inspector.from_engine(conn)
+
+    for table in TABLES:
+        columns = [col['name'] for col in inspector.get_columns(table)]
+        if 'int_id' not in columns:
+            # Adding an identity column numbers the existing rows
+            op.add_column(table, sa.Column('int_id', sa.Integer(), sa.Identity(), nullable=False))
+            op.create_unique_constraint(f'uq_{table}_int_id', table, ['int_id'])
+
+
+def downgrade():
+    conn = op.get_bind()
+    inspector = Inspector.from_engine(conn)
+
+    for table in TABLES:
+        columns = [col['name'] for col in inspector.get_columns(table)]
+        if 'int_id' in columns:
+            op.drop_constraint(f'uq_{table}_int_id', table, type_='unique')
+            op.drop_column(table, 'int_id')
@@ -0,0 +1,49 @@
+"""Store hospital, region and inventory item codes as citext
+
+Revision ID: 022
+Revises: 021
+Create Date: 2026-10-16
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.engine.reflection import Inspector
+
+# revision identifiers, used by Alembic.
+revision = '022'
+down_revision = '021'
+branch_labels = None
+depends_on = None
+
+# (table, column, previous length)
+COLUMNS = [
+    ('hospitals', 'code', 50),
+    ('regions', 'code', 20),
+    ('inventory', 'item_code', 50),
+]
+
+
+def upgrade():
+    conn = op.get_bind()
+    inspector = Inspector.from_engine(conn)
+
+    op.execute("CREATE EXTENSION IF NOT EXISTS citext")
+
+    # Existing unique indexes are rebuilt by the type change and will
+    # reject codes that only differ by case
+    for table, column, _ in COLUMNS:
+        col = next(c for c in inspector.get_columns(table) if c['name'] == column)
+        if not isinstance(col['type'], postgresql.CITEXT):
+            op.alter_column(table, column, type_=postgresql.CITEXT(),
+                            existing_nullable=False)
+
+
+def downgrade():
+    conn = op.get_bind()
+    inspector = Inspector.from_engine(conn)
+
+    for table, column, length in COLUMNS:
+        col = next(c for c in inspector.get_columns(table) if c['name'] == column)
+        if isinstance(col['type'], postgresql.CITEXT):
+            op.alter_column(table, column, type_=sa.String(length=length),
+                            existing_nullable=False)
@@ -0,0 +1,59 @@
+"""Store notification status as a native enum
+
+Revision ID: 023
+Revises: 022
+Create Date: 2026-10-16
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.engine.reflection import Inspector
+
+# revision identifiers, used by Alembic.
+revision = '023'
+down_revision = '022'
+branch_labels = None
+depends_on = None
+
+STATUSES = ('pending', 'processing', 'sent', 'delivered', 'failed', 'cancelled')
+status_enum = postgresql.ENUM(*STATUSES, name='notification_status')
+
+
+def _recreate_pending_index(inspector):
+    # The partial index predicate compares status to a literal, so it must
+    # be rebuilt against the new column type for the planner to use it
+    indexes = {ix['name'] for ix in inspector.get_indexes('notifications')}
+    if 'ix_notification_pending_queue' in indexes:
+        op.drop_index('ix_notification_pending_queue', table_name='notifications')
+    op.create_index('ix_notification_pending_queue', 'notifications', ['created_at'],
+                    postgresql_where=sa.text("status = 'pending'"))
+
+
+def upgrade():
+    conn = op.get_bind()
+    inspector = Inspector.from_engine(conn)
+
+    col = next(c for c in inspector.get_columns('notifications') if c['name'] == 'status')
+    if isinstance(col['type'], postgresql.ENUM):
+        return
+
+    status_enum.create(conn, checkfirst=True)
+    op.alter_column('notifications', 'status', type_=status_enum,
+                    postgresql_using='status::notification_status',
+                    existing_nullable=False)
+    _recreate_pending_index(inspector)
+
+
+def downgrade():
+    conn = op.get_bind()
+    inspector = Inspector.from_engine(conn)
+
+    col = next(c for c in inspector.get_columns('notifications') if c['name'] == 'status')
+    if not isinstance(col['type'], postgresql.ENUM):
+        return
+
+    op.alter_column('notifications', 'status', type_=sa.String(length=50),
+                    postgresql_using='status::text',
+                    existing_nullable=False)
+    _recreate_pending_index(inspector)
+    status_enum.drop(conn, checkfirst=True)
@@ -0,0 +1,50 @@
+"""Replace the inventory low-stock composite index with a generated flag
+
+Revision ID: 024
+Revises: 023
+Create Date: 2026-10-16
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.engine.reflection import Inspector
+
+# revision identifiers, used by Alembic.
+revision = '024'
+down_revision = '023'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    conn = op.get_bind()
+    inspector = Inspector.from_engine(conn)
+
+    columns = [col['name'] for col in inspector.get_columns('inventory')]
+    if 'low_stock' not in columns:
+        op.add_column('inventory', sa.Column(
+            'low_stock', sa.Boolean(),
+            sa.Computed('quantity < threshold_alert', persisted=True),
+        ))
+
+    indexes = {ix['name'] for ix in inspector.get_indexes('inventory')}
+    if 'ix_inventory_low_stock' in indexes:
+        # quantity < threshold_alert can't seek on (quantity, threshold_alert)
+        op.drop_index('ix_inventory_low_stock', table_name='inventory')
+    if 'ix_inventory_low_stock_partial' not in indexes:
+        op.create_index('ix_inventory_low_stock_partial', 'inventory', ['hospital_id'],
+                        postgresql_where=sa.text('low_stock'))
+
+
+def downgrade():
+    conn = op.get_bind()
+    inspector = Inspector.from_engine(conn)
+
+    indexes = {ix['name'] for ix in inspector.get_indexes('inventory')}
+    if 'ix_inventory_low_stock_partial' in indexes:
+        op.drop_index('ix_inventory_low_stock_partial', table_name='inventory')
+    if 'ix_inventory_low_stock' not in indexes:
+        op.create_index('ix_inventory_low_stock', 'inventory', ['quantity', 'threshold_alert'])
+
+    columns = [col['name'] for col in inspector.get_columns('inventory')]
+    if 'low_stock' in columns:
+        op.drop_column('inventory', 'low_stock')
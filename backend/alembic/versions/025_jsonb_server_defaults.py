@@ -0,0 +1,36 @@
+"""Move empty JSONB defaults on global EMR tables to the server
+
+Revision ID: 025
+Revises: 024
+Create Date: 2026-10-16
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = '025'
+down_revision = '024'
+branch_labels = None
+depends_on = None
+
+# (table, column, empty value)
+COLUMNS = [
+    ('global_emr', 'chronic_conditions', '[]'),
+    ('global_emr', 'current_medications', '[]'),
+    ('global_emr', 'history', '{}'),
+    ('local_visit_records', 'daily_summaries', '[]'),
+]
+
+
+def upgrade():
+    for table, column, empty in COLUMNS:
+        op.execute(f"UPDATE {table} SET {column} = '{empty}'::jsonb WHERE {column} IS NULL")
+        op.alter_column(table, column, existing_type=postgresql.JSONB(),
+                        server_default=sa.text(f"'{empty}'::jsonb"), nullable=False)
+
+
+def downgrade():
+    for table, column, _ in COLUMNS:
+        op.alter_column(table, column, existing_type=postgresql.JSONB(),
+                        server_default=None, nullable=True)
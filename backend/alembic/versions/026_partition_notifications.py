@@ -0,0 +1,102 @@
+"""Partition notifications by month on created_at
+
+Revision ID: 026
+Revises: 025
+Create Date: 2026-10-16
+"""
+from datetime import date, timedelta
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '026'
+down_revision = '025'
+branch_labels = None
+depends_on = None
+
+INDEXES = [
+    "CREATE INDEX ix_notifications_recipient_user_id ON notifications (recipient_user_id)",
+    "CREATE INDEX ix_notifications_channel ON notifications (channel)",
+    "CREATE INDEX ix_notifications_status ON notifications (status)",
+    "CREATE INDEX ix_notification_status_created ON notifications (status, created_at)",
+    "CREATE INDEX ix_notification_recipient_created ON notifications (recipient_user_id, created_at)",
+    "CREATE INDEX ix_notification_pending_queue ON notifications (created_at) WHERE status = 'pending'",
+    "CREATE INDEX ix_notification_created_brin ON notifications USING brin (created_at) WITH (pages_per_range = 32)",
+]
+
+
+def _next_month(month):
+    return (month + timedelta(days=32)).replace(day=1)
+
+
+def _create_month_partition(month):
+    end = _next_month(month)
+    op.execute(
+        f"CREATE TABLE IF NOT EXISTS notifications_{month:%Y_%m} PARTITION OF notifications "
+        f"FOR VALUES FROM ('{month.isoformat()}') TO ('{end.isoformat()}')"
+    )
+
+
+def _is_partitioned(conn):
+    return conn.execute(sa.text(
+        "SELECT EXISTS (SELECT 1 FROM pg_partitioned_table p "
+        "JOIN pg_class c ON c.oid = p.partrelid WHERE c.relname = 'notifications')"
+    )).scalar()
+
+
+def upgrade():
+    conn = op.get_bind()
+    this_month = date.today().replace(day=1)
+
+    if not _is_partitioned(conn):
+        op.execute("ALTER TABLE notifications RENAME TO notifications_unpartitioned")
+        op.execute("ALTER TABLE notifications_unpartitioned RENAME CONSTRAINT notifications_pkey TO notifications_unpartitioned_pkey")
+        op.execute("""
+            CREATE TABLE notifications (
+                LIKE notifications_unpartitioned INCLUDING DEFAULTS INCLUDING CONSTRAINTS,
+                PRIMARY KEY (id, created_at),
+                FOREIGN KEY (recipient_user_id) REFERENCES users(id) ON DELETE CASCADE
+            ) PARTITION BY RANGE (created_at)
+        """)
+
+        # One partition per month that already has rows
+        oldest = conn.execute(sa.text(
+            "SELECT min(created_at) FROM notifications_unpartitioned"
+        )).scalar()
+        month = oldest.date().replace(day=1) if oldest else this_month
+        while month < this_month:
+            _create_month_partition(month)
+            month = _next_month(month)
+
+    # Current and next month, plus a catch-all so inserts never fail
+    _create_month_partition(this_month)
+    _create_month_partition(_next_month(this_month))
+    op.execute("CREATE TABLE IF NOT EXISTS notifications_default PARTITION OF notifications DEFAULT")
+
+    if conn.execute(sa.text("SELECT to_regclass('notifications_unpartitioned')")).scalar():
+        op.execute("INSERT INTO notifications SELECT * FROM notifications_unpartitioned")
+        op.execute("DROP TABLE notifications_unpartitioned")
+        for statement in INDEXES:
+            op.execute(statement)
+
+
+def downgrade():
+    conn = op.get_bind()
+    if not _is_partitioned(conn):
+        return
+
+    op.execute("ALTER TABLE notifications RENAME TO notifications_partitioned")
+    op.execute("ALTER TABLE notifications_partitioned RENAME CONSTRAINT notifications_pkey TO notifications_partitioned_pkey")
+    op.execute("""
+        CREATE TABLE notifications (
+            LIKE notifications_partitioned INCLUDING DEFAULTS INCLUDING CONSTRAINTS,
+            PRIMARY KEY (id),
+            FOREIGN KEY (recipient_user_id) REFERENCES users(id) ON DELETE CASCADE
+        )
+    """)
+    op.execute("INSERT INTO notifications SELECT * FROM notifications_partitioned")
+    # Dropping the parent drops every partition with it
+    op.execute("DROP TABLE notifications_partitioned")
+    for statement in INDEXES:
+        op.execute(statement)
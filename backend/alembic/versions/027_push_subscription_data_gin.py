@@ -0,0 +1,39 @@
+"""GIN (jsonb_path_ops) index on push subscription data
+
+Revision ID: 027
+Revises: 026
+Create Date: 2026-10-16
+"""
+from alembic import op
+from sqlalchemy.engine.reflection import Inspector
+
+# revision identifiers, used by Alembic.
+revision = '027'
+down_revision = '026'
+branch_labels = None
+depends_on = None
+
+INDEX = 'ix_push_subscription_data_gin'
+
+
+def upgrade():
+    conn = op.get_bind()
+    inspector = Inspector.from_engine(conn)
+
+    if INDEX not in {ix['name'] for ix in inspector.get_indexes('push_subscriptions')}:
+        # Built outside the migration transaction so subscribe/unsubscribe
+        # writes aren't blocked while it builds
+        with op.get_context().autocommit_block():
+            op.create_index(INDEX, 'push_subscriptions', ['subscription_data'],
+                            postgresql_using='gin',
+                            postgresql_ops={'subscription_data': 'jsonb_path_ops'},
+                            postgresql_concurrently=True)
+
+
+def downgrade():
+    conn = op.get_bind()
+    inspector = Inspector.from_engine(conn)
+
+    if INDEX in {ix['name'] for ix in inspector.get_indexes('push_subscriptions')}:
+        with op.get_context().autocommit_block():
+            op.drop_index(INDEX, table_name='push_subscriptions', postgresql_concurrently=True)
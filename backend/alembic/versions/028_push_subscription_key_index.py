@@ -0,0 +1,46 @@
+"""Replace the push subscription GIN index with an index on the p256dh key
+
+Revision ID: 028
+Revises: 027
+Create Date: 2026-10-16
+"""
+from alembic import op
+from sqlalchemy.engine.reflection import Inspector
+
+# revision identifiers, used by Alembic.
+revision = '028'
+down_revision = '027'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    conn = op.get_bind()
+    inspector = Inspector.from_engine(conn)
+
+    existing = {ix['name'] for ix in inspector.get_indexes('push_subscriptions')}
+    with op.get_context().autocommit_block():
+        if 'ix_push_sub_p256dh' not in existing:
+            op.execute(
+                "CREATE INDEX CONCURRENTLY ix_push_sub_p256dh ON push_subscriptions "
+                "USING btree ((subscription_data->'keys'->>'p256dh'))"
+            )
+        if 'ix_push_subscription_data_gin' in existing:
+            op.drop_index('ix_push_subscription_data_gin', table_name='push_subscriptions',
+                          postgresql_concurrently=True)
+
+
+def downgrade():
+    conn = op.get_bind()
+    inspector = Inspector.from_engine(conn)
+
+    existing = {ix['name'] for ix in inspector.get_indexes('push_subscriptions')}
+    with op.get_context().autocommit_block():
+        if 'ix_push_subscription_data_gin' not in existing:
+            op.create_index('ix_push_subscription_data_gin', 'push_subscriptions', ['subscription_data'],
+                            postgresql_using='gin',
+                            postgresql_ops={'subscription_data': 'jsonb_path_ops'},
+                            postgresql_concurrently=True)
+        if 'ix_push_sub_p256dh' in existing:
+            op.drop_index('ix_push_sub_p256dh', table_name='push_subscriptions',
+                          postgresql_concurrently=True)
@@ -0,0 +1,49 @@
+"""Hospital dashboard and sync-queue indexes on visits
+
+Revision ID: 029
+Revises: 028
+Create Date: 2026-10-16
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.engine.reflection import Inspector
+
+# revision identifiers, used by Alembic.
+revision = '029'
+down_revision = '028'
+branch_labels = None
+depends_on = None
+
+# name -> (columns, partial index predicate)
+INDEXES = {
+    'ix_visit_hosp_status_prio': (['hospital_id', 'status', 'priority'], None),
+    'ix_visit_active_hospital': (['hospital_id', 'priority'], "status = 'active'"),
+    'ix_visit_sync_pending': (['sync_status'], 'is_synced_to_global = false'),
+}
+
+
+def upgrade():
+    conn = op.get_bind()
+    inspector = Inspector.from_engine(conn)
+
+    existing = {ix['name'] for ix in inspector.get_indexes('visits')}
+    for name, (columns, where) in INDEXES.items():
+        if name not in existing:
+            op.create_index(name, 'visits', columns,
+                            postgresql_where=sa.text(where) if where else None)
+
+    # hospital_id now leads ix_visit_hosp_status_prio
+    if 'ix_visits_hospital_id' in existing:
+        op.drop_index('ix_visits_hospital_id', table_name='visits')
+
+
+def downgrade():
+    conn = op.get_bind()
+    inspector = Inspector.from_engine(conn)
+
+    existing = {ix['name'] for ix in inspector.get_indexes('visits')}
+    if 'ix_visits_hospital_id' not in existing:
+        op.create_index('ix_visits_hospital_id', 'visits', ['hospital_id'])
+    for name in INDEXES:
+        if name in existing:
+            op.drop_index(name, table_name='visits')
@@ -0,0 +1,49 @@
+"""BRIN index on vitals.recorded_at
+
+Revision ID: 030
+Revises: 029
+Create Date: 2026-10-16
+"""
+from alembic import op
+from sqlalchemy.engine.reflection import Inspector
+
+# revision identifiers, used by Alembic.
+revision = '030'
+down_revision = '029'
+branch_labels = None
+depends_on = None
+
+# Single-column B-trees the BRIN and ix_vitals_visit_recorded replace
+REDUNDANT = {
+    'ix_vitals_recorded_at': 'recorded_at',
+    'ix_vitals_visit_id': 'visit_id',
+}
+
+
+def upgrade():
+    conn = op.get_bind()
+    inspector = Inspector.from_engine(conn)
+
+    existing = {ix['name'] for ix in inspector.get_indexes('vitals')}
+    with op.get_context().autocommit_block():
+        if 'ix_vitals_recorded_brin' not in existing:
+            op.create_index('ix_vitals_recorded_brin', 'vitals', ['recorded_at'],
+                            postgresql_using='brin',
+                            postgresql_with={'pages_per_range': 32},
+                            postgresql_concurrently=True)
+        for name in REDUNDANT:
+            if name in existing:
+                op.drop_index(name, table_name='vitals', postgresql_concurrently=True)
+
+
+def downgrade():
+    conn = op.get_bind()
+    inspector = Inspector.from_engine(conn)
+
+    existing = {ix['name'] for ix in inspector.get_indexes('vitals')}
+    with op.get_context().autocommit_block():
+        for name, column in REDUNDANT.items():
+            if name not in existing:
+                op.create_index(name, 'vitals', [column], postgresql_concurrently=True)
+        if 'ix_vitals_recorded_brin' in existing:
+            op.drop_index('ix_vitals_recorded_brin', table_name='vitals', postgresql_concurrently=True)
@@ -0,0 +1,41 @@
+"""Store vitals measurements as REAL instead of NUMERIC
+
+Revision ID: 031
+Revises: 030
+Create Date: 2026-10-16
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.engine.reflection import Inspector
+
+# revision identifiers, used by Alembic.
+revision = '031'
+down_revision = '030'
+branch_labels = None
+depends_on = None
+
+# column -> previous NUMERIC(precision, scale)
+COLUMNS = {
+    'temperature': (4, 1),
+    'weight': (5, 2),
+    'height': (5, 2),
+    'bmi': (4, 2),
+}
+
+
+def upgrade():
+    conn = op.get_bind()
+    inspector = Inspector.from_engine(conn)
+
+    types = {col['name']: col['type'] for col in inspector.get_columns('vitals')}
+    for column in COLUMNS:
+        if isinstance(types.get(column), sa.Numeric) and not isinstance(types[column], sa.Float):
+            op.alter_column('vitals', column, type_=sa.REAL(),
+                            postgresql_using=f'{column}::real', existing_nullable=True)
+
+
+def downgrade():
+    for column, (precision, scale) in COLUMNS.items():
+        op.alter_column('vitals', column, type_=sa.Numeric(precision, scale),
+                        postgresql_using=f'round({column}::numeric, {scale})',
+                        existing_nullable=True)
@@ -0,0 +1,71 @@
+"""Point emr_global.source_hospital_id at hospitals.int_id
+
+Revision ID: 032
+Revises: 031
+Create Date: 2026-10-16
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.engine.reflection import Inspector
+
+# revision identifiers, used by Alembic.
+revision = '032'
+down_revision = '031'
+branch_labels = None
+depends_on = None
+
+FK_NAME = 'emr_global_source_hospital_id_fkey'
+INDEX_NAME = 'ix_emr_global_source_hospital_id'
+
+
+def _column_type(inspector, name):
+    for col in inspector.get_columns('emr_global'):
+        if col['name'] == name:
+            return col['type']
+    return None
+
+
+def upgrade():
+    conn = op.get_bind()
+    inspector = Inspector.from_engine(conn)
+
+    if isinstance(_column_type(inspector, 'source_hospital_id'), sa.Integer):
+        return
+
+    op.add_column('emr_global', sa.Column('source_hospital_int_id', sa.Integer(), nullable=True))
+    op.execute("""
+        UPDATE emr_global e
+        SET source_hospital_int_id = h.int_id
+        FROM hospitals h
+        WHERE h.id = e.source_hospital_id
+    """)
+    op.alter_column('emr_global', 'source_hospital_int_id', nullable=False)
+    # Dropping the UUID column also drops its FK and index
+    op.drop_column('emr_global', 'source_hospital_id')
+    op.alter_column('emr_global', 'source_hospital_int_id', new_column_name='source_hospital_id')
+    op.create_foreign_key(FK_NAME, 'emr_global', 'hospitals',
+                          ['source_hospital_id'], ['int_id'], ondelete='RESTRICT')
+    op.create_index(INDEX_NAME, 'emr_global', ['source_hospital_id'])
+
+
+def downgrade():
+    conn = op.get_bind()
+    inspector = Inspector.from_engine(conn)
+
+    if not isinstance(_column_type(inspector, 'source_hospital_id'), sa.Integer):
+        return
+
+    op.add_column('emr_global', sa.Column('source_hospital_uuid', postgresql.UUID(as_uuid=True), nullable=True))
+    op.execute("""
+        UPDATE emr_global e
+        SET source_hospital_uuid = h.id
+        FROM hospitals h
+        WHERE h.int_id = e.source_hospital_id
+    """)
+    op.alter_column('emr_global', 'source_hospital_uuid', nullable=False)
+    op.drop_column('emr_global', 'source_hospital_id')
+    op.alter_column('emr_global', 'source_hospital_uuid', new_column_name='source_hospital_id')
+    op.create_foreign_key(FK_NAME, 'emr_global', 'hospitals',
+                          ['source_hospital_id'], ['id'], ondelete='RESTRICT')
+    op.create_index(INDEX_NAME, 'emr_global', ['source_hospital_id'])
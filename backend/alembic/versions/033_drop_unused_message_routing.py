@@ -0,0 +1,65 @@
+"""Drop the unused hospital_id / patient_id copies on messages
+
+Only recipient_user_id is queried (inbox unread counts); the other two
+denormalized columns from 013 only added write cost.
+
+Revision ID: 033
+Revises: 032
+Create Date: 2026-10-16
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.engine.reflection import Inspector
+
+# revision identifiers, used by Alembic.
+revision = '033'
+down_revision = '032'
+branch_labels = None
+depends_on = None
+
+COLUMNS = {
+    'hospital_id': ('hospitals.id', 'SET NULL'),
+    'patient_id': ('patients.id', 'CASCADE'),
+}
+INDEX_NAME = 'ix_messages_hospital_read'
+
+
+def upgrade():
+    conn = op.get_bind()
+    inspector = Inspector.from_engine(conn)
+
+    indexes = {ix['name'] for ix in inspector.get_indexes('messages')}
+    if INDEX_NAME in indexes:
+        op.drop_index(INDEX_NAME, table_name='messages')
+
+    columns = [col['name'] for col in inspector.get_columns('messages')]
+    for name in COLUMNS:
+        if name in columns:
+            op.drop_column('messages', name)
+
+
+def downgrade():
+    conn = op.get_bind()
+    inspector = Inspector.from_engine(conn)
+
+    columns = [col['name'] for col in inspector.get_columns('messages')]
+    for name, (target, ondelete) in COLUMNS.items():
+        if name not in columns:
+            op.add_column('messages', sa.Column(
+                name, postgresql.UUID(as_uuid=True),
+                sa.ForeignKey(target, ondelete=ondelete), nullable=True,
+            ))
+
+    op.execute("""
+        UPDATE messages m
+        SET hospital_id = su.hospital_id,
+            patient_id = t.patient_id
+        FROM message_threads t
+        JOIN users su ON su.id = t.staff_user_id
+        WHERE t.id = m.thread_id AND m.patient_id IS NULL
+    """)
+
+    indexes = {ix['name'] for ix in inspector.get_indexes('messages')}
+    if INDEX_NAME not in indexes:
+        op.create_index(INDEX_NAME, 'messages', ['hospital_id', 'read_at'])
@@ -5,7 +5,7 @@ from fastapi import APIRouter, Depends, Query
 from sqlalchemy.orm import Session
 
 from app.core.database import get_db
-from app.core.dependencies import require_role
+from app.core.dependencies import require_role, invalidate_cached_user
 from app.services.admin_service import AdminService
 from app.schemas.admin import (
     GlobalMetrics,
@@ -115,7 +115,9 @@ def update_user(
     admin_service: AdminService = Depends(get_admin_service),
 ):
     """Update a user"""
-    return admin_service.update_user(user_id, user_data)
+    result = admin_service.update_user(user_id, user_data)
+    invalidate_cached_user(user_id=user_id)
+    return result
 
 
 @router.delete("/users/{user_id}")
@@ -125,4 +127,6 @@ def delete_user(
     admin_service: AdminService = Depends(get_admin_service),
 ):
     """Soft delete a user"""
-    return admin_service.delete_user(user_id)
+    result = admin_service.delete_user(user_id)
+    invalidate_cached_user(user_id=user_id)
+    return result
@@ -1,12 +1,12 @@
 """Authentication API routes"""
-from fastapi import APIRouter, Depends, Response, status, HTTPException
+from fastapi import APIRouter, Depends, Request, Response, status, HTTPException
 from sqlalchemy.orm import Session
 from pydantic import BaseModel, EmailStr
 from datetime import date
 
 from app.core.database import get_db
 from app.core.config import settings
-from app.core.dependencies import get_current_active_user, get_auth_service
+from app.core.dependencies import get_current_active_user, get_auth_service, invalidate_cached_user
 from app.schemas.auth import (
     LoginRequest,
     TokenResponse,
@@ -259,12 +259,16 @@ def refresh_token(
 
 
 @router.post("/logout", status_code=status.HTTP_200_OK)
-def logout(response: Response):
+def logout(request: Request, response: Response):
     """
     Logout the current user.
 
     Clears authentication cookies.
     """
+    auth = request.headers.get("authorization", "")
+    token = auth[7:].strip() if auth[:7].lower() == "bearer " else request.cookies.get("access_token")
+    if token:
+        invalidate_cached_user(token=token)
     response.delete_cookie(key="access_token")
     response.delete_cookie(key="refresh_token")
 
@@ -1,14 +1,19 @@
 """Case sheets API routes - comprehensive patient medical records (clean)"""
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy import bindparam, func, insert, select, update
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from datetime import datetime
+from sqlalchemy.types import Text
+from datetime import datetime, timezone
 
-from app.core.database import get_db
-from app.core.dependencies import require_role, get_current_active_user
+from app.core.database import get_db, get_db_readonly, get_async_db, get_async_db_readonly
+from app.core.dependencies import require_role, get_current_active_user, user_with_role
 from app.models.user import User
 from app.models.case_sheet import CaseSheet
+from app.models.case_sheet_event import CaseSheetEvent
 from app.models.visit import Visit
 from app.schemas.case_sheet import (
     CaseSheetCreate,
@@ -22,6 +27,118 @@ from app.schemas.case_sheet import (
 
 router = APIRouter()
 
+CROSS_HOSPITAL_ROLES = frozenset({"super_admin", "regional_admin"})
+
+
+async def visible_case_sheet(
+    db: AsyncSession,
+    user: User,
+    case_sheet_id: UUID,
+    *columns,
+    forbidden_detail: str = "You don't have access to case sheets from other hospitals",
+):
+    """
+    Fetch only the columns needed for a case sheet the user may access.
+
+    The access check reads ``hospital_id`` alongside ``columns`` in a single
+    primary-key lookup, so permission checks never pull the JSONB blobs.
+    Raises 404 if the case sheet does not exist and 403 if it belongs to
+    another hospital.
+    """
+    row = (
+        await db.execute(
+            select(CaseSheet.hospital_id, *columns).where(CaseSheet.id == case_sheet_id)
+        )
+    ).first()
+
+    if row is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Case sheet not found"
+        )
+
+    if (
+        user.hospital_id
+        and user.role.name not in CROSS_HOSPITAL_ROLES
+        and row.hospital_id != user.hospital_id
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail=forbidden_detail
+        )
+
+    return row
+
+
+async def _append_events(
+    db: AsyncSession,
+    case_sheet_id: UUID,
+    entries: List[Dict[str, Any]],
+    current_user: User,
+) -> CaseSheet:
+    """
+    Record entries as CaseSheetEvent rows and append them to the legacy
+    event_timeline in SQL, in one transaction, and return the updated row.
+
+    Mirrors ``CaseSheet.log_event`` so both stores stay in step.
+    """
+    await db.execute(
+        insert(CaseSheetEvent),
+        [
+            {
+                "case_sheet_id": case_sheet_id,
+                "event_type": entry["type"],
+                "timestamp": entry["timestamp"],
+                "data": dict(entry["data"], description=entry["description"]),
+                "by_user_id": entry["recorded_by_user_id"],
+                "by_user_name": entry["recorded_by_user_name"],
+                "by_user_role": entry["recorded_by_role"],
+            }
+            for entry in entries
+        ],
+    )
+    stmt = (
+        update(CaseSheet)
+        .where(CaseSheet.id == case_sheet_id)
+        .values(
+            event_timeline=func.coalesce(
+                CaseSheet.event_timeline, func.jsonb_build_array()
+            ).op("||", return_type=JSONB)(bindparam("entries", entries, type_=JSONB)),
+            last_updated_by=current_user.id,
+            updated_at=func.now(),
+        )
+        .returning(CaseSheet)
+        .execution_options(synchronize_session=False)
+    )
+    case_sheet = (await db.execute(stmt)).scalar_one()
+    await db.commit()
+    return case_sheet
+
+
+def _build_event_entry(event_data: AddEventToTimeline, current_user: User) -> Dict[str, Any]:
+    """
+    Build a timeline entry for an event recorded by the current user.
+
+    UUIDs and datetimes are left as-is; the engine's JSON serializer
+    encodes them when the entry is bound to the JSONB UPDATE.
+    """
+    return {
+        "type": event_data.event_type.value,
+        "description": event_data.description,
+        "timestamp": datetime.now(timezone.utc),
+        "data": event_data.event_data or {},
+        "recorded_by_user_id": current_user.id,
+        "recorded_by_user_name": f"{current_user.first_name} {current_user.last_name}",
+        "recorded_by_role": current_user.role.name,
+        "requires_acknowledgment": event_data.requires_acknowledgment,
+        "acknowledged": False if event_data.requires_acknowledgment else None,
+        "acknowledged_by_user_id": None,
+        "acknowledged_by_user_name": None,
+        "acknowledged_by_role": None,
+        "acknowledged_at": None,
+        "acknowledgment_notes": None
+    }
+
 
 @router.post("", response_model=CaseSheetResponse, status_code=status.HTTP_201_CREATED)
 def create_case_sheet(
@@ -104,7 +221,7 @@ def list_case_sheets(
     page: int = Query(1, ge=1),
     page_size: int = Query(50, ge=1, le=100),
     current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_db_readonly),
 ):
     """List case sheets with filters."""
     # Check if user can view case sheets
@@ -136,7 +253,7 @@ def list_case_sheets(
 def get_case_sheet(
     case_sheet_id: UUID,
     current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_db_readonly),
 ):
     """Get specific case sheet by ID."""
     # Check if user can view case sheets
@@ -251,7 +368,7 @@ def add_progress_note(
 def get_patient_case_sheets(
     patient_id: UUID,
     current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_db_readonly),
 ):
     """Get all case sheets for a specific patient."""
     # Check if user can view case sheets
@@ -273,7 +390,7 @@ def get_patient_case_sheets(
 def get_visit_case_sheet(
     visit_id: UUID,
     current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_db_readonly),
 ):
     """Get case sheet for specific visit."""
     # Check if user can view case sheets
@@ -297,3 +414,210 @@ def get_visit_case_sheet(
         )
 
     return case_sheet
+
+
+@router.post("/{case_sheet_id}/events", response_model=CaseSheetResponse)
+async def add_event_to_timeline(
+    case_sheet_id: UUID,
+    event_data: AddEventToTimeline,
+    current_user: User = Depends(user_with_role("doctor", "nurse", "manager")),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    Add an event to the case sheet timeline.
+    
+    Events can be:
+    - Vitals recorded (by nurse)
+    - Medications administered (by nurse)  
+    - Doctor visits
+    - Procedures
+    - Lab tests/results
+    - Imaging tests/results
+    - Consultations
+    - Transfers
+    - Other clinical events
+    
+    Permission: Doctor, Nurse, Manager
+    """
+    await visible_case_sheet(
+        db, current_user, case_sheet_id,
+        forbidden_detail="You can only add events to case sheets from your hospital",
+    )
+
+    return await _append_events(
+        db, case_sheet_id, [_build_event_entry(event_data, current_user)], current_user
+    )
+
+
+@router.post("/{case_sheet_id}/events/batch", response_model=CaseSheetResponse)
+async def add_events_to_timeline(
+    case_sheet_id: UUID,
+    events: List[AddEventToTimeline],
+    current_user: User = Depends(user_with_role("doctor", "nurse", "manager")),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    Add several events to the case sheet timeline in one request.
+
+    All events are appended in order and written with a single UPDATE and
+    commit, instead of one round-trip per event.
+
+    Permission: Doctor, Nurse, Manager
+    """
+    if not events:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="At least one event is required"
+        )
+
+    await visible_case_sheet(
+        db, current_user, case_sheet_id,
+        forbidden_detail="You can only add events to case sheets from your hospital",
+    )
+
+    return await _append_events(
+        db,
+        case_sheet_id,
+        [_build_event_entry(event_data, current_user) for event_data in events],
+        current_user,
+    )
+
+
+@router.post("/{case_sheet_id}/events/acknowledge", response_model=CaseSheetResponse)
+async def acknowledge_event(
+    case_sheet_id: UUID,
+    ack_data: AcknowledgeEvent,
+    current_user: User = Depends(user_with_role("doctor", "nurse", "manager")),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    Acknowledge an event in the case sheet timeline.
+    
+    Common workflow:
+    1. Doctor orders medication (adds event with requires_acknowledgment=True)
+    2. Nurse administers medication and acknowledges the event
+    3. Event timeline shows who ordered, who administered, and when
+    
+    Permission: Doctor, Nurse, Manager
+    """
+    index = ack_data.event_index
+    row = await visible_case_sheet(
+        db, current_user, case_sheet_id,
+        func.coalesce(func.jsonb_array_length(CaseSheet.event_timeline), 0).label("event_count"),
+        CaseSheet.event_timeline[index].label("event"),
+        forbidden_detail="You can only acknowledge events in case sheets from your hospital",
+    )
+
+    # Validate event index
+    if index < 0 or index >= row.event_count:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid event index. Timeline has {row.event_count} events."
+        )
+
+    event = row.event
+
+    # Check if event requires acknowledgment
+    if not event.get("requires_acknowledgment"):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="This event does not require acknowledgment"
+        )
+
+    # Check if already acknowledged
+    if event.get("acknowledged"):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="This event has already been acknowledged"
+        )
+
+    # Patch only the acknowledged entry in place with jsonb_set
+    acknowledgment = {
+        "acknowledged": True,
+        "acknowledged_by_user_id": current_user.id,
+        "acknowledged_by_user_name": f"{current_user.first_name} {current_user.last_name}",
+        "acknowledged_by_role": current_user.role.name,
+        "acknowledged_at": datetime.now(timezone.utc),
+        "acknowledgment_notes": ack_data.acknowledgment_notes,
+    }
+    # The "already acknowledged" guard is repeated in the UPDATE: a
+    # concurrent acknowledgment committed since the read above leaves no
+    # row to update instead of overwriting acknowledged_by_*
+    stmt = (
+        update(CaseSheet)
+        .where(
+            CaseSheet.id == case_sheet_id,
+            CaseSheet.event_timeline[index]["acknowledged"].astext.is_distinct_from("true"),
+        )
+        .values(
+            event_timeline=func.jsonb_set(
+                CaseSheet.event_timeline,
+                bindparam("path", [str(index)], type_=ARRAY(Text)),
+                CaseSheet.event_timeline[index].op("||", return_type=JSONB)(
+                    bindparam("acknowledgment", acknowledgment, type_=JSONB)
+                ),
+                type_=JSONB,
+            ),
+            last_updated_by=current_user.id,
+            updated_at=func.now(),
+        )
+        .returning(CaseSheet)
+        .execution_options(synchronize_session=False)
+    )
+    case_sheet = (await db.execute(stmt)).scalar_one_or_none()
+    if case_sheet is None:
+        await db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="This event has already been acknowledged"
+        )
+    await db.commit()
+
+    return case_sheet
+
+
+@router.get("/{case_sheet_id}/events/pending", response_model=Dict[str, Any])
+async def get_pending_acknowledgments(
+    case_sheet_id: UUID,
+    current_user: User = Depends(user_with_role()),
+    db: AsyncSession = Depends(get_async_db_readonly),
+):
+    """
+    Get all events requiring acknowledgment in a case sheet.
+    
+    Useful for nurses to see:
+    - Medications to be administered
+    - Vitals to be recorded
+    - Doctor orders to be executed
+    
+    Permission: All authenticated users with view access
+    """
+    # Check if user can view case sheets
+    if not CaseSheet.can_view(None, current_user.role.name):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="You don't have permission to view case sheets"
+        )
+
+    case_sheet = await visible_case_sheet(
+        db, current_user, case_sheet_id,
+        CaseSheet.id, CaseSheet.patient_id, CaseSheet.case_number, CaseSheet.event_timeline,
+    )
+
+    # Get pending events
+    pending_events = []
+    if case_sheet.event_timeline:
+        for index, event in enumerate(case_sheet.event_timeline):
+            if event.get("requires_acknowledgment") and not event.get("acknowledged"):
+                pending_events.append({
+                    "index": index,
+                    "event": event
+                })
+
+    return {
+        "case_sheet_id": str(case_sheet.id),
+        "patient_id": str(case_sheet.patient_id),
+        "case_number": case_sheet.case_number,
+        "pending_count": len(pending_events),
+        "pending_events": pending_events
+    }
@@ -2,8 +2,8 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from pydantic import BaseModel, Field
 from typing import List, Optional
-from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy.orm import Session, selectinload
+from sqlalchemy import func, update
 from datetime import datetime
 from uuid import UUID
 
@@ -31,6 +31,7 @@ class ThreadOut(BaseModel):
     staff_user_id: UUID
     subject: Optional[str] = None
     is_closed: bool
+    unread_count: int = 0
 
     class Config:
         from_attributes = True
@@ -98,7 +99,26 @@ async def list_threads(
         threads = db.query(MessageThread).filter(MessageThread.patient_id == patient.id).order_by(MessageThread.updated_at.desc()).all()
     else:
         threads = db.query(MessageThread).filter(MessageThread.staff_user_id == current_user.id).order_by(MessageThread.updated_at.desc()).all()
-    return threads
+
+    # Unread messages addressed to this user, per thread, from the
+    # (recipient_user_id, read_at) index
+    unread = dict(
+        db.query(Message.thread_id, func.count())
+        .filter(Message.recipient_user_id == current_user.id, Message.read_at.is_(None))
+        .group_by(Message.thread_id)
+        .all()
+    )
+    return [
+        ThreadOut(
+            id=t.id,
+            patient_id=t.patient_id,
+            staff_user_id=t.staff_user_id,
+            subject=t.subject,
+            is_closed=t.is_closed,
+            unread_count=unread.get(t.id, 0),
+        )
+        for t in threads
+    ]
 
 
 @router.get("/threads/{thread_id}/messages", response_model=List[MessageOut])
@@ -114,7 +134,27 @@ async def list_messages(
     patient_user_id = db.query(Patient.user_id).filter(Patient.id == thread.patient_id).scalar()
     if current_user.id not in [thread.staff_user_id, patient_user_id]:
         raise HTTPException(status_code=403, detail="Not authorized")
-    msgs = db.query(Message).filter(Message.thread_id == thread_id).order_by(Message.created_at.asc()).all()
+    msgs = (
+        db.query(Message)
+        .options(selectinload(Message.body))
+        .filter(Message.thread_id == thread_id)
+        .order_by(Message.created_at.asc())
+        .all()
+    )
+
+    # Reading the thread marks the messages addressed to this user as read
+    if any(m.recipient_user_id == current_user.id and m.read_at is None for m in msgs):
+        db.execute(
+            update(Message)
+            .where(
+                Message.thread_id == thread_id,
+                Message.recipient_user_id == current_user.id,
+                Message.read_at.is_(None),
+            )
+            .values(read_at=func.now())
+            .execution_options(synchronize_session=False)
+        )
+        db.commit()
     return msgs
 
 
@@ -133,7 +173,14 @@ async def send_message(
     if current_user.id not in [thread.staff_user_id, patient_user_id]:
         raise HTTPException(status_code=403, detail="Not authorized")
 
-    msg = Message(thread_id=thread.id, sender_user_id=current_user.id, content=payload.content)
+    other_user_id = thread.staff_user_id if current_user.id == patient_user_id else patient_user_id
+
+    msg = Message(
+        thread_id=thread.id,
+        sender_user_id=current_user.id,
+        content=payload.content,
+        recipient_user_id=other_user_id,
+    )
     db.add(msg)
     # bump thread updated_at
     thread.updated_at = func.now()
@@ -141,7 +188,6 @@ async def send_message(
     db.refresh(msg)
 
     # Broadcast SSE to the other participant on their personal channel
-    other_user_id = thread.staff_user_id if current_user.id == patient_user_id else patient_user_id
     if other_user_id:
         await sse_manager.broadcast(f"user:{other_user_id}", {
             "type": "secure_message",
@@ -2,12 +2,14 @@
 Notification API endpoints for in-app notifications
 """
 from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from uuid import UUID
 from datetime import datetime
 
-from app.core.database import get_db
+from app.core.database import get_async_db_readonly, get_db
 from app.core.dependencies import get_current_user
 from app.models.user import User
 from app.models.notification import Notification
@@ -23,7 +25,7 @@ router = APIRouter(prefix="/notifications", tags=["notifications"])
 @router.get("/", response_model=NotificationListResponse)
 async def get_my_notifications(
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db_readonly),
     unread_only: bool = Query(False, description="Filter to unread notifications only"),
     limit: int = Query(50, ge=1, le=100),
     offset: int = Query(0, ge=0),
@@ -31,32 +33,34 @@ async def get_my_notifications(
     """
     Get current user's in-app notifications
     Returns notifications ordered by created_at descending (newest first)
+
+    Runs on the asyncpg engine: the page is UUID-heavy and asyncpg moves
+    UUIDs in binary, and awaiting it doesn't block the event loop.
     """
-    query = db.query(Notification).filter(
+    mine = (
         Notification.recipient_user_id == current_user.id,
-        Notification.channel == "in_app"
+        Notification.channel == "in_app",
     )
+    unread = Notification.status == "pending"
 
+    # Both counts in one pass over the user's notifications
+    total, unread_count = (await db.execute(
+        select(func.count(), func.count().filter(unread)).where(*mine)
+    )).one()
     if unread_only:
-        query = query.filter(Notification.status == "pending")
+        total = unread_count
 
-    total = query.count()
-
-    notifications = (
-        query.order_by(Notification.created_at.desc())
-        .offset(offset)
-        .limit(limit)
-        .all()
-    )
+    query = select(Notification).where(*mine)
+    if unread_only:
+        query = query.where(unread)
+    notifications = (await db.scalars(
+        query.order_by(Notification.created_at.desc()).offset(offset).limit(limit)
+    )).all()
 
     return {
         "notifications": notifications,
         "total": total,
-        "unread_count": db.query(Notification).filter(
-            Notification.recipient_user_id == current_user.id,
-            Notification.channel == "in_app",
-            Notification.status == "pending"
-        ).count()
+        "unread_count": unread_count,
     }
 
 
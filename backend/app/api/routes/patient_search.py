@@ -4,15 +4,17 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.orm import Session
 
-from app.core.database import get_db
+from app.core.database import get_db, get_db_readonly
 from app.core.dependencies import require_role, get_current_active_user
 from app.services.patient_search import PatientSearchService
+from app.services.emr_sync_service import EMRSyncService
 from app.models.user import User
 from app.models.patient import Patient
 from app.models.patient_hospital import PatientHospital
 from app.schemas.patient_search import (
     GlobalPatientSearchRequest,
     GlobalPatientSearchResponse,
+    GlobalEMRResponse,
     PatientHospitalCreate
 )
 
@@ -287,3 +289,28 @@ def get_patient_hospital_links(
         }
         for ph in patient_hospitals
     ]
+
+
+@router.get("/{patient_id}/global-emr", response_model=GlobalEMRResponse)
+def get_patient_global_emr(
+    patient_id: UUID,
+    current_user: User = Depends(
+        require_role("doctor", "nurse", "manager", "regional_admin", "super_admin")
+    ),
+    db: Session = Depends(get_db_readonly),
+):
+    """
+    Get a patient's global EMR (records synced from every hospital).
+
+    Served from the mv_global_emr rollup, so records synced since its last
+    scheduled refresh may not be included yet.
+
+    Accessible by: Clinical staff and admins
+    """
+    global_emr = EMRSyncService(db).get_global_emr(patient_id)
+    if not global_emr:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="No global EMR records for this patient"
+        )
+    return global_emr
@@ -135,14 +135,15 @@ def get_inventory(
 @router.get("/inventory/low-stock", response_model=List[InventoryItemResponse])
 def get_low_stock_items(
     hospital_id: Optional[UUID] = None,
-    threshold: int = 10,
+    threshold: Optional[int] = None,
     current_user: User = Depends(require_role("pharmacist", "manager")),
     db: Session = Depends(get_db),
 ):
     """
     Get medications with low stock levels.
 
-    Returns items below the specified quantity threshold.
+    Returns items below the specified quantity threshold, or below each
+    item's own alert threshold when none is given.
     Permission: Pharmacist, Manager
     """
     query_hospital_id = hospital_id or current_user.hospital_id
@@ -159,7 +160,7 @@ def get_low_stock_items(
             Inventory.hospital_id == query_hospital_id,
             Inventory.item_type == "medication",
             Inventory.is_active == True,
-            Inventory.quantity < threshold,
+            Inventory.low_stock if threshold is None else Inventory.quantity < threshold,
         )
         .order_by(Inventory.quantity.asc())
         .all()
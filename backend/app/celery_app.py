@@ -1,7 +1,7 @@
 """Celery application configuration"""
 from celery import Celery
 from celery.schedules import crontab
-from app.core.config import settings
+from app.core.config import settings, REDIS_URL
 
 # Optional Sentry initialization for Celery workers
 try:
@@ -24,8 +24,8 @@ except Exception as e:
 # Create Celery instance
 celery_app = Celery(
     "hass",
-    broker=settings.REDIS_URL,
-    backend=settings.REDIS_URL,
+    broker=REDIS_URL,
+    backend=REDIS_URL,
     include=[
         "app.tasks.discharge",
         "app.tasks.notifications",
@@ -46,13 +46,37 @@ celery_app.conf.update(
     task_track_started=True,
     task_time_limit=30 * 60,  # 30 minutes
     task_soft_time_limit=25 * 60,  # 25 minutes
-    worker_prefetch_multiplier=4,
+    worker_prefetch_multiplier=4,  # Overridden per queue by worker --prefetch-multiplier
     worker_max_tasks_per_child=1000,
     task_acks_late=True,
     task_reject_on_worker_lost=True,
+    # Most tasks are fire-and-forget; skip the result-backend write unless a
+    # task opts in with ignore_result=False
+    task_ignore_result=True,
     result_expires=3600,  # 1 hour
+    broker_transport_options={
+        "visibility_timeout": 3600,  # > task_time_limit, so acks_late tasks aren't redelivered
+        "global_keyprefix": "celery:",
+    },
 )
 
+# Queue routing: quick tasks go to "short", slow ones to "long", so a long
+# task holding prefetched slots can't delay notifications. Workers are run
+# per queue with their own concurrency/prefetch (see docker-compose.yml).
+celery_app.conf.task_default_queue = "short"
+celery_app.conf.task_routes = {
+    "app.tasks.vitals_monitoring.*": {"queue": "long"},
+    "app.tasks.discharge.*": {"queue": "long"},
+    "app.tasks.lab.*": {"queue": "long"},
+    "inventory_check_low_stock": {"queue": "long"},
+    "inventory_check_expiring": {"queue": "long"},
+    "cleanup_old_notifications": {"queue": "long"},
+    "create_notification_partitions": {"queue": "long"},
+    "send_pending_notifications": {"queue": "short"},
+    "send_notification_immediately": {"queue": "short"},
+    "app.tasks.notifications.*": {"queue": "short"},
+}
+
 # Periodic tasks (Celery Beat schedule)
 celery_app.conf.beat_schedule = {
     'monitor-vitals-every-5-minutes': {
@@ -68,10 +92,18 @@ celery_app.conf.beat_schedule = {
         'schedule': crontab(hour=2, minute=0),  # Every day at 2 AM
         'kwargs': {'days_old': 30},
     },
+    'create-notification-partitions-daily': {
+        'task': 'create_notification_partitions',
+        'schedule': crontab(hour=1, minute=30),  # Daily; idempotent, stays a month ahead
+    },
+    'refresh-global-emr-view-every-10-minutes': {
+        'task': 'app.tasks.discharge.refresh_global_emr_view',
+        'schedule': crontab(minute='*/10'),  # Picks up every discharge sync since the last run
+    },
     'inventory-low-stock-hourly': {
         'task': 'inventory_check_low_stock',
         'schedule': crontab(minute='0'),  # Every hour at :00
-        'kwargs': {'threshold': 10},
+        'kwargs': {},  # per-item threshold_alert
     },
     'inventory-expiring-daily': {
         'task': 'inventory_check_expiring',
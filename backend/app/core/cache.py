@@ -1,12 +1,144 @@
 """Redis caching layer for performance optimization"""
+import asyncio
 import redis
-import json
+import redis.asyncio as aioredis
 import hashlib
-from typing import Optional, Any, Callable
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from fnmatch import fnmatchcase
+from typing import Optional, Any, Callable, Dict, Iterable, List
 from functools import wraps
 import pickle
 
-from app.core.config import settings
+from cachetools import TTLCache
+
+from app.core.config import REDIS_URL
+
+logger = logging.getLogger(__name__)
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    import json
+    ORJSON_AVAILABLE = False
+
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
+
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+# One-byte header prepended to every cached payload: the codec in the low
+# bits, plus a flag when the body is zstd-compressed
+_CODEC_JSON = 0x00
+_CODEC_PICKLE = 0x01
+_FLAG_ZSTD = 0x80
+
+# Payloads larger than this are compressed (JSON compresses ~3-5x)
+_COMPRESS_MIN_BYTES = 1024
+
+# Keys per UNLINK call when deleting by pattern
+_UNLINK_BATCH_SIZE = 500
+
+
+def _tag_key(tag: str) -> str:
+    """Redis set holding the cache keys recorded under a tag"""
+    return f"tag:{tag}"
+
+
+def _queue_set(pipe, key: str, payload: bytes, ttl: int, tags: Optional[Iterable[str]]):
+    """Queue SETEX plus tag-set bookkeeping on a (sync or async) pipeline"""
+    pipe.setex(key, ttl, payload)
+    for tag in tags or ():
+        tag_key = _tag_key(tag)
+        pipe.sadd(tag_key, key)
+        # Keep the tag set alive as long as its longest-lived member
+        pipe.expire(tag_key, ttl, nx=True)
+        pipe.expire(tag_key, ttl, gt=True)
+
+
+def _hash_key(key_data: bytes) -> str:
+    """Hash cache key material with xxh3 (falls back to blake2b)"""
+    if XXHASH_AVAILABLE:
+        return xxhash.xxh3_64_hexdigest(key_data)
+    return hashlib.blake2b(key_data, digest_size=8).hexdigest()
+
+
+# zstd contexts are not safe for concurrent use, so keep one per thread
+_zstd_local = threading.local()
+
+
+def _zstd_compress(raw: bytes) -> bytes:
+    compressor = getattr(_zstd_local, "compressor", None)
+    if compressor is None:
+        compressor = _zstd_local.compressor = zstandard.ZstdCompressor(level=3)
+    return compressor.compress(raw)
+
+
+def _zstd_decompress(data: bytes) -> bytes:
+    decompressor = getattr(_zstd_local, "decompressor", None)
+    if decompressor is None:
+        decompressor = _zstd_local.decompressor = zstandard.ZstdDecompressor()
+    return decompressor.decompress(data)
+
+
+# Types JSON hands back unchanged; anything else (UUID, datetime, tuple,
+# non-str dict keys) would come back as a different type on a cache hit
+_JSON_EXACT_SCALARS = (str, int, float, bool, type(None))
+
+
+def _json_exact(value: Any) -> bool:
+    """True if value survives a JSON round-trip with identical types"""
+    if isinstance(value, _JSON_EXACT_SCALARS):
+        return True
+    if type(value) is list:
+        return all(_json_exact(item) for item in value)
+    if type(value) is dict:
+        return all(type(k) is str and _json_exact(v) for k, v in value.items())
+    return False
+
+
+def _dumps(value: Any) -> bytes:
+    """
+    Serialize a value for Redis.
+
+    Values made only of dicts (str keys), lists and JSON scalars are
+    encoded as JSON; anything else (UUIDs, datetimes, ORM objects) is
+    pickled, so a cache hit returns the same types as a miss.
+    Large payloads are zstd-compressed.
+    """
+    if _json_exact(value):
+        codec = _CODEC_JSON
+        if ORJSON_AVAILABLE:
+            raw = orjson.dumps(value)
+        else:
+            raw = json.dumps(value).encode()
+    else:
+        codec = _CODEC_PICKLE
+        raw = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+    if ZSTD_AVAILABLE and len(raw) > _COMPRESS_MIN_BYTES:
+        return bytes((codec | _FLAG_ZSTD,)) + _zstd_compress(raw)
+    return bytes((codec,)) + raw
+
+
+def _loads(data: bytes) -> Any:
+    """Deserialize a payload written by _dumps"""
+    header, payload = data[0], data[1:]
+    if header & _FLAG_ZSTD:
+        payload = _zstd_decompress(payload)
+    if header & ~_FLAG_ZSTD == _CODEC_PICKLE:
+        return pickle.loads(payload)
+    if ORJSON_AVAILABLE:
+        return orjson.loads(payload)
+    return json.loads(payload)
 
 
 class CacheManager:
@@ -15,81 +147,300 @@ class CacheManager:
     def __init__(self):
         """Initialize Redis connection - MAXIMUM PERFORMANCE"""
         self.redis_client = redis.from_url(
-            settings.REDIS_URL,
+            REDIS_URL,
             encoding="utf-8",
-            decode_responses=False,  # Use binary for pickle
+            decode_responses=False,  # Binary payloads (see _dumps)
             max_connections=500,      # 10x increase for high concurrency
             socket_keepalive=True,
             socket_timeout=2,         # Faster timeout
             socket_connect_timeout=2,
             retry_on_timeout=True,
             health_check_interval=30,
+            client_name="hass-api",   # Identifies connections in CLIENT LIST
         )
+        # In-process L1 cache in front of Redis for hot keys. The short TTL
+        # bounds staleness across workers, which cannot see each other's L1.
+        # Entries are the serialized payloads, decoded on every hit, so each
+        # caller gets its own copy and a mutation cannot leak to others.
+        self._l1 = TTLCache(maxsize=10_000, ttl=5)
+        self._l1_lock = threading.Lock()
+        # Background writer so cache fills never add latency to a request
+        self._writer = ThreadPoolExecutor(max_workers=4, thread_name_prefix="cache-writer")
+
+    def _l1_get(self, key: str) -> Optional[Any]:
+        with self._l1_lock:
+            payload = self._l1.get(key)
+        return None if payload is None else _loads(payload)
+
+    def _l1_set(self, key: str, payload: bytes):
+        with self._l1_lock:
+            self._l1[key] = payload
+
+    def _l1_discard(self, pattern: str):
+        """Drop L1 entries whose key matches a glob pattern"""
+        with self._l1_lock:
+            for key in [k for k in self._l1.keys() if fnmatchcase(k, pattern)]:
+                self._l1.pop(key, None)
 
     def _generate_key(self, prefix: str, *args, **kwargs) -> str:
         """Generate cache key from function name and arguments"""
-        key_data = f"{prefix}:{str(args)}:{str(sorted(kwargs.items()))}"
-        key_hash = hashlib.md5(key_data.encode()).hexdigest()
-        return f"cache:{prefix}:{key_hash}"
+        key_data = repr(args).encode() + b":" + repr(sorted(kwargs.items())).encode()
+        return f"cache:{prefix}:{_hash_key(key_data)}"
 
     def get(self, key: str) -> Optional[Any]:
-        """Get value from cache"""
+        """Get value from cache (L1 first, then Redis)"""
+        value = self._l1_get(key)
+        if value is not None:
+            return value
         try:
             cached = self.redis_client.get(key)
             if cached:
-                return pickle.loads(cached)
+                self._l1_set(key, cached)
+                return _loads(cached)
         except Exception as e:
-            print(f"Cache get error: {e}")
+            logger.warning("Cache get error: %s", e)
         return None
 
-    def set(self, key: str, value: Any, ttl: int = 300):
-        """Set value in cache with TTL"""
+    def mget(self, keys: List[str]) -> List[Optional[Any]]:
+        """Get several values in one Redis round-trip; misses are None"""
+        results: List[Optional[Any]] = [self._l1_get(key) for key in keys]
+        missing = [i for i, value in enumerate(results) if value is None]
+        if not missing:
+            return results
+        try:
+            pipe = self.redis_client.pipeline(transaction=False)
+            for i in missing:
+                pipe.get(keys[i])
+            for i, cached in zip(missing, pipe.execute()):
+                if cached:
+                    results[i] = _loads(cached)
+                    self._l1_set(keys[i], cached)
+        except Exception as e:
+            logger.warning("Cache mget error: %s", e)
+        return results
+
+    def set(self, key: str, value: Any, ttl: int = 300, tags: Optional[Iterable[str]] = None):
+        """
+        Set value in cache with TTL.
+
+        Each tag (e.g. "patient:<id>") records the key in a Redis set so
+        invalidate_tags() can drop it without scanning the keyspace.
+        """
+        try:
+            payload = _dumps(value)
+        except Exception as e:
+            logger.warning("Cache set error: %s", e)
+            return
+        self._set_payload(key, payload, ttl, tags)
+
+    def _set_payload(self, key: str, payload: bytes, ttl: int, tags: Optional[Iterable[str]]):
+        """Write an already-serialized payload to Redis and L1"""
+        try:
+            pipe = self.redis_client.pipeline(transaction=False)
+            _queue_set(pipe, key, payload, ttl, tags)
+            pipe.execute()
+            self._l1_set(key, payload)
+        except Exception as e:
+            logger.warning("Cache set error: %s", e)
+
+    def set_background(self, key: str, value: Any, ttl: int = 300, tags: Optional[Iterable[str]] = None):
+        """
+        Serialize now, then queue the Redis write on the background writer.
+
+        Encoding happens before returning because the caller still owns
+        ``value`` and may mutate it once this returns.
+        """
         try:
-            serialized = pickle.dumps(value)
-            self.redis_client.setex(key, ttl, serialized)
+            payload = _dumps(value)
         except Exception as e:
-            print(f"Cache set error: {e}")
+            logger.warning("Cache set error: %s", e)
+            return
+        self._writer.submit(self._set_payload, key, payload, ttl, tags)
+
+    def mset(self, items: Dict[str, Any], ttl: int = 300):
+        """Set several values with the same TTL in one Redis round-trip"""
+        try:
+            payloads = {key: _dumps(value) for key, value in items.items()}
+            pipe = self.redis_client.pipeline(transaction=False)
+            for key, payload in payloads.items():
+                pipe.setex(key, ttl, payload)
+            pipe.execute()
+            for key, payload in payloads.items():
+                self._l1_set(key, payload)
+        except Exception as e:
+            logger.warning("Cache mset error: %s", e)
 
     def delete(self, key: str):
         """Delete key from cache"""
+        with self._l1_lock:
+            self._l1.pop(key, None)
         try:
             self.redis_client.delete(key)
         except Exception as e:
-            print(f"Cache delete error: {e}")
+            logger.warning("Cache delete error: %s", e)
+
+    def invalidate_tags(self, *tags: str):
+        """Delete every key recorded under the given tags, plus the tag sets"""
+        if not tags:
+            return
+        tag_keys = [_tag_key(tag) for tag in tags]
+        try:
+            pipe = self.redis_client.pipeline(transaction=False)
+            for tag_key in tag_keys:
+                pipe.smembers(tag_key)
+            keys = set().union(*pipe.execute())
+            with self._l1_lock:
+                for key in keys:
+                    self._l1.pop(key.decode(), None)
+            self.redis_client.unlink(*keys, *tag_keys)
+        except Exception as e:
+            logger.warning("Cache invalidate tags error: %s", e)
+
+    def _unlink_matching(self, match: str):
+        """
+        Delete keys matching a glob with SCAN + UNLINK.
+
+        SCAN iterates the keyspace incrementally instead of blocking Redis
+        like KEYS, and UNLINK frees memory in a background thread.
+        """
+        batch: List[bytes] = []
+        for key in self.redis_client.scan_iter(match=match, count=1000):
+            batch.append(key)
+            if len(batch) >= _UNLINK_BATCH_SIZE:
+                self.redis_client.unlink(*batch)
+                batch.clear()
+        if batch:
+            self.redis_client.unlink(*batch)
 
     def delete_pattern(self, pattern: str):
         """Delete all keys matching pattern"""
+        self._l1_discard(f"cache:{pattern}:*")
         try:
-            keys = self.redis_client.keys(f"cache:{pattern}:*")
-            if keys:
-                self.redis_client.delete(*keys)
+            self._unlink_matching(f"cache:{pattern}:*")
         except Exception as e:
-            print(f"Cache delete pattern error: {e}")
+            logger.warning("Cache delete pattern error: %s", e)
 
     def clear_all(self):
         """Clear all cache (use with caution)"""
+        with self._l1_lock:
+            self._l1.clear()
         try:
-            keys = self.redis_client.keys("cache:*")
-            if keys:
-                self.redis_client.delete(*keys)
+            self._unlink_matching("cache:*")
         except Exception as e:
-            print(f"Cache clear error: {e}")
+            logger.warning("Cache clear error: %s", e)
 
 
-# Global cache manager instance
+class AsyncCacheManager:
+    """
+    asyncio Redis cache for async endpoints.
+
+    Awaiting Redis keeps the event loop free during the round-trip, where the
+    sync client would block it. Shares the L1 cache and key format with the
+    sync CacheManager (still used by Celery workers and sync code), so
+    invalidations through either manager stay coherent.
+    """
+
+    def __init__(self, sync_cache: CacheManager):
+        self.redis_client = aioredis.Redis(
+            connection_pool=aioredis.ConnectionPool.from_url(
+                REDIS_URL,
+                max_connections=500,
+                socket_keepalive=True,
+                socket_timeout=2,
+                socket_connect_timeout=2,
+                retry_on_timeout=True,
+                health_check_interval=30,
+                client_name="hass-api",
+            ),
+        )
+        self._sync = sync_cache
+        # Strong references to in-flight background writes
+        self._pending: set = set()
+
+    async def aget(self, key: str) -> Optional[Any]:
+        """Get value from cache (L1 first, then Redis)"""
+        value = self._sync._l1_get(key)
+        if value is not None:
+            return value
+        try:
+            cached = await self.redis_client.get(key)
+            if cached:
+                self._sync._l1_set(key, cached)
+                return _loads(cached)
+        except Exception as e:
+            logger.warning("Async cache get error: %s", e)
+        return None
+
+    async def amget(self, keys: List[str]) -> List[Optional[Any]]:
+        """Get several values in one Redis round-trip; misses are None"""
+        results: List[Optional[Any]] = [self._sync._l1_get(key) for key in keys]
+        missing = [i for i, value in enumerate(results) if value is None]
+        if not missing:
+            return results
+        try:
+            pipe = self.redis_client.pipeline(transaction=False)
+            for i in missing:
+                pipe.get(keys[i])
+            for i, cached in zip(missing, await pipe.execute()):
+                if cached:
+                    results[i] = _loads(cached)
+                    self._sync._l1_set(keys[i], cached)
+        except Exception as e:
+            logger.warning("Async cache mget error: %s", e)
+        return results
+
+    async def aset(self, key: str, value: Any, ttl: int = 300, tags: Optional[Iterable[str]] = None):
+        """Set value in cache with TTL and optional invalidation tags"""
+        try:
+            payload = _dumps(value)
+        except Exception as e:
+            logger.warning("Async cache set error: %s", e)
+            return
+        await self._aset_payload(key, payload, ttl, tags)
+
+    async def _aset_payload(self, key: str, payload: bytes, ttl: int, tags: Optional[Iterable[str]]):
+        """Write an already-serialized payload to Redis and L1"""
+        try:
+            pipe = self.redis_client.pipeline(transaction=False)
+            _queue_set(pipe, key, payload, ttl, tags)
+            await pipe.execute()
+            self._sync._l1_set(key, payload)
+        except Exception as e:
+            logger.warning("Async cache set error: %s", e)
+
+    def aset_background(self, key: str, value: Any, ttl: int = 300, tags: Optional[Iterable[str]] = None):
+        """Serialize now, then schedule the Redis write as a task"""
+        try:
+            payload = _dumps(value)
+        except Exception as e:
+            logger.warning("Async cache set error: %s", e)
+            return
+        task = asyncio.create_task(self._aset_payload(key, payload, ttl, tags))
+        self._pending.add(task)
+        task.add_done_callback(self._pending.discard)
+
+
+# Global cache manager instances
 cache = CacheManager()
+async_cache = AsyncCacheManager(cache)
 
 
-def cache_result(ttl: int = 300, prefix: Optional[str] = None):
+def cache_result(
+    ttl: int = 300,
+    prefix: Optional[str] = None,
+    tags: Optional[Callable[..., Iterable[str]]] = None,
+):
     """
     Decorator to cache function results.
 
     Args:
         ttl: Time to live in seconds (default 5 minutes)
         prefix: Custom cache key prefix (defaults to function name)
+        tags: Callable taking the function's arguments and returning
+            invalidation tags for the cached result
 
     Usage:
-        @cache_result(ttl=60)
+        @cache_result(ttl=60, tags=lambda hospital_id: [f"hospital:{hospital_id}"])
         def get_dashboard_metrics(hospital_id: str):
             # expensive operation
             return metrics
@@ -110,8 +461,8 @@ def cache_result(ttl: int = 300, prefix: Optional[str] = None):
             # Execute function
             result = func(*args, **kwargs)
 
-            # Store in cache
-            cache.set(cache_key, result, ttl)
+            # Store in cache without waiting on Redis
+            cache.set_background(cache_key, result, ttl, tags(*args, **kwargs) if tags else None)
 
             return result
 
@@ -119,9 +470,13 @@ def cache_result(ttl: int = 300, prefix: Optional[str] = None):
     return decorator
 
 
-def cache_result_async(ttl: int = 300, prefix: Optional[str] = None):
+def cache_result_async(
+    ttl: int = 300,
+    prefix: Optional[str] = None,
+    tags: Optional[Callable[..., Iterable[str]]] = None,
+):
     """
-    Async version of cache_result decorator.
+    Async version of cache_result decorator, backed by redis.asyncio.
 
     Usage:
         @cache_result_async(ttl=60)
@@ -138,15 +493,15 @@ def cache_result_async(ttl: int = 300, prefix: Optional[str] = None):
             cache_key = cache._generate_key(cache_prefix, *args, **kwargs)
 
             # Try to get from cache
-            cached_value = cache.get(cache_key)
+            cached_value = await async_cache.aget(cache_key)
             if cached_value is not None:
                 return cached_value
 
             # Execute async function
             result = await func(*args, **kwargs)
 
-            # Store in cache
-            cache.set(cache_key, result, ttl)
+            # Store in cache without waiting on Redis
+            async_cache.aset_background(cache_key, result, ttl, tags(*args, **kwargs) if tags else None)
 
             return result
 
@@ -166,41 +521,41 @@ def invalidate_cache(prefix: str):
 
 # Common cache invalidation helpers
 def invalidate_patient_cache(patient_id: str):
-    """Invalidate all cache for a patient"""
-    cache.delete_pattern(f"*patient*{patient_id}*")
+    """Invalidate all cache tagged with a patient"""
+    cache.invalidate_tags(f"patient:{patient_id}")
 
 
 def invalidate_hospital_cache(hospital_id: str):
-    """Invalidate all cache for a hospital"""
-    cache.delete_pattern(f"*hospital*{hospital_id}*")
+    """Invalidate all cache tagged with a hospital"""
+    cache.invalidate_tags(f"hospital:{hospital_id}")
 
 
 def invalidate_user_cache(user_id: str):
-    """Invalidate all cache for a user"""
-    cache.delete_pattern(f"*user*{user_id}*")
+    """Invalidate all cache tagged with a user"""
+    cache.invalidate_tags(f"user:{user_id}")
 
 
 # Pre-configured cache decorators for common use cases
-def cache_dashboard_metrics(ttl: int = 60):
+def cache_dashboard_metrics(ttl: int = 60, tags: Optional[Callable[..., Iterable[str]]] = None):
     """Cache dashboard metrics for 1 minute"""
-    return cache_result(ttl=ttl, prefix="dashboard_metrics")
+    return cache_result(ttl=ttl, prefix="dashboard_metrics", tags=tags)
 
 
-def cache_patient_data(ttl: int = 300):
+def cache_patient_data(ttl: int = 300, tags: Optional[Callable[..., Iterable[str]]] = None):
     """Cache patient data for 5 minutes"""
-    return cache_result(ttl=ttl, prefix="patient_data")
+    return cache_result(ttl=ttl, prefix="patient_data", tags=tags)
 
 
-def cache_kpi_data(ttl: int = 120):
+def cache_kpi_data(ttl: int = 120, tags: Optional[Callable[..., Iterable[str]]] = None):
     """Cache KPI data for 2 minutes"""
-    return cache_result(ttl=ttl, prefix="kpi_data")
+    return cache_result(ttl=ttl, prefix="kpi_data", tags=tags)
 
 
 # Example usage in API endpoints:
 """
 from app.core.cache import cache_dashboard_metrics, invalidate_hospital_cache
 
-@cache_dashboard_metrics(ttl=60)
+@cache_dashboard_metrics(ttl=60, tags=lambda hospital_id, db: [f"hospital:{hospital_id}"])
 def get_hospital_metrics(hospital_id: str, db: Session):
     # Expensive query
     metrics = db.query(...).filter(...).all()
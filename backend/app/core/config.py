@@ -1,6 +1,6 @@
 """Application configuration using Pydantic settings"""
 from typing import Optional
-from pydantic_settings import BaseSettings
+from pydantic_settings import BaseSettings, SettingsConfigDict
 from pydantic import field_validator
 
 
@@ -60,6 +60,10 @@ class Settings(BaseSettings):
     # CORS
     CORS_ORIGINS: list[str] = ["http://localhost:3000", "http://localhost:3001", "http://frontend:3000"]
 
+    # Reverse proxies (IPs or CIDRs) whose X-Forwarded-For is trusted when
+    # resolving the client IP for rate limiting
+    TRUSTED_PROXIES: list[str] = []
+
     # External Services
     OPENAI_API_KEY: Optional[str] = None
     TWILIO_ACCOUNT_SID: Optional[str] = None
@@ -72,11 +76,24 @@ class Settings(BaseSettings):
     # Sentry
     SENTRY_DSN: Optional[str] = None
 
-    class Config:
-        case_sensitive = True
-        env_file = ".env"
-        extra="ignore"
+    # Metrics: series idle longer than the TTL are dropped from /metrics;
+    # reset-on-scrape clears all counters after every scrape instead
+    METRICS_SERIES_TTL_SECONDS: int = 3600
+    METRICS_RESET_ON_SCRAPE: bool = False
+
+    # Settings are read-only after startup
+    model_config = SettingsConfigDict(
+        case_sensitive=True,
+        env_file=".env",
+        extra="ignore",
+        frozen=True,
+    )
 
 
 # Global settings instance
 settings = Settings()
+
+# Hot settings bound once as module constants for hot-path importers
+DATABASE_URL: str = settings.DATABASE_URL
+REDIS_URL: str = settings.REDIS_URL
+DEBUG: bool = settings.DEBUG
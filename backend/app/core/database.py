@@ -1,29 +1,158 @@
 """Database connection and session management"""
-from sqlalchemy import create_engine
+from contextvars import ContextVar
+from datetime import date, datetime, time
+from decimal import Decimal
+from itertools import count
+from sqlalchemy import DDL, create_engine, event, text
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker, Session
-from typing import Generator
+from sqlalchemy.orm import sessionmaker, scoped_session, Session
+from typing import AsyncGenerator, Generator, Optional
+from uuid import UUID, uuid4
+
+from app.core.config import DATABASE_URL, DEBUG
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    import json
+    ORJSON_AVAILABLE = False
+
+
+def _json_default(value):
+    """Encode the non-JSON types JSONB payloads carry; reject anything else"""
+    if isinstance(value, (UUID, Decimal)):
+        return str(value)
+    if isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _json_serializer(value) -> str:
+    """
+    Serialize JSON/JSONB bind values.
+
+    UUIDs, datetimes and Decimals are encoded, so callers can put
+    ``user.id`` or ``datetime.utcnow()`` straight into JSONB payloads
+    instead of formatting them with str()/isoformat() first. Any other
+    non-JSON object raises instead of being stored as its str().
+    """
+    if ORJSON_AVAILABLE:
+        # OPT_NON_STR_KEYS: int/UUID/... dict keys become strings, as with json
+        return orjson.dumps(value, default=_json_default, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(value, default=_json_default)
 
-from app.core.config import settings
 
 # Create SQLAlchemy engine
 engine = create_engine(
-    settings.DATABASE_URL,
+    DATABASE_URL,
     pool_pre_ping=True,
-    echo=settings.DEBUG,
+    echo=DEBUG,
+    json_serializer=_json_serializer,
 )
 
 # Create session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Request-scoped sessions: one Session per HTTP request, shared by every
+# dependency in that request and removed by DBSessionMiddleware on exit.
+# The scope id is a contextvar so it follows the request into the
+# threadpool that runs sync endpoints.
+_request_scope: ContextVar[Optional[int]] = ContextVar("db_request_scope", default=None)
+_request_ids = count()
+
+ScopedSession = scoped_session(
+    sessionmaker(autocommit=False, autoflush=False, bind=engine, expire_on_commit=False),
+    scopefunc=_request_scope.get,
+)
+
+# Async engine (asyncpg) for async endpoints: awaiting the database frees
+# the event loop instead of holding a threadpool worker, and asyncpg's
+# binary protocol is cheaper to decode than psycopg2's text protocol.
+# Production connects through PgBouncer in transaction mode, which can hand
+# each transaction a different server connection, so asyncpg's prepared
+# statement caches are disabled and statement names are made unique.
+async_engine = create_async_engine(
+    make_url(DATABASE_URL).set(drivername="postgresql+asyncpg"),
+    pool_size=20,
+    max_overflow=10,
+    pool_pre_ping=True,
+    echo=DEBUG,
+    json_serializer=_json_serializer,
+    connect_args={
+        "statement_cache_size": 0,
+        "prepared_statement_cache_size": 0,
+        "prepared_statement_name_func": lambda: f"__asyncpg_{uuid4()}__",
+    },
+)
+
+AsyncSessionLocal = async_sessionmaker(
+    async_engine, autoflush=False, expire_on_commit=False
+)
+
 # Base class for models
 Base = declarative_base()
 
+# CITEXT columns (hospital/region/inventory codes) need the extension before
+# any table DDL, including migration 001's create_all on a fresh database
+event.listen(
+    Base.metadata,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS citext").execute_if(dialect="postgresql"),
+)
+
+
+def begin_request_scope():
+    """Start a request-scoped session scope; returns a token for end_request_scope"""
+    return _request_scope.set(next(_request_ids))
+
+
+def end_request_scope(token):
+    """Leave the request scope (call after the scoped session is removed)"""
+    _request_scope.reset(token)
+
 
 def get_db() -> Generator[Session, None, None]:
     """Dependency for getting database session"""
+    if _request_scope.get() is None:
+        # Outside DBSessionMiddleware (e.g. scripts): plain per-call session
+        db = SessionLocal()
+        try:
+            yield db
+        finally:
+            db.close()
+        return
+    yield ScopedSession()
+
+
+def get_db_readonly() -> Generator[Session, None, None]:
+    """
+    Dependency for read-only endpoints.
+
+    Runs in a READ ONLY transaction on a non-autoflushing session, so there
+    is no write-set tracking and nothing to flush or commit. SET TRANSACTION
+    READ ONLY is PostgreSQL syntax, so other dialects get a plain session.
+    """
     db = SessionLocal()
     try:
+        if db.get_bind().dialect.name == "postgresql":
+            db.execute(text("SET TRANSACTION READ ONLY"))
         yield db
     finally:
         db.close()
+
+
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """Dependency for getting an async database session"""
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+async def get_async_db_readonly() -> AsyncGenerator[AsyncSession, None]:
+    """Async dependency for read-only endpoints (READ ONLY transaction)"""
+    async with AsyncSessionLocal() as db:
+        if db.bind.dialect.name == "postgresql":
+            await db.execute(text("SET TRANSACTION READ ONLY"))
+        yield db
@@ -1,41 +1,44 @@
-"""Optimized database configuration for high concurrency (10k+ users)"""
+"""Optimized database configuration for high concurrency behind PgBouncer"""
 from sqlalchemy import create_engine, event, pool
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
 from typing import Generator
 import logging
 
-from app.core.config import settings
+from app.core.config import DATABASE_URL, DEBUG
 
 logger = logging.getLogger(__name__)
 
 
-# MAXIMUM SCALE: 50,000+ concurrent users - ZERO LAG configuration
+# Engine sized for PgBouncer in transaction mode (see docker-compose.production.yml).
+# PgBouncer multiplexes client connections onto a small set of PostgreSQL
+# backends, so each worker keeps only a small local pool; a few hundred
+# connections per worker would exceed PostgreSQL's max_connections.
 engine = create_engine(
-    settings.DATABASE_URL,
+    DATABASE_URL,
 
-    # Connection Pool Settings - ENTERPRISE GRADE
+    # Connection Pool Settings
     poolclass=pool.QueuePool,
-    pool_size=100,                   # Base connections (5x increase)
-    max_overflow=200,                # Additional connections (total 300)
+    pool_size=10,                    # Per-worker connections to PgBouncer
+    max_overflow=20,                 # Burst headroom (total 30)
     pool_timeout=10,                 # Fail fast - 10s for connection
     pool_recycle=1800,              # Recycle every 30 min (prevent stale)
-    pool_pre_ping=True,             # Verify connections before use
+    pool_pre_ping=False,            # PgBouncer health-checks server connections
 
     # Performance Settings
-    echo=settings.DEBUG,            # SQL logging in debug mode
+    echo=DEBUG,            # SQL logging in debug mode
     echo_pool=False,                # Connection pool logging
 
-    # Connection Arguments - ULTRA FAST
+    # Connection Arguments. Startup "options" (statement_timeout, work_mem)
+    # are not supported through PgBouncer transaction pooling; configure them
+    # on the database role/server instead.
     connect_args={
         "application_name": "hass_backend",
-        "options": "-c statement_timeout=5000 -c work_mem=16MB",  # 5s timeout, 16MB work mem
         "connect_timeout": 5,          # Fast connection
         "keepalives": 1,
         "keepalives_idle": 15,         # Faster keepalive
         "keepalives_interval": 5,      # Check every 5s
         "keepalives_count": 3,         # 3 retries
-        "tcp_keepalive": True,
     },
 
     # Execution Options
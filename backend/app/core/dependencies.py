@@ -1,29 +1,50 @@
 """FastAPI dependencies for authentication and authorization"""
+import threading
+from functools import lru_cache
+import time
 from typing import Optional
+from uuid import UUID
+from cachetools import TTLCache
 from fastapi import Depends, HTTPException, status, Header, Request
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, make_transient_to_detached
 
 from app.core.database import get_db
 from app.services.auth_service import AuthService
+from app.models.role import Role
 from app.models.user import User
 from app.core.permissions import has_permission
+from app.core.security import decode_token
 
 # HTTP Bearer token scheme (non-strict to allow cookie fallback)
 security = HTTPBearer(auto_error=False)
 
+# Access token -> (detached User snapshot, token exp). Skips JWT
+# verification and the user/role SELECT for repeat requests. Entries are
+# evicted on logout and when a user is updated or deleted in this process;
+# other workers pick such changes up within the TTL.
+_user_cache: TTLCache = TTLCache(maxsize=1024, ttl=10)
+_user_cache_lock = threading.Lock()
 
-def get_auth_service(db: Session = Depends(get_db)) -> AuthService:
-    """Get authentication service instance"""
-    return AuthService(db)
 
+def invalidate_cached_user(user_id: Optional[UUID] = None, token: Optional[str] = None) -> None:
+    """Drop cached auth entries for a token and/or every token of a user"""
+    with _user_cache_lock:
+        if token is not None:
+            _user_cache.pop(token, None)
+        if user_id is not None:
+            for key, (cached, _) in list(_user_cache.items()):
+                if str(cached.id) == str(user_id):
+                    _user_cache.pop(key, None)
 
-def get_current_user(
-    request: Request,
-    credentials: Optional[HTTPAuthorizationCredentials] = Depends(security),
-    auth_service: AuthService = Depends(get_auth_service),
-) -> User:
-    """Get the current authenticated user from Authorization header or httpOnly cookie"""
+
+def _snapshot(model, instance):
+    """Transient copy of an instance's column values"""
+    return model(**{c.key: getattr(instance, c.key) for c in model.__table__.columns})
+
+
+def _extract_token(request: Request, credentials: Optional[HTTPAuthorizationCredentials]) -> str:
+    """Read the access token from the Authorization header or httpOnly cookie"""
     token: Optional[str] = None
     if credentials and credentials.credentials:
         token = credentials.credentials
@@ -35,7 +56,47 @@ def get_current_user(
             detail="Not authenticated",
             headers={"WWW-Authenticate": "Bearer"},
         )
-    return auth_service.get_current_user(token)
+    return token
+
+
+def _authenticate(token: str, db: Session) -> User:
+    """Resolve a token to a User attached to db, using the short-lived cache"""
+    with _user_cache_lock:
+        entry = _user_cache.get(token)
+    if entry is not None:
+        cached, exp = entry
+        # Same checks AuthService.get_current_user applies on a miss
+        if (exp is None or exp <= time.time()
+                or not cached.is_active or cached.is_deleted):
+            invalidate_cached_user(token=token)
+            entry = None
+    if entry is None:
+        user = AuthService(db).get_current_user(token)
+        payload = decode_token(token) or {}
+        role = _snapshot(Role, user.role)
+        make_transient_to_detached(role)
+        cached = _snapshot(User, user)
+        cached.role = role
+        make_transient_to_detached(cached)
+        with _user_cache_lock:
+            _user_cache[token] = (cached, payload.get("exp"))
+        return user
+    # Per-request copy attached to this session, without a SELECT
+    return db.merge(cached, load=False)
+
+
+def get_auth_service(db: Session = Depends(get_db)) -> AuthService:
+    """Get authentication service instance"""
+    return AuthService(db)
+
+
+def get_current_user(
+    request: Request,
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(security),
+    auth_service: AuthService = Depends(get_auth_service),
+) -> User:
+    """Get the current authenticated user from Authorization header or httpOnly cookie"""
+    return _authenticate(_extract_token(request, credentials), auth_service.db)
 
 
 def get_current_active_user(current_user: User = Depends(get_current_user)) -> User:
@@ -71,3 +132,34 @@ def require_role(*role_names: str):
             )
         return current_user
     return role_checker
+
+
+@lru_cache(maxsize=None)
+def user_with_role(*role_names: str):
+    """
+    Single dependency that authenticates, checks the user is active and
+    (optionally) checks the role, instead of chaining three dependencies.
+
+    Cached, so the same role set always yields the same dependency and can
+    be targeted by ``app.dependency_overrides``.
+    """
+    allowed = frozenset(role_names)
+
+    def checker(
+        request: Request,
+        credentials: Optional[HTTPAuthorizationCredentials] = Depends(security),
+        db: Session = Depends(get_db),
+    ) -> User:
+        user = _authenticate(_extract_token(request, credentials), db)
+        if not user.is_active:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Inactive user"
+            )
+        if allowed and user.role.name not in allowed:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail=f"Required role: {', '.join(role_names)}"
+            )
+        return user
+    return checker
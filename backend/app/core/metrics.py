@@ -1,153 +1,454 @@
 """
 Prometheus metrics for monitoring
 """
+import asyncio
+import os
+import re
+import sys
+import threading
 import time
 import logging
-from typing import Callable
+from bisect import bisect_left
+from functools import lru_cache
+from typing import Callable, Dict, Iterable, Iterator, List
 from fastapi import Request, Response
 from starlette.middleware.base import BaseHTTPMiddleware
-from collections import defaultdict
+
+from app.core.config import settings
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+try:
+    import prometheus_client
+    from prometheus_client import multiprocess
+    PROMETHEUS_CLIENT_AVAILABLE = True
+except ImportError:
+    PROMETHEUS_CLIENT_AVAILABLE = False
+
+# With several uvicorn workers each process only sees its own requests;
+# prometheus_client's multiprocess mode shares values through mmap files
+# in this directory so one scrape covers every worker
+MULTIPROCESS_MODE = PROMETHEUS_CLIENT_AVAILABLE and bool(os.environ.get("PROMETHEUS_MULTIPROC_DIR"))
+
+# Numeric and UUID path segments collapse to {id} so label cardinality stays
+# bounded (version segments like /v1/ are left alone)
+_ID_RE = re.compile(
+    r"/(?:\d+|[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12})(?=/|$)"
+)
+
+
+@lru_cache(maxsize=1024)
+def _normalize_path(path: str) -> str:
+    """Replace ID segments in a request path with {id}"""
+    return _ID_RE.sub("/{id}", path)
+
+
+# Log-linear bucket upper bounds (seconds): four buckets per doubling from
+# 1ms to ~65s, so each bucket spans ~19% relative error. Rounded so the
+# exported `le` labels stay readable.
+DURATION_BUCKETS = tuple(float(f"{0.001 * 2 ** (i / 4):.4g}") for i in range(65))
+
+
+class Histogram:
+    """
+    Fixed-bucket duration histogram for one series.
+
+    Observing is O(log buckets) and memory is constant, unlike keeping every
+    duration in a list. Counts are per bucket; export makes them cumulative.
+    """
+
+    __slots__ = ("counts", "sum", "count", "_prefixes")
+
+    def __init__(self, name: str, labels: str):
+        # One extra slot for observations above the largest bound (+Inf)
+        self.counts: List[int] = [0] * (len(DURATION_BUCKETS) + 1)
+        self.sum = 0.0
+        self.count = 0
+        # Series name and labels never change, so every sample prefix is
+        # formatted once here instead of on each scrape
+        self._prefixes = [
+            *(f'{name}_bucket{{{labels},le="{bound}"}} ' for bound in (*DURATION_BUCKETS, "+Inf")),
+            f"{name}_sum{{{labels}}} ",
+            f"{name}_count{{{labels}}} ",
+        ]
+
+    def observe(self, value: float, _bisect=bisect_left, _bounds=DURATION_BUCKETS):
+        # Bucket search is C (bisect over a tuple); the defaults bind it and
+        # the bounds as locals so the hot path skips global lookups
+        self.counts[_bisect(_bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def copy(self) -> "Histogram":
+        """Point-in-time copy sharing the formatted prefixes"""
+        snapshot = Histogram.__new__(Histogram)
+        snapshot.counts = self.counts[:]
+        snapshot.sum = self.sum
+        snapshot.count = self.count
+        snapshot._prefixes = self._prefixes
+        return snapshot
+
+    def prometheus_lines(self) -> List[str]:
+        """Render `_bucket`, `_sum` and `_count` samples"""
+        lines = []
+        cumulative = 0
+        for prefix, bucket_count in zip(self._prefixes, self.counts):
+            cumulative += bucket_count
+            lines.append(prefix + str(cumulative))
+        lines.append(self._prefixes[-2] + str(self.sum))
+        lines.append(self._prefixes[-1] + str(self.count))
+        return lines
 
-class MetricsCollector:
-    """Collect metrics for Prometheus"""
 
-    def __init__(self):
-        self.request_count = defaultdict(int)
-        self.request_duration = defaultdict(list)
-        self.error_count = defaultdict(int)
-        self.active_requests = 0
-        self.celery_task_count = defaultdict(int)
-        self.celery_task_duration = defaultdict(list)
+class MetricsCollector:
+    """
+    Collect metrics for Prometheus.
+
+    Recording happens on the event loop while /metrics streams from the
+    threadpool, so all mutation and the export snapshot share one lock.
+
+    Series not observed for ``series_ttl`` seconds are dropped by
+    expire_stale(), so the tables (and scrape cost) stay bounded over long
+    uptimes. With ``reset_on_scrape`` every scrape starts the tables over.
+    """
+
+    def __init__(self, series_ttl: float = 3600, reset_on_scrape: bool = False):
+        self.series_ttl = series_ttl
+        self.reset_on_scrape = reset_on_scrape
+        self._lock = threading.Lock()
+        self.request_count: Dict[tuple, int] = {}
+        self.request_duration: Dict[tuple, Histogram] = {}
+        self.error_count: Dict[tuple, int] = {}
+        self.celery_task_count: Dict[tuple, int] = {}
+        self.celery_task_duration: Dict[str, Histogram] = {}
         self.db_query_count = 0
         self.cache_hits = 0
         self.cache_misses = 0
+        self.sse_dropped: Dict[str, int] = {}
+        self._requests_started = 0
+        self._requests_finished = 0
+        # Label text per key, formatted on first observation instead of on
+        # every scrape
+        self._request_labels: Dict[tuple, str] = {}
+        self._route_labels: Dict[tuple, str] = {}
+        self._task_status_labels: Dict[tuple, str] = {}
+        # Monotonic time each counter key was last observed
+        self._request_seen: Dict[tuple, float] = {}
+        self._task_seen: Dict[tuple, float] = {}
+
+    @property
+    def active_requests(self) -> int:
+        return self._requests_started - self._requests_finished
+
+    def request_started(self):
+        with self._lock:
+            self._requests_started += 1
+
+    def request_finished(self):
+        with self._lock:
+            self._requests_finished += 1
 
     def record_request(self, method: str, path: str, status_code: int, duration: float):
         """Record HTTP request metrics"""
-        key = f"{method}_{path}_{status_code}"
-        self.request_count[key] += 1
-        self.request_duration[key].append(duration)
-
-        if status_code >= 400:
-            error_key = f"{method}_{path}"
-            self.error_count[error_key] += 1
+        # Tuple keys: no string building here and no re-parsing at export.
+        # Interned methods compare by identity in the dict lookups.
+        method = sys.intern(method)
+        key = (method, path, status_code)
+        route = (method, path)
+        now = time.monotonic()
+
+        with self._lock:
+            self._request_seen[key] = now
+            if key not in self.request_count:
+                self._request_labels[key] = f'{{method="{method}",path="{path}",status="{status_code}"}} '
+                self.request_count[key] = 0
+            self.request_count[key] += 1
+
+            histogram = self.request_duration.get(route)
+            if histogram is None:
+                labels = self._route_labels[route] = f'method="{method}",path="{path}"'
+                histogram = self.request_duration[route] = Histogram(
+                    "http_request_duration_seconds", labels
+                )
+            histogram.observe(duration)
+
+            if status_code >= 400:
+                self.error_count[route] = self.error_count.get(route, 0) + 1
 
     def record_celery_task(self, task_name: str, duration: float, status: str):
         """Record Celery task metrics"""
-        key = f"{task_name}_{status}"
-        self.celery_task_count[key] += 1
-        self.celery_task_duration[key].append(duration)
-
-    def get_prometheus_metrics(self) -> str:
+        key = (task_name, status)
+        now = time.monotonic()
+
+        with self._lock:
+            self._task_seen[key] = now
+            if key not in self.celery_task_count:
+                self._task_status_labels[key] = f'{{task="{task_name}",status="{status}"}} '
+                self.celery_task_count[key] = 0
+            self.celery_task_count[key] += 1
+
+            histogram = self.celery_task_duration.get(task_name)
+            if histogram is None:
+                histogram = self.celery_task_duration[task_name] = Histogram(
+                    "celery_task_duration_seconds", f'task="{task_name}"'
+                )
+            histogram.observe(duration)
+
+    def expire_stale(self) -> int:
         """
-        Generate Prometheus metrics in text format
+        Drop series with no observations within ``series_ttl`` seconds
 
         Returns:
-            Prometheus-formatted metrics string
+            Number of counter series removed
         """
-        lines = []
+        cutoff = time.monotonic() - self.series_ttl
+
+        with self._lock:
+            stale_requests = [key for key, seen in self._request_seen.items() if seen < cutoff]
+            for key in stale_requests:
+                del self.request_count[key]
+                del self._request_labels[key]
+                del self._request_seen[key]
+
+            live_routes = {key[:2] for key in self.request_count}
+            for route in [route for route in self.request_duration if route not in live_routes]:
+                del self.request_duration[route]
+                del self._route_labels[route]
+                self.error_count.pop(route, None)
+
+            stale_tasks = [key for key, seen in self._task_seen.items() if seen < cutoff]
+            for key in stale_tasks:
+                del self.celery_task_count[key]
+                del self._task_status_labels[key]
+                del self._task_seen[key]
+
+            live_tasks = {key[0] for key in self.celery_task_count}
+            for task_name in [name for name in self.celery_task_duration if name not in live_tasks]:
+                del self.celery_task_duration[task_name]
+
+        return len(stale_requests) + len(stale_tasks)
+
+    def _clear(self):
+        """Empty every per-series table (caller holds the lock)"""
+        for table in (
+            self.request_count, self.request_duration, self.error_count,
+            self.celery_task_count, self.celery_task_duration,
+            self._request_labels, self._route_labels, self._task_status_labels,
+            self._request_seen, self._task_seen,
+        ):
+            table.clear()
+
+    def record_sse_drop(self, channel: str):
+        """Record an SSE frame dropped for a slow client"""
+        # Label by channel kind ("alerts", "doctor", ...): per-user channel
+        # ids would make the label set unbounded
+        kind = channel.split(":", 1)[0]
+        with self._lock:
+            self.sse_dropped[kind] = self.sse_dropped.get(kind, 0) + 1
+
+    def iter_prometheus_metrics(self) -> Iterator[str]:
+        """
+        Generate Prometheus metrics in text format, one metric family per chunk
+
+        Counters are copied under the lock up front; formatting runs after
+        the lock is released.
+
+        Yields:
+            Newline-terminated Prometheus text for a single metric family
+        """
+        with self._lock:
+            requests = [(self._request_labels[key], count) for key, count in self.request_count.items()]
+            durations = [histogram.copy() for histogram in self.request_duration.values()]
+            errors = [(self._route_labels[route], count) for route, count in self.error_count.items()]
+            tasks = [(self._task_status_labels[key], count) for key, count in self.celery_task_count.items()]
+            task_durations = [histogram.copy() for histogram in self.celery_task_duration.values()]
+            sse_dropped = list(self.sse_dropped.items())
+            active_requests = self.active_requests
+            if self.reset_on_scrape:
+                self._clear()
 
         # API Request metrics
-        lines.append("# HELP http_requests_total Total number of HTTP requests")
-        lines.append("# TYPE http_requests_total counter")
-        for key, count in self.request_count.items():
-            method, path, status = key.rsplit('_', 2)
-            lines.append(f'http_requests_total{{method="{method}",path="{path}",status="{status}"}} {count}')
+        yield _family(
+            "http_requests_total", "counter", "Total number of HTTP requests",
+            (f"http_requests_total{labels}{count}" for labels, count in requests),
+        )
 
         # Request duration metrics
-        lines.append("\n# HELP http_request_duration_seconds HTTP request duration in seconds")
-        lines.append("# TYPE http_request_duration_seconds histogram")
-        for key, durations in self.request_duration.items():
-            if durations:
-                method, path, status = key.rsplit('_', 2)
-                avg_duration = sum(durations) / len(durations)
-                max_duration = max(durations)
-                min_duration = min(durations)
-                lines.append(f'http_request_duration_seconds_sum{{method="{method}",path="{path}"}} {sum(durations)}')
-                lines.append(f'http_request_duration_seconds_count{{method="{method}",path="{path}"}} {len(durations)}')
-                lines.append(f'http_request_duration_seconds_avg{{method="{method}",path="{path}"}} {avg_duration}')
+        yield _family(
+            "http_request_duration_seconds", "histogram", "HTTP request duration in seconds",
+            (line for histogram in durations for line in histogram.prometheus_lines()),
+        )
 
         # Error rate metrics
-        lines.append("\n# HELP http_errors_total Total number of HTTP errors")
-        lines.append("# TYPE http_errors_total counter")
-        for key, count in self.error_count.items():
-            method, path = key.split('_', 1)
-            lines.append(f'http_errors_total{{method="{method}",path="{path}"}} {count}')
+        yield _family(
+            "http_errors_total", "counter", "Total number of HTTP errors",
+            (f"http_errors_total{{{labels}}} {count}" for labels, count in errors),
+        )
 
         # Active requests
-        lines.append("\n# HELP http_requests_active Currently active HTTP requests")
-        lines.append("# TYPE http_requests_active gauge")
-        lines.append(f"http_requests_active {self.active_requests}")
+        yield _family(
+            "http_requests_active", "gauge", "Currently active HTTP requests",
+            (f"http_requests_active {active_requests}",),
+        )
 
         # Celery task metrics
-        lines.append("\n# HELP celery_tasks_total Total number of Celery tasks")
-        lines.append("# TYPE celery_tasks_total counter")
-        for key, count in self.celery_task_count.items():
-            task_name, status = key.rsplit('_', 1)
-            lines.append(f'celery_tasks_total{{task="{task_name}",status="{status}"}} {count}')
+        yield _family(
+            "celery_tasks_total", "counter", "Total number of Celery tasks",
+            (f"celery_tasks_total{labels}{count}" for labels, count in tasks),
+        )
 
         # Celery task duration
-        lines.append("\n# HELP celery_task_duration_seconds Celery task duration in seconds")
-        lines.append("# TYPE celery_task_duration_seconds histogram")
-        for key, durations in self.celery_task_duration.items():
-            if durations:
-                task_name, status = key.rsplit('_', 1)
-                lines.append(f'celery_task_duration_seconds_sum{{task="{task_name}"}} {sum(durations)}')
-                lines.append(f'celery_task_duration_seconds_count{{task="{task_name}"}} {len(durations)}')
+        yield _family(
+            "celery_task_duration_seconds", "histogram", "Celery task duration in seconds",
+            (line for histogram in task_durations for line in histogram.prometheus_lines()),
+        )
+
+        # SSE back-pressure
+        yield _family(
+            "sse_messages_dropped_total", "counter", "SSE frames dropped for slow clients",
+            (f'sse_messages_dropped_total{{channel="{kind}"}} {count}' for kind, count in sse_dropped),
+        )
 
         # Database query count
-        lines.append("\n# HELP database_queries_total Total number of database queries")
-        lines.append("# TYPE database_queries_total counter")
-        lines.append(f"database_queries_total {self.db_query_count}")
+        yield _family(
+            "database_queries_total", "counter", "Total number of database queries",
+            (f"database_queries_total {self.db_query_count}",),
+        )
 
         # Cache metrics
-        lines.append("\n# HELP cache_hits_total Total number of cache hits")
-        lines.append("# TYPE cache_hits_total counter")
-        lines.append(f"cache_hits_total {self.cache_hits}")
-
-        lines.append("\n# HELP cache_misses_total Total number of cache misses")
-        lines.append("# TYPE cache_misses_total counter")
-        lines.append(f"cache_misses_total {self.cache_misses}")
+        yield _family(
+            "cache_hits_total", "counter", "Total number of cache hits",
+            (f"cache_hits_total {self.cache_hits}",),
+        )
+        yield _family(
+            "cache_misses_total", "counter", "Total number of cache misses",
+            (f"cache_misses_total {self.cache_misses}",),
+        )
 
         # System info
-        lines.append("\n# HELP system_info System information")
-        lines.append("# TYPE system_info gauge")
-        lines.append(f'system_info{{version="1.0.0",environment="production"}} 1')
+        yield _family(
+            "system_info", "gauge", "System information",
+            ('system_info{version="1.0.0",environment="production"} 1',),
+        )
+
+    def get_prometheus_metrics(self) -> str:
+        """
+        Generate Prometheus metrics in text format
 
-        return "\n".join(lines)
+        Returns:
+            Prometheus-formatted metrics string
+        """
+        return "".join(self.iter_prometheus_metrics())
+
+
+def _family(name: str, metric_type: str, help_text: str, samples: Iterable[str]) -> str:
+    """Join one metric family (HELP, TYPE and samples) into a single chunk"""
+    return "\n".join((f"# HELP {name} {help_text}", f"# TYPE {name} {metric_type}", *samples)) + "\n"
+
+
+class MultiProcessMetricsCollector:
+    """
+    MetricsCollector interface backed by prometheus_client multiprocess mode.
+
+    Used when PROMETHEUS_MULTIPROC_DIR is set: values live in per-process
+    mmap files and the scrape aggregates all workers. Series expiry and
+    reset-on-scrape do not apply here.
+    """
+
+    def __init__(self):
+        # Powers of two from 1ms to ~65s: the same range as DURATION_BUCKETS,
+        # coarser because prometheus_client scans buckets linearly
+        buckets = DURATION_BUCKETS[::4]
+        self._requests = prometheus_client.Counter(
+            "http_requests", "Total number of HTTP requests", ["method", "path", "status"]
+        )
+        self._request_duration = prometheus_client.Histogram(
+            "http_request_duration_seconds", "HTTP request duration in seconds",
+            ["method", "path"], buckets=buckets,
+        )
+        self._errors = prometheus_client.Counter(
+            "http_errors", "Total number of HTTP errors", ["method", "path"]
+        )
+        self._active = prometheus_client.Gauge(
+            "http_requests_active", "Currently active HTTP requests", multiprocess_mode="livesum"
+        )
+        self._tasks = prometheus_client.Counter(
+            "celery_tasks", "Total number of Celery tasks", ["task", "status"]
+        )
+        self._task_duration = prometheus_client.Histogram(
+            "celery_task_duration_seconds", "Celery task duration in seconds",
+            ["task"], buckets=buckets,
+        )
+        self._sse_dropped = prometheus_client.Counter(
+            "sse_messages_dropped", "SSE frames dropped for slow clients", ["channel"]
+        )
+
+    def request_started(self):
+        self._active.inc()
+
+    def request_finished(self):
+        self._active.dec()
+
+    def record_request(self, method: str, path: str, status_code: int, duration: float):
+        """Record HTTP request metrics"""
+        self._requests.labels(method, path, status_code).inc()
+        self._request_duration.labels(method, path).observe(duration)
+        if status_code >= 400:
+            self._errors.labels(method, path).inc()
+
+    def record_celery_task(self, task_name: str, duration: float, status: str):
+        """Record Celery task metrics"""
+        self._tasks.labels(task_name, status).inc()
+        self._task_duration.labels(task_name).observe(duration)
+
+    def record_sse_drop(self, channel: str):
+        """Record an SSE frame dropped for a slow client"""
+        self._sse_dropped.labels(channel.split(":", 1)[0]).inc()
+
+    def expire_stale(self) -> int:
+        return 0
+
+    def iter_prometheus_metrics(self) -> Iterator[str]:
+        """Aggregate every worker's mmap files into one exposition"""
+        registry = prometheus_client.CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        yield prometheus_client.generate_latest(registry).decode()
+
+    def get_prometheus_metrics(self) -> str:
+        return "".join(self.iter_prometheus_metrics())
 
 
 # Global metrics collector
-metrics_collector = MetricsCollector()
+if MULTIPROCESS_MODE:
+    metrics_collector = MultiProcessMetricsCollector()
+else:
+    metrics_collector = MetricsCollector(
+        series_ttl=settings.METRICS_SERIES_TTL_SECONDS,
+        reset_on_scrape=settings.METRICS_RESET_ON_SCRAPE,
+    )
+
+
+async def expire_stale_metrics(interval: float = 60):
+    """Background loop that drops idle metric series (started in lifespan)"""
+    while True:
+        await asyncio.sleep(interval)
+        removed = metrics_collector.expire_stale()
+        if removed:
+            logger.debug("Expired %d idle metric series", removed)
 
 
 class MetricsMiddleware(BaseHTTPMiddleware):
     """Middleware to collect request metrics"""
 
     async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        # Skip metrics endpoint itself
-        if request.url.path == "/metrics":
-            return await call_next(request)
-
-        metrics_collector.active_requests += 1
-        start_time = time.time()
+        metrics_collector.request_started()
+        start_time = time.perf_counter()
+        path = _normalize_path(request.url.path)
 
         try:
             response = await call_next(request)
-            duration = time.time() - start_time
-
-            # Record metrics
-            path = request.url.path
-            # Simplify path (remove IDs)
-            if any(char.isdigit() for char in path):
-                path = "/".join([
-                    segment if not any(char.isdigit() for char in segment) else "{id}"
-                    for segment in path.split("/")
-                ])
+            duration = time.perf_counter() - start_time
 
             metrics_collector.record_request(
                 request.method,
@@ -159,16 +460,16 @@ class MetricsMiddleware(BaseHTTPMiddleware):
             return response
 
         except Exception as e:
-            duration = time.time() - start_time
+            duration = time.perf_counter() - start_time
             logger.error(f"Request failed: {str(e)}")
 
             metrics_collector.record_request(
                 request.method,
-                request.url.path,
+                path,
                 500,
                 duration
             )
             raise
 
         finally:
-            metrics_collector.active_requests -= 1
+            metrics_collector.request_finished()
@@ -1,4 +1,5 @@
 """RBAC permission definitions and checking"""
+import sys
 from typing import Dict, List
 from app.models.role import Role
 from app.models.user import User
@@ -56,22 +57,27 @@ class Permission:
     REQUEST_APPOINTMENTS = "can_request_appointments"
 
 
+# Identifier-like literals are interned by the compiler already; this keeps
+# the guarantee explicit for any constant added later
+for _name, _value in list(vars(Permission).items()):
+    if not _name.startswith("_") and isinstance(_value, str):
+        setattr(Permission, _name, sys.intern(_value))
+del _name, _value
+
+
 def has_permission(user: User, permission: str) -> bool:
     """Check if a user has a specific permission"""
-    if not user.role or not user.role.permissions:
-        return False
-
-    return user.role.permissions.get(permission, False)
+    return permission in user.permission_set
 
 
 def has_any_permission(user: User, permissions: List[str]) -> bool:
     """Check if a user has any of the specified permissions"""
-    return any(has_permission(user, perm) for perm in permissions)
+    return not user.permission_set.isdisjoint(permissions)
 
 
 def has_all_permissions(user: User, permissions: List[str]) -> bool:
     """Check if a user has all of the specified permissions"""
-    return all(has_permission(user, perm) for perm in permissions)
+    return user.permission_set.issuperset(permissions)
 
 
 def require_permission(permission: str):
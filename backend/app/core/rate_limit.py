@@ -1,27 +1,96 @@
 """
 Rate limiting middleware
 """
+import ipaddress
 import time
 import logging
-from typing import Callable
+from functools import lru_cache
+from typing import Callable, Hashable
 from fastapi import Request, HTTPException, status
 from starlette.middleware.base import BaseHTTPMiddleware
-from collections import defaultdict
+from collections import defaultdict, deque
 from datetime import datetime, timedelta
+from redis.exceptions import RedisError
+
+from app.core.cache import async_cache
+from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
+# After a Redis error, skip Redis for this long and use the in-memory
+# limiter, so an outage doesn't add the socket timeout to every request
+REDIS_RETRY_AFTER_SECONDS = 10
+
+TRUSTED_PROXY_NETWORKS = tuple(
+    ipaddress.ip_network(proxy, strict=False) for proxy in settings.TRUSTED_PROXIES
+)
+
+
+@lru_cache(maxsize=4096)
+def _is_trusted_proxy(host: str) -> bool:
+    try:
+        address = ipaddress.ip_address(host)
+    except ValueError:
+        return False
+    return any(address in network for network in TRUSTED_PROXY_NETWORKS)
+
+
+@lru_cache(maxsize=4096)
+def _ip_key(host: str):
+    """Integer key for an IP address (the raw string if it does not parse)"""
+    try:
+        return int.from_bytes(ipaddress.ip_address(host).packed, "big")
+    except ValueError:
+        return host
+
+
+def client_ip(request: Request) -> str:
+    """
+    Resolve the client IP, honoring X-Forwarded-For only from trusted proxies.
+
+    Walks the header right to left and returns the first hop that is not a
+    trusted proxy, so clients cannot spoof their address by prepending
+    entries.
+    """
+    peer = request.client.host if request.client else "unknown"
+    if not TRUSTED_PROXY_NETWORKS or not _is_trusted_proxy(peer):
+        return peer
+
+    forwarded_for = request.headers.get("x-forwarded-for")
+    if not forwarded_for:
+        return peer
+    for hop in reversed(forwarded_for.split(",")):
+        hop = hop.strip()
+        if hop and not _is_trusted_proxy(hop):
+            return hop
+    return peer
+
+
+# Fixed-window counter shared by every worker. One EVALSHA per request:
+# returns {allowed, retry_after_ms, count} atomically.
+RATE_LIMIT_SCRIPT = """
+local count = redis.call('INCR', KEYS[1])
+if count == 1 then
+    redis.call('PEXPIRE', KEYS[1], ARGV[2])
+end
+if count > tonumber(ARGV[1]) then
+    return {0, redis.call('PTTL', KEYS[1]), count}
+end
+return {1, 0, count}
+"""
+
 
 class RateLimiter:
-    """Simple in-memory rate limiter"""
+    """Simple in-memory rate limiter (fallback when Redis is unavailable)"""
 
     def __init__(self):
-        self.requests = defaultdict(list)
+        # Per-IP request timestamps, oldest first
+        self.requests = defaultdict(deque)
         self.blocked_ips = {}
 
     def is_allowed(
         self,
-        client_ip: str,
+        client_ip: Hashable,
         max_requests: int = 100,
         window_seconds: int = 60
     ) -> tuple[bool, int]:
@@ -29,7 +98,7 @@ class RateLimiter:
         Check if request is allowed based on rate limit
 
         Args:
-            client_ip: Client IP address
+            client_ip: Client IP address (or its integer key)
             max_requests: Maximum requests allowed in window
             window_seconds: Time window in seconds
 
@@ -48,21 +117,20 @@ class RateLimiter:
                 # Unblock
                 del self.blocked_ips[client_ip]
 
-        # Clean old requests
-        self.requests[client_ip] = [
-            req_time for req_time in self.requests[client_ip]
-            if req_time > window_start
-        ]
+        # Drop requests that fell out of the window (oldest are at the left)
+        timestamps = self.requests[client_ip]
+        while timestamps and timestamps[0] <= window_start:
+            timestamps.popleft()
 
         # Check rate limit
-        if len(self.requests[client_ip]) >= max_requests:
+        if len(timestamps) >= max_requests:
             # Block for 5 minutes
             self.blocked_ips[client_ip] = now + 300
             logger.warning(f"Rate limit exceeded for IP: {client_ip}")
             return False, 300
 
         # Add current request
-        self.requests[client_ip].append(now)
+        timestamps.append(now)
         return True, 0
 
     def cleanup(self):
@@ -72,11 +140,10 @@ class RateLimiter:
         cutoff = now - 3600
 
         for ip in list(self.requests.keys()):
-            self.requests[ip] = [
-                req_time for req_time in self.requests[ip]
-                if req_time > cutoff
-            ]
-            if not self.requests[ip]:
+            timestamps = self.requests[ip]
+            while timestamps and timestamps[0] <= cutoff:
+                timestamps.popleft()
+            if not timestamps:
                 del self.requests[ip]
 
 
@@ -85,35 +152,67 @@ rate_limiter = RateLimiter()
 
 
 class RateLimitMiddleware(BaseHTTPMiddleware):
-    """Middleware for rate limiting"""
+    """
+    Middleware for rate limiting.
+
+    Counts live in Redis so the limit holds across all workers; the
+    in-memory RateLimiter is only used while Redis is unreachable.
+    """
+
+    # Essential auth endpoints are never rate limited (health and metrics
+    # probes never reach this middleware; see ProbeRouteMiddleware)
+    BYPASS_PATHS: frozenset[str] = frozenset({
+        f"{settings.API_V1_STR}/auth/login",
+        f"{settings.API_V1_STR}/auth/me",
+        f"{settings.API_V1_STR}/auth/refresh",
+        f"{settings.API_V1_STR}/auth/logout",
+    })
 
     def __init__(self, app, max_requests: int = 100, window_seconds: int = 60):
         super().__init__(app)
         self.max_requests = max_requests
         self.window_seconds = window_seconds
+        # Shares the async cache connection pool; register_script handles
+        # SCRIPT LOAD / EVALSHA (and reloads on NOSCRIPT)
+        self._script = async_cache.redis_client.register_script(RATE_LIMIT_SCRIPT)
+        # Circuit breaker: monotonic time before which Redis is not tried
+        self._redis_down_until = 0.0
+
+    async def _check(self, client_key) -> tuple[bool, int, int]:
+        """Return (is_allowed, retry_after_seconds, remaining)"""
+        now = time.monotonic()
+        if now >= self._redis_down_until:
+            window = int(time.time()) // self.window_seconds
+            try:
+                allowed, retry_after_ms, count = await self._script(
+                    keys=[f"ratelimit:{client_key}:{window}"],
+                    args=[self.max_requests, self.window_seconds * 1000],
+                )
+                return bool(allowed), -(-int(retry_after_ms) // 1000), self.max_requests - int(count)
+            except RedisError as e:
+                self._redis_down_until = time.monotonic() + REDIS_RETRY_AFTER_SECONDS
+                logger.warning(
+                    "Rate limit Redis error, using in-memory limiter for %ss: %s",
+                    REDIS_RETRY_AFTER_SECONDS, e,
+                )
+
+        is_allowed, retry_after = rate_limiter.is_allowed(
+            client_key,
+            self.max_requests,
+            self.window_seconds
+        )
+        remaining = self.max_requests - len(rate_limiter.requests.get(client_key, ()))
+        return is_allowed, retry_after, remaining
 
     async def dispatch(self, request: Request, call_next: Callable):
-        # Skip rate limiting for health check, metrics, and essential auth endpoints
-        bypass_paths = {
-            "/health",
-            "/metrics",
-            "/api/v1/auth/login",
-            "/api/v1/auth/me",
-            "/api/v1/auth/refresh",
-            "/api/v1/auth/logout",
-        }
-        if request.url.path in bypass_paths:
+        if request.url.path in self.BYPASS_PATHS:
             return await call_next(request)
 
-        # Get client IP
-        client_ip = request.client.host if request.client else "unknown"
+        # Get client IP (as an integer key when it parses)
+        client_key = _ip_key(client_ip(request))
 
         # Check rate limit
-        is_allowed, retry_after = rate_limiter.is_allowed(
-            client_ip,
-            self.max_requests,
-            self.window_seconds
-        )
+        is_allowed, retry_after, remaining = await self._check(client_key)
 
         if not is_allowed:
             raise HTTPException(
@@ -125,7 +224,6 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         response = await call_next(request)
 
         # Add rate limit headers
-        remaining = self.max_requests - len(rate_limiter.requests.get(client_ip, []))
         response.headers["X-RateLimit-Limit"] = str(self.max_requests)
         response.headers["X-RateLimit-Remaining"] = str(remaining)
         response.headers["X-RateLimit-Reset"] = str(int(time.time() + self.window_seconds))
@@ -2,24 +2,110 @@
 Server-Sent Events (SSE) for real-time alerts
 """
 import asyncio
-import json
 import logging
-from typing import Dict, Set, AsyncGenerator
+import time
+from typing import Dict, List, Optional, Set, AsyncGenerator
+import redis.asyncio as aioredis
+from redis.exceptions import RedisError
 from fastapi import Request
 from fastapi.responses import StreamingResponse
 from datetime import datetime
 from uuid import UUID
 
+from app.core.config import REDIS_URL
+from app.core.metrics import metrics_collector
+
 logger = logging.getLogger(__name__)
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    import json
+    ORJSON_AVAILABLE = False
+
+
+def _json_dumps(data: dict) -> str:
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, default=str).decode()
+    return json.dumps(data, default=str)
+
+
+# (epoch second, ISO string) for the most recent second formatted
+_iso_cache = (0, "")
+
+
+def _now_iso() -> str:
+    """UTC timestamp at second resolution, formatted at most once per second"""
+    global _iso_cache
+    now = int(time.time())
+    if now != _iso_cache[0]:
+        _iso_cache = (now, datetime.utcfromtimestamp(now).isoformat() + "Z")
+    return _iso_cache[1]
+
+
+# Every SSE channel is published as "sse:<channel>"; each worker listens
+# with one PSUBSCRIBE, so new channels need no extra subscriptions
+PUBSUB_PREFIX = "sse:"
+
+# Frames buffered per connection; a client that falls further behind loses
+# its oldest frames instead of growing memory without bound
+QUEUE_MAXSIZE = 256
+
+# Frames already queued are sent together (up to this many per write)
+MAX_BATCH = 32
+
+# Drained queues kept for reuse by later connections (frequent reconnects)
+QUEUE_POOL_SIZE = 64
+
 
 class SSEManager:
-    """Manager for Server-Sent Events connections"""
+    """
+    Manager for Server-Sent Events connections.
+
+    Clients connect to whichever worker serves them, so broadcasts go
+    through Redis pub/sub: any worker publishes, and every worker's
+    listener delivers to the connections it holds.
+    """
 
     def __init__(self):
-        # Store active connections per region/role
+        # Store active connections per region/role. Only touched from the
+        # event loop and never across an await, so no lock is needed.
         self.connections: Dict[str, Set[asyncio.Queue]] = {}
-        self._lock = asyncio.Lock()
+        self._queue_pool: List[asyncio.Queue] = []
+        # Dedicated client: the pub/sub connection blocks on reads, so it
+        # must not inherit the cache pool's short socket timeout
+        self._redis = aioredis.from_url(
+            REDIS_URL,
+            health_check_interval=30,
+            client_name="hass-sse",
+        )
+        self._listener: Optional[asyncio.Task] = None
+
+    def _ensure_listener(self):
+        """Start the pub/sub listener on first use (needs a running loop)"""
+        if self._listener is None or self._listener.done():
+            self._listener = asyncio.create_task(self._listen())
+
+    async def _listen(self):
+        """Relay published messages into this worker's local queues"""
+        while True:
+            pubsub = self._redis.pubsub(ignore_subscribe_messages=True)
+            try:
+                await pubsub.psubscribe(f"{PUBSUB_PREFIX}*")
+                async for item in pubsub.listen():
+                    if item["type"] != "pmessage":
+                        continue
+                    # The payload is already JSON: wrap it as a frame as-is
+                    channel = item["channel"].decode()[len(PUBSUB_PREFIX):]
+                    await self._deliver(channel, f"data: {item['data'].decode()}\n\n")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning("SSE pub/sub listener error, reconnecting: %s", e)
+                await asyncio.sleep(1)
+            finally:
+                await pubsub.reset()
 
     async def connect(self, channel: str, request: Request) -> AsyncGenerator[str, None]:
         """
@@ -32,12 +118,12 @@ class SSEManager:
         Yields:
             SSE formatted messages
         """
-        queue: asyncio.Queue = asyncio.Queue()
+        queue: asyncio.Queue = (
+            self._queue_pool.pop() if self._queue_pool else asyncio.Queue(maxsize=QUEUE_MAXSIZE)
+        )
+        self._ensure_listener()
 
-        async with self._lock:
-            if channel not in self.connections:
-                self.connections[channel] = set()
-            self.connections[channel].add(queue)
+        self.connections.setdefault(channel, set()).add(queue)
 
         logger.info(f"SSE connection established for channel: {channel}")
 
@@ -46,7 +132,7 @@ class SSEManager:
             yield self._format_sse({
                 "type": "connected",
                 "channel": channel,
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": _now_iso()
             })
 
             # Send heartbeat every 30 seconds and check for messages
@@ -58,44 +144,78 @@ class SSEManager:
                 try:
                     # Wait for message with timeout for heartbeat
                     message = await asyncio.wait_for(queue.get(), timeout=30.0)
-                    yield self._format_sse(message)
                 except asyncio.TimeoutError:
-                    # Send heartbeat (comment in SSE protocol)
+                    # Send heartbeat (comment in SSE protocol); the timeout
+                    # restarts on every message, so busy channels never get one
                     yield ": heartbeat\n\n"
+                    continue
+
+                # Drain whatever else is already queued into one write, so a
+                # burst costs one send instead of one per frame
+                frames = [message]
+                while len(frames) < MAX_BATCH:
+                    try:
+                        frames.append(queue.get_nowait())
+                    except asyncio.QueueEmpty:
+                        break
+                yield "".join(
+                    frame if isinstance(frame, str) else self._format_sse(frame)
+                    for frame in frames
+                )
 
         except asyncio.CancelledError:
             logger.info(f"SSE connection cancelled for channel: {channel}")
 
         finally:
             # Clean up connection
-            async with self._lock:
-                if channel in self.connections:
-                    self.connections[channel].discard(queue)
-                    if not self.connections[channel]:
-                        del self.connections[channel]
+            queues = self.connections.get(channel)
+            if queues is not None:
+                queues.discard(queue)
+                if not queues:
+                    del self.connections[channel]
+
+            # No longer reachable by _deliver: drain it and keep it for reuse
+            while not queue.empty():
+                queue.get_nowait()
+            if len(self._queue_pool) < QUEUE_POOL_SIZE:
+                self._queue_pool.append(queue)
             logger.info(f"SSE connection closed for channel: {channel}")
 
     async def broadcast(self, channel: str, message: dict):
         """
-        Broadcast message to all connections in a channel
+        Broadcast message to all connections in a channel, on every worker
+
+        The message is serialized once here; subscribers receive the
+        formatted SSE frame rather than re-encoding the dict each.
+        Falls back to this worker's connections if Redis is unavailable.
 
         Args:
             channel: Channel identifier
             message: Message dictionary to send
         """
-        async with self._lock:
-            if channel not in self.connections:
-                logger.debug(f"No active connections for channel: {channel}")
-                return
-
-            queues = list(self.connections[channel])
-
-        # Send to all connected clients
+        payload = _json_dumps(message)
+        try:
+            await self._redis.publish(f"{PUBSUB_PREFIX}{channel}", payload)
+        except RedisError as e:
+            logger.warning("SSE publish failed, delivering locally only: %s", e)
+            await self._deliver(channel, f"data: {payload}\n\n")
+
+    async def _deliver(self, channel: str, frame: str):
+        """Put a formatted SSE frame on every local connection queue for a channel"""
+        queues = tuple(self.connections.get(channel, ()))
+        if not queues:
+            logger.debug(f"No active connections for channel: {channel}")
+            return
+
+        # Send to all connected clients without waiting on slow ones:
+        # a full queue drops its oldest frame to make room
         for queue in queues:
             try:
-                await queue.put(message)
-            except Exception as e:
-                logger.error(f"Error sending message to queue: {str(e)}")
+                queue.put_nowait(frame)
+            except asyncio.QueueFull:
+                queue.get_nowait()
+                queue.put_nowait(frame)
+                metrics_collector.record_sse_drop(channel)
 
         logger.debug(f"Broadcast message to {len(queues)} connections on channel: {channel}")
 
@@ -126,7 +246,7 @@ class SSEManager:
             "patient_name": patient_name,
             "vital_type": vital_type,
             "vital_value": vital_value,
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": _now_iso(),
             "action_required": True
         }
 
@@ -153,7 +273,7 @@ class SSEManager:
             "patient_name": patient_name,
             "test_type": test_type,
             "test_id": str(test_id),
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": _now_iso(),
             "action": "review_results"
         }
 
@@ -180,7 +300,7 @@ class SSEManager:
             "patient_name": patient_name,
             "hospital_name": hospital_name,
             "visit_id": str(visit_id),
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": _now_iso()
         }
 
         await self.broadcast(f"alerts:{region_id}", message)
@@ -195,7 +315,7 @@ class SSEManager:
         Returns:
             Formatted SSE string
         """
-        return f"data: {json.dumps(data)}\n\n"
+        return f"data: {_json_dumps(data)}\n\n"
 
 
 # Global SSE manager instance
@@ -0,0 +1,30 @@
+"""
+Time-ordered UUIDs (RFC 9562 version 7) for primary keys.
+
+A UUIDv7 starts with a 48-bit Unix millisecond timestamp, so new keys land
+at the right-hand edge of the primary-key B-tree instead of on a random
+leaf page. Used for high-write tables (audit logs, case sheets, AI drafts).
+"""
+import os
+import time
+import uuid
+
+__all__ = ["uuid7"]
+
+
+def _uuid7() -> uuid.UUID:
+    """Generate a UUIDv7: 48-bit ms timestamp, version, 12+62 random bits"""
+    timestamp_ms = time.time_ns() // 1_000_000
+    rand = int.from_bytes(os.urandom(10), "big")
+    value = (
+        (timestamp_ms & 0xFFFF_FFFF_FFFF) << 80
+        | 0x7 << 76  # version
+        | (rand >> 62 & 0xFFF) << 64  # rand_a
+        | 0b10 << 62  # RFC 4122 variant
+        | rand & 0x3FFF_FFFF_FFFF_FFFF  # rand_b
+    )
+    return uuid.UUID(int=value)
+
+
+# Python 3.14+ ships uuid.uuid7
+uuid7 = getattr(uuid, "uuid7", _uuid7)
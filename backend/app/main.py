@@ -1,15 +1,20 @@
 """FastAPI application entry point"""
-from fastapi import FastAPI
+from fastapi import APIRouter, FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.gzip import GZipMiddleware
-from fastapi.responses import PlainTextResponse
+from fastapi.responses import JSONResponse, StreamingResponse
+from starlette.applications import Starlette
+from starlette.routing import Route
 from contextlib import asynccontextmanager
+import asyncio
 import logging
 
 from app.core.config import settings
-from app.core.metrics import metrics_collector, MetricsMiddleware
+from app.core.metrics import metrics_collector, MetricsMiddleware, expire_stale_metrics
 from app.core.rate_limit import RateLimitMiddleware
-from app.middleware.audit import AuditMiddleware
+from app.middleware.audit import AuditMiddleware, run_audit_writer
+from app.middleware.db_session import DBSessionMiddleware
+from app.middleware.probes import ProbeRouteMiddleware
 from app.core.config import settings as app_settings
 
 # Configure logging early
@@ -44,7 +49,13 @@ async def lifespan(app: FastAPI):
     logger.info("Starting Hospital Automation System API")
     logger.info(f"Version: {settings.VERSION}")
     logger.info(f"Debug mode: {settings.DEBUG}")
+    metrics_expiry = asyncio.create_task(expire_stale_metrics())
+    audit_writer = asyncio.create_task(run_audit_writer())
     yield
+    metrics_expiry.cancel()
+    # Cancelling the writer flushes any queued audit rows before it exits
+    audit_writer.cancel()
+    await asyncio.gather(audit_writer, return_exceptions=True)
     logger.info("Shutting down Hospital Automation System API")
 
 
@@ -79,18 +90,20 @@ app.add_middleware(GZipMiddleware, minimum_size=500)
 # Automatic audit logging for all modifying requests
 app.add_middleware(AuditMiddleware)
 
+# One database session per request, removed when the response completes
+app.add_middleware(DBSessionMiddleware)
 
-@app.get("/health")
-async def health_check():
+
+async def health_check(request):
     """Health check endpoint"""
-    return {
+    return JSONResponse({
         "status": "healthy",
         "service": settings.PROJECT_NAME,
         "version": settings.VERSION,
-    }
+    })
 
-@app.get("/metrics")
-async def metrics():
+
+async def metrics(request):
     """
     Prometheus metrics endpoint
     
@@ -102,12 +115,20 @@ async def metrics():
     - Database query counts
     - Cache hit/miss rates
     """
-    return PlainTextResponse(
-        content=metrics_collector.get_prometheus_metrics(),
-        media_type="text/plain"
+    return StreamingResponse(
+        metrics_collector.iter_prometheus_metrics(),
+        media_type="text/plain; version=0.0.4"
     )
 
 
+# Probes are served ahead of every other middleware (added last, so outermost)
+probe_app = Starlette(routes=[
+    Route("/health", health_check),
+    Route("/metrics", metrics),
+])
+app.add_middleware(ProbeRouteMiddleware, probe_app=probe_app, paths=("/health", "/metrics"))
+
+
 @app.get("/")
 async def root():
     """Root endpoint"""
@@ -149,30 +170,39 @@ from app.api.routes import messages
 from app.api.routes import public
 from app.api.v1.endpoints import ai_analytics
 
-app.include_router(auth.router, prefix=f"{settings.API_V1_STR}/auth", tags=["Authentication"])
-app.include_router(admin.router, prefix=f"{settings.API_V1_STR}/admin", tags=["Admin"])
-app.include_router(regions.router, prefix=f"{settings.API_V1_STR}/regions", tags=["Regions"])
-app.include_router(hospitals.router, prefix=f"{settings.API_V1_STR}/hospitals", tags=["Hospitals"])
-app.include_router(audit_logs.router, prefix=f"{settings.API_V1_STR}/audit-logs", tags=["Audit Logs"])
-app.include_router(patients.router, prefix=f"{settings.API_V1_STR}/patients", tags=["Patients"])
-app.include_router(patient_search.router, prefix=f"{settings.API_V1_STR}/patient-search", tags=["Global Patient Search"])
-app.include_router(clinical.router, prefix=f"{settings.API_V1_STR}/clinical", tags=["Clinical"])
-app.include_router(case_sheets.router, prefix=f"{settings.API_V1_STR}/case-sheets", tags=["Case Sheets"])
-app.include_router(beds.router, prefix=f"{settings.API_V1_STR}/beds", tags=["Beds"])
-app.include_router(appointments.router, prefix=f"{settings.API_V1_STR}/appointments", tags=["Appointments"])
-app.include_router(admission.router, prefix=f"{settings.API_V1_STR}/admission", tags=["Admission & Discharge"])
-app.include_router(analytics.router, prefix=f"{settings.API_V1_STR}/analytics", tags=["Analytics"])
-app.include_router(ai_analytics.router, prefix=f"{settings.API_V1_STR}/ai-analytics", tags=["AI Analytics"])
-app.include_router(notifications.router, prefix=f"{settings.API_V1_STR}/notifications", tags=["Notifications"])
-app.include_router(push.router, prefix=f"{settings.API_V1_STR}/push", tags=["Push Notifications"])
-app.include_router(ai.router, prefix=f"{settings.API_V1_STR}/ai", tags=["AI"])
-app.include_router(files.router, prefix=f"{settings.API_V1_STR}/files", tags=["Files"])
-app.include_router(visits.router, prefix=f"{settings.API_V1_STR}/visits", tags=["Visits"])
-app.include_router(sse.router, prefix=f"{settings.API_V1_STR}/sse", tags=["Real-Time"])
-app.include_router(ai_intelligence.router, prefix=f"{settings.API_V1_STR}/ai-intelligence", tags=["AI Intelligence"])
-app.include_router(qr_codes.router, prefix=f"{settings.API_V1_STR}/qr", tags=["QR Codes"])
-app.include_router(voice_to_text.router, prefix=f"{settings.API_V1_STR}/voice-to-text", tags=["Voice to Text"])
-app.include_router(pharmacy.router, prefix=f"{settings.API_V1_STR}/pharmacy", tags=["Pharmacy"])
-app.include_router(api_keys.router, prefix=f"{settings.API_V1_STR}/admin/api-keys", tags=["Admin", "API Keys"])
-app.include_router(messages.router, prefix=f"{settings.API_V1_STR}/messages", tags=["Messaging"]) 
-app.include_router(public.router, prefix=f"{settings.API_V1_STR}/public", tags=["Public"]) 
+# (module, prefix, tags) for every v1 router. Routes are matched in
+# inclusion order, so new entries go where their paths cannot be shadowed.
+API_V1_ROUTERS = [
+    (auth, "/auth", ["Authentication"]),
+    (admin, "/admin", ["Admin"]),
+    (regions, "/regions", ["Regions"]),
+    (hospitals, "/hospitals", ["Hospitals"]),
+    (audit_logs, "/audit-logs", ["Audit Logs"]),
+    (patients, "/patients", ["Patients"]),
+    (patient_search, "/patient-search", ["Global Patient Search"]),
+    (clinical, "/clinical", ["Clinical"]),
+    (case_sheets, "/case-sheets", ["Case Sheets"]),
+    (beds, "/beds", ["Beds"]),
+    (appointments, "/appointments", ["Appointments"]),
+    (admission, "/admission", ["Admission & Discharge"]),
+    (analytics, "/analytics", ["Analytics"]),
+    (ai_analytics, "/ai-analytics", ["AI Analytics"]),
+    (notifications, "/notifications", ["Notifications"]),
+    (push, "/push", ["Push Notifications"]),
+    (ai, "/ai", ["AI"]),
+    (files, "/files", ["Files"]),
+    (visits, "/visits", ["Visits"]),
+    (sse, "/sse", ["Real-Time"]),
+    (ai_intelligence, "/ai-intelligence", ["AI Intelligence"]),
+    (qr_codes, "/qr", ["QR Codes"]),
+    (voice_to_text, "/voice-to-text", ["Voice to Text"]),
+    (pharmacy, "/pharmacy", ["Pharmacy"]),
+    (api_keys, "/admin/api-keys", ["Admin", "API Keys"]),
+    (messages, "/messages", ["Messaging"]),
+    (public, "/public", ["Public"]),
+]
+
+api_v1 = APIRouter(prefix=settings.API_V1_STR)
+for module, prefix, tags in API_V1_ROUTERS:
+    api_v1.include_router(module.router, prefix=prefix, tags=tags)
+app.include_router(api_v1)
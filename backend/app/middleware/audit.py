@@ -1,87 +1,260 @@
 """Middleware to automatically log modifying requests to AuditLog"""
-from typing import Optional
+import asyncio
+import logging
+import time
+from typing import List, Optional
+from cachetools import TTLCache
 from uuid import UUID
-from fastapi import Request
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.concurrency import run_in_threadpool
+from starlette.requests import cookie_parser
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from app.core.database import SessionLocal
 from app.core.security import decode_token, verify_token_type
 from app.models.audit_log import AuditLog
 
+logger = logging.getLogger(__name__)
+
 NIL_UUID = UUID("00000000-0000-0000-0000-000000000000")
 
+_PREFIX = "/api/v1/"
+_PREFIX_LEN = len(_PREFIX)
+_MODIFYING_METHODS = frozenset(("POST", "PUT", "PATCH", "DELETE"))
+_BEARER = b"Bearer "
+# Longest request path kept in an audit row's notes
+_NOTES_PATH_MAX = 255
+# Token refreshes change no application state and would dominate the log
+_AUDIT_EXEMPT = frozenset((_PREFIX + "auth/refresh",))
+# Path params that identify the audited resource
+_CANDIDATE_KEYS = frozenset(
+    ("id", "patient_id", "visit_id", "thread_id", "key_id", "hospital_id", "user_id")
+)
+
+# Audit rows are queued by the middleware and written by run_audit_writer in
+# batches of up to AUDIT_BATCH_SIZE, or whatever arrived within
+# AUDIT_FLUSH_INTERVAL seconds of the first row
+AUDIT_QUEUE_MAXSIZE = 10_000
+AUDIT_BATCH_SIZE = 256
+AUDIT_FLUSH_INTERVAL = 0.1
+
+# Created by the running writer so it always belongs to the current loop
+_audit_queue: Optional[asyncio.Queue] = None
+
+# token -> (user_id, exp): repeat writes from the same client skip JWT
+# verification. Invalid tokens are cached too (as (None, None)). Only used
+# from the event loop, so no lock is needed.
+_token_user_cache: TTLCache = TTLCache(maxsize=4096, ttl=30)
+
+# Unexpected failures while building an audit row are logged at most once
+# per interval so a persistent fault is visible without flooding the log
+AUDIT_ERROR_LOG_INTERVAL = 1.0
+_last_error_log = 0.0
+
+
+def _should_log_error() -> bool:
+    global _last_error_log
+    now = time.monotonic()
+    if now - _last_error_log < AUDIT_ERROR_LOG_INTERVAL:
+        return False
+    _last_error_log = now
+    return True
+
+
+def _coerce_uuid(value) -> UUID:
+    """Return ``value`` as a UUID, parsing it only when it is not one already"""
+    if isinstance(value, UUID):
+        return value
+    return UUID(value if isinstance(value, str) else str(value))
+
 
-class AuditMiddleware(BaseHTTPMiddleware):
-    def __init__(self, app):
-        super().__init__(app)
+def _write_audit_rows(rows: List[dict]):
+    """
+    Insert a batch of audit rows in one transaction (runs in a thread).
 
-    async def dispatch(self, request: Request, call_next):
-        response = await call_next(request)
+    Rows go in as plain mappings (one multi-row INSERT, no ORM instances or
+    identity map). If the batch fails, rows are retried one at a time so a
+    single bad row (e.g. a user deleted meanwhile) only loses itself.
 
+    Every write uses its own short-lived ``SessionLocal.begin()`` session,
+    which commits (or rolls back) and returns its connection on exit. Never
+    pass these sessions on or reuse a request's session here: a failed
+    audit insert would leave the shared transaction inactive for the
+    handler that owns it.
+    """
+    try:
+        with SessionLocal.begin() as session:
+            session.bulk_insert_mappings(AuditLog, rows)
+        return
+    except Exception as e:
+        if len(rows) == 1:
+            logger.warning("Audit log write failed: %s", e)
+            return
+        logger.warning("Audit batch insert failed, retrying %d rows individually: %s", len(rows), e)
+
+    for row in rows:
         try:
-            # Only log write operations that succeeded
-            if request.method in {"POST", "PUT", "PATCH", "DELETE"} and response.status_code < 400:
-                user_id = self._extract_user_id(request)
-                resource_type, resource_id = self._infer_resource(request)
-                ip_address = request.client.host if request.client else None
-                user_agent = request.headers.get("user-agent")
+            with SessionLocal.begin() as session:
+                session.bulk_insert_mappings(AuditLog, [row])
+        except Exception as e:
+            logger.warning("Dropping audit row %s: %s", row.get("notes"), e)
+
 
-                db = SessionLocal()
+async def run_audit_writer():
+    """Drain queued audit rows into AuditLog (started in the app lifespan)"""
+    global _audit_queue
+    loop = asyncio.get_running_loop()
+    queue = _audit_queue = asyncio.Queue(maxsize=AUDIT_QUEUE_MAXSIZE)
+    # Rows taken off the queue but not yet handed to a write; kept outside
+    # the loop so a cancellation while gathering doesn't lose them
+    batch: List[dict] = []
+    try:
+        while True:
+            batch.append(await queue.get())
+            deadline = loop.time() + AUDIT_FLUSH_INTERVAL
+            while len(batch) < AUDIT_BATCH_SIZE:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
                 try:
-                    log = AuditLog(
-                        user_id=user_id,
-                        action=request.method,
-                        resource_type=resource_type,
-                        resource_id=resource_id,
-                        ip_address=ip_address,
-                        user_agent=user_agent,
-                        notes=f"{request.method} {request.url.path} => {response.status_code}",
-                    )
-                    db.add(log)
-                    db.commit()
-                finally:
-                    db.close()
-        except Exception:
-            # Never block the request on audit logging
-            pass
+                    batch.append(await asyncio.wait_for(queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            # The thread finishes the write even if we're cancelled while
+            # awaiting it, so the rows are no longer ours to flush
+            pending, batch = batch, []
+            await run_in_threadpool(_write_audit_rows, pending)
+    finally:
+        _audit_queue = None
+        # Shutdown: flush the partial batch and whatever is still queued.
+        # This is a blocking write on the event loop, which is acceptable
+        # here: the app has stopped serving requests and a threadpool await
+        # could itself be cancelled again during shutdown.
+        remaining = batch
+        while not queue.empty():
+            remaining.append(queue.get_nowait())
+        if remaining:
+            _write_audit_rows(remaining)
+
+
+async def enqueue_audit_row(row: dict):
+    """Hand an audit row to the writer without waiting on the database"""
+    if _audit_queue is None:
+        # No writer running (scripts, apps without lifespan): write directly
+        await run_in_threadpool(_write_audit_rows, [row])
+        return
+    try:
+        _audit_queue.put_nowait(row)
+    except asyncio.QueueFull:
+        logger.warning("Audit queue full, dropping audit row for %s", row.get("notes"))
+
 
-        return response
+class AuditMiddleware:
+    """
+    Pure ASGI middleware: records successful write requests in AuditLog.
 
-    def _extract_user_id(self, request: Request) -> Optional[UUID]:
+    The response status is captured from the ``http.response.start``
+    message as it passes through, and request details are read straight
+    from the ASGI scope.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if (
+            scope["type"] != "http"
+            or scope["method"] not in _MODIFYING_METHODS
+            # Only API routes are audited; /metrics, probes etc. pass straight through
+            or not scope["path"].startswith(_PREFIX)
+            or scope["path"] in _AUDIT_EXEMPT
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+
+        async def send_wrapper(message: Message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+        try:
+            # Only log write operations that succeeded
+            if status_code < 400:
+                headers = dict(scope["headers"])
+                method = scope["method"]
+                path = scope["path"]
+                user_id = self._extract_user_id(headers)
+                resource_type, resource_id = self._infer_resource(scope)
+                client = scope.get("client")
+                ip_address = client[0] if client else None
+                user_agent = headers.get(b"user-agent")
+
+                await enqueue_audit_row({
+                    "user_id": user_id,
+                    "action": method,
+                    "resource_type": resource_type,
+                    "resource_id": resource_id,
+                    "ip_address": ip_address,
+                    "user_agent": user_agent.decode("latin-1") if user_agent else None,
+                    # The method is already stored as the action
+                    "notes": f"{path[:_NOTES_PATH_MAX]} => {status_code}",
+                })
+        except Exception:
+            # Never fail the request on audit logging (the response has
+            # already been sent); database errors are handled by the writer
+            if _should_log_error():
+                logger.warning("Failed to record audit row for %s %s", scope["method"], scope["path"], exc_info=True)
+
+    def _extract_user_id(self, headers: dict) -> Optional[UUID]:
         token = None
-        auth = request.headers.get("authorization")
-        if auth and auth.lower().startswith("bearer "):
-            token = auth.split(" ", 1)[1]
+        auth = headers.get(b"authorization")
+        if auth:
+            # Compare raw header bytes; only non-canonical casing pays for lower()
+            prefix = auth[:7]
+            if prefix == _BEARER or prefix.lower() == b"bearer ":
+                token = auth[7:].strip().decode("latin-1")
         if not token:
-            token = request.cookies.get("access_token")
+            cookie = headers.get(b"cookie")
+            if cookie:
+                token = cookie_parser(cookie.decode("latin-1")).get("access_token")
         if not token:
             return None
+
+        cached = _token_user_cache.get(token)
+        if cached is not None:
+            user_id, exp = cached
+            # Never attribute writes to a token that expired while cached
+            if exp is None or exp > time.time():
+                return user_id
+
+        user_id = exp = None
         payload = decode_token(token)
-        if not payload or not verify_token_type(payload, "access"):
-            return None
-        sub = payload.get("sub")
-        try:
-            return UUID(str(sub)) if sub else None
-        except Exception:
-            return None
+        if payload and verify_token_type(payload, "access"):
+            exp = payload.get("exp")
+            sub = payload.get("sub")
+            try:
+                user_id = _coerce_uuid(sub) if sub else None
+            except ValueError:
+                user_id = None
+        _token_user_cache[token] = (user_id, exp)
+        return user_id
 
-    def _infer_resource(self, request: Request) -> tuple[str, UUID]:
-        # Heuristic: use first segment after /api/v1 as resource type
-        path = request.url.path
-        resource_type = "unknown"
-        if path.startswith("/api/v1/"):
-            rest = path[len("/api/v1/"):]
-            if rest:
-                resource_type = rest.split("/", 1)[0] or "unknown"
-        # Try to find an id in path params
-        params = request.scope.get("path_params") or {}
-        candidate_keys = [
-            "id","patient_id","visit_id","thread_id","key_id","hospital_id","user_id"
-        ]
-        for k in candidate_keys:
-            if k in params:
-                try:
-                    return resource_type, UUID(str(params[k]))
-                except Exception:
-                    break
+    def _infer_resource(self, scope: Scope) -> tuple[str, UUID]:
+        # Heuristic: use first segment after /api/v1 as resource type (callers
+        # only pass API paths)
+        path = scope["path"]
+        resource_type = path[_PREFIX_LEN:].split("/", 1)[0] or "unknown"
+        # Try to find an id in path params (set on the shared scope by routing)
+        params = scope.get("path_params")
+        if params:
+            for k, v in params.items():
+                if k in _CANDIDATE_KEYS:
+                    try:
+                        return resource_type, _coerce_uuid(v)
+                    except ValueError:
+                        break
         return resource_type, NIL_UUID
@@ -0,0 +1,32 @@
+"""Middleware that scopes one database session to each HTTP request"""
+from starlette.concurrency import run_in_threadpool
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.core.database import ScopedSession, begin_request_scope, end_request_scope
+
+
+class DBSessionMiddleware:
+    """
+    Pure ASGI middleware: opens a request scope for ScopedSession and
+    removes the session once the response (including any streamed body)
+    has been sent.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        token = begin_request_scope()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            try:
+                if ScopedSession.registry.has():
+                    # Closing rolls back and returns the connection: blocking I/O
+                    await run_in_threadpool(ScopedSession.remove)
+            finally:
+                end_request_scope(token)
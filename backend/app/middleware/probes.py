@@ -0,0 +1,25 @@
+"""Middleware that serves health and metrics probes ahead of the middleware stack"""
+from typing import Iterable
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+
+class ProbeRouteMiddleware:
+    """
+    Pure ASGI middleware: hands probe paths (load-balancer health checks,
+    Prometheus scrapes) straight to a small probe app.
+
+    Added last, so it is the outermost user middleware and probes skip the
+    rate limiting, metrics, gzip, audit and session layers entirely.
+    """
+
+    def __init__(self, app: ASGIApp, probe_app: ASGIApp, paths: Iterable[str]):
+        self.app = app
+        self.probe_app = probe_app
+        self.paths = frozenset(paths)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] == "http" and scope["path"] in self.paths:
+            await self.probe_app(scope, receive, send)
+            return
+        await self.app(scope, receive, send)
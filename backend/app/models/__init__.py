@@ -1,62 +1,67 @@
-"""Database models package - Import all models for Alembic discovery"""
-
-from app.models.role import Role
-from app.models.region import Region
-from app.models.hospital import Hospital
-from app.models.user import User
-from app.models.patient import Patient
-from app.models.visit import Visit
-from app.models.bed import Bed
-from app.models.api_key import ApiKey
-from app.models.vitals import Vitals
-from app.models.nurse_log import NurseLog
-from app.models.lab_test import LabTest
-from app.models.prescription import Prescription
-from app.models.appointment import Appointment
-from app.models.inventory import Inventory
-from app.models.emr import EMRLocal, EMRGlobal
-from app.models.notification import Notification
-from app.models.push_subscription import PushSubscription
-from app.models.audit_log import AuditLog
-from app.models.ai_draft import AIDraft
-from app.models.case_sheet import CaseSheet
-from app.models.global_emr import GlobalEMR, LocalVisitRecord
-from app.models.patient_hospital import PatientHospital
-from app.models.message_thread import MessageThread
-from app.models.message import Message
-
-__all__ = [
-    "Role",
-    "Region",
-    "Hospital",
-    "User",
-    "Patient",
-    "Visit",
-    "Bed",
-    "Vitals",
-    "NurseLog",
-    "LabTest",
-    "Prescription",
-    "Appointment",
-    "Inventory",
-    "EMRLocal",
-    "EMRGlobal",
-    # Backwards-compatible aliases expected by some tests
-    "LocalEMR",
-    "Notification",
-    "PushSubscription",
-    "AuditLog",
-    "AIDraft",
-    "CaseSheet",
-    "GlobalEMR",
-    "LocalVisitRecord",
-    "PatientHospital",
-    "ApiKey",
-    "MessageThread",
-    "Message",
-]
-
-# Backwards-compatible alias: some tests import LocalEMR from app.models
-# while the canonical name is EMRLocal. Export an alias to satisfy both.
-LocalEMR = EMRLocal
+"""
+Database models package.
 
+Models are imported lazily: ``from app.models import Patient`` loads only
+app.models.patient (and what it imports), so scripts and workers don't pay
+for mapping every table up front. Before SQLAlchemy configures mappers the
+full registry is imported, so string relationship targets always resolve.
+"""
+import importlib
+
+from sqlalchemy import event
+from sqlalchemy.orm import Mapper
+
+# Public name -> (module, attribute)
+_MODELS = {
+    "Role": ("role", "Role"),
+    "Region": ("region", "Region"),
+    "Hospital": ("hospital", "Hospital"),
+    "User": ("user", "User"),
+    "Patient": ("patient", "Patient"),
+    "Visit": ("visit", "Visit"),
+    "Bed": ("bed", "Bed"),
+    "ApiKey": ("api_key", "ApiKey"),
+    "Vitals": ("vitals", "Vitals"),
+    "NurseLog": ("nurse_log", "NurseLog"),
+    "LabTest": ("lab_test", "LabTest"),
+    "Prescription": ("prescription", "Prescription"),
+    "Appointment": ("appointment", "Appointment"),
+    "Inventory": ("inventory", "Inventory"),
+    "EMRLocal": ("emr", "EMRLocal"),
+    "EMRGlobal": ("emr", "EMRGlobal"),
+    "GlobalEMRView": ("emr", "GlobalEMRView"),
+    # Backwards-compatible alias: some tests import LocalEMR from app.models
+    # while the canonical name is EMRLocal
+    "LocalEMR": ("emr", "EMRLocal"),
+    "Notification": ("notification", "Notification"),
+    "PushSubscription": ("push_subscription", "PushSubscription"),
+    "AuditLog": ("audit_log", "AuditLog"),
+    "AIDraft": ("ai_draft", "AIDraft"),
+    "CaseSheet": ("case_sheet", "CaseSheet"),
+    "CaseSheetEvent": ("case_sheet_event", "CaseSheetEvent"),
+    "GlobalEMR": ("global_emr", "GlobalEMR"),
+    "LocalVisitRecord": ("global_emr", "LocalVisitRecord"),
+    "VisitEvent": ("visit_event", "VisitEvent"),
+    "PatientHospital": ("patient_hospital", "PatientHospital"),
+    "MessageThread": ("message_thread", "MessageThread"),
+    "Message": ("message", "Message"),
+    "MessageBody": ("message_body", "MessageBody"),
+}
+
+__all__ = list(_MODELS)
+
+
+def __getattr__(name):
+    try:
+        module_name, attr = _MODELS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(f"{__name__}.{module_name}"), attr)
+    globals()[name] = value
+    return value
+
+
+@event.listens_for(Mapper, "before_configured")
+def _import_all_models():
+    """Relationships name their targets as strings; make sure all are mapped"""
+    importlib.import_module(f"{__name__}.registry")
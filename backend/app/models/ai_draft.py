@@ -1,11 +1,11 @@
 """AIDraft model for AI approval workflow"""
-from sqlalchemy import Column, String, Boolean, DateTime, ForeignKey, Text, Index
+from sqlalchemy import Column, String, Boolean, DateTime, ForeignKey, Text, Index, text
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
-import uuid
 
 from app.core.database import Base
+from app.core.uuid7 import uuid7
 
 
 class AIDraft(Base):
@@ -13,7 +13,7 @@ class AIDraft(Base):
 
     __tablename__ = "ai_drafts"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     patient_id = Column(
         UUID(as_uuid=True),
         ForeignKey("patients.id", ondelete="RESTRICT"),
@@ -53,7 +53,8 @@ class AIDraft(Base):
 
     # Index for pending AI drafts queue
     __table_args__ = (
-        Index("ix_ai_draft_status_created", "status", "created_at"),
+        # The review queue only ever reads pending drafts (newest first)
+        Index("ix_ai_draft_pending_created", "created_at", postgresql_where=text("status = 'pending'")),
     )
 
     def __repr__(self):
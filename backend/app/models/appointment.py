@@ -1,5 +1,5 @@
 """Appointment model for scheduling"""
-from sqlalchemy import Column, String, Integer, DateTime, ForeignKey, Text, Index
+from sqlalchemy import Column, String, Integer, DateTime, ForeignKey, Text, Index, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
@@ -65,6 +65,13 @@ class Appointment(Base):
     __table_args__ = (
         Index("ix_appointment_doctor_scheduled", "doctor_id", "scheduled_at"),
         Index("ix_appointment_hospital_status_scheduled", "hospital_id", "status", "scheduled_at"),
+        # Conflict checks and slot lookups only consider active appointments
+        Index(
+            "ix_appointment_doctor_active_scheduled",
+            "doctor_id",
+            "scheduled_at",
+            postgresql_where=text("status IN ('scheduled', 'checked_in', 'in_progress')"),
+        ),
     )
 
     def __repr__(self):
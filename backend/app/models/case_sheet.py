@@ -1,12 +1,14 @@
 """Case sheet model for INPATIENT visits with detailed event timeline"""
-from sqlalchemy import Column, String, DateTime, ForeignKey, Text, Boolean, Date, Index
+from sqlalchemy import Column, String, DateTime, ForeignKey, Text, Boolean, Date, Index, bindparam, inspect, update
 from sqlalchemy.dialects.postgresql import UUID, JSONB
-from sqlalchemy.orm import relationship
+from sqlalchemy.ext.mutable import MutableList
+from sqlalchemy.orm import object_session, relationship
 from sqlalchemy.sql import func
-import uuid
-from datetime import datetime
+from datetime import datetime, timezone
 
 from app.core.database import Base
+from app.core.uuid7 import uuid7
+from app.models.case_sheet_event import CaseSheetEvent
 
 
 class CaseSheet(Base):
@@ -23,7 +25,7 @@ class CaseSheet(Base):
     """
     __tablename__ = "case_sheets"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     patient_id = Column(UUID(as_uuid=True), ForeignKey("patients.id", ondelete="RESTRICT"), nullable=False, index=True)
     visit_id = Column(UUID(as_uuid=True), ForeignKey("visits.id", ondelete="CASCADE"), nullable=False, index=True)
     hospital_id = Column(UUID(as_uuid=True), ForeignKey("hospitals.id", ondelete="RESTRICT"), nullable=False, index=True)
@@ -102,10 +104,12 @@ class CaseSheet(Base):
     
     # Event timeline - JSONB array of all events with acknowledgments
     # Each event: {type, timestamp, data, acknowledged_by, acknowledged_at, ack_notes}
-    event_timeline = Column(JSONB, nullable=True, default=list)
+    # MutableList tracks in-place appends so they are flushed without
+    # reassigning (and copying) the whole list
+    event_timeline = Column(MutableList.as_mutable(JSONB), nullable=True, default=list)
     
     # Progress notes - separate from event timeline
-    progress_notes = Column(JSONB, nullable=True, default=list)
+    progress_notes = Column(MutableList.as_mutable(JSONB), nullable=True, default=list)
     
     # Metadata
     created_by = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="SET NULL"), nullable=False)
@@ -119,6 +123,15 @@ class CaseSheet(Base):
     hospital = relationship("Hospital")
     created_by_user = relationship("User", foreign_keys=[created_by])
     last_updated_by_user = relationship("User", foreign_keys=[last_updated_by])
+    # Write-only: adding an event never loads the existing ones
+    events = relationship(
+        "CaseSheetEvent",
+        back_populates="case_sheet",
+        lazy="write_only",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        order_by="CaseSheetEvent.timestamp",
+    )
     
     # Indexes
     __table_args__ = (
@@ -141,6 +154,12 @@ class CaseSheet(Base):
     def log_event(self, event_type: str, event_data: dict, user_id: UUID, user_name: str, user_role: str):
         """
         Log an event to the case sheet timeline.
+
+        The event is inserted as a CaseSheetEvent row. It is also appended to
+        the legacy ``event_timeline`` JSONB array until readers move to
+        ``case_sheet_events``; for stored case sheets that append runs in
+        SQL (``event_timeline || [event]``), so only the new event is sent
+        and the existing timeline is never loaded or rewritten.
         
         Event types:
         - vital_recorded: Vitals taken
@@ -152,20 +171,45 @@ class CaseSheet(Base):
         - lab_test_ordered: Lab test requested
         - lab_result_received: Lab results available
         """
-        if not self.event_timeline:
-            self.event_timeline = []
-        
+        # One clock read for both the event and updated_at
+        now = datetime.now(timezone.utc)
         event = {
             "type": event_type,
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": now.isoformat(),
             "data": event_data,
             "by_user_id": str(user_id),
             "by_user_name": user_name,
             "by_user_role": user_role
         }
         
-        self.event_timeline.append(event)
-        self.updated_at = datetime.utcnow()
+        self.events.add(CaseSheetEvent(
+            event_type=event_type,
+            timestamp=now,
+            data=event_data,
+            by_user_id=user_id,
+            by_user_name=user_name,
+            by_user_role=user_role,
+        ))
+        self.updated_at = now
+
+        session = object_session(self)
+        if session is not None and inspect(self).persistent:
+            session.execute(
+                update(CaseSheet)
+                .where(CaseSheet.id == self.id)
+                .values(
+                    event_timeline=func.coalesce(
+                        CaseSheet.event_timeline, func.jsonb_build_array()
+                    ).op("||", return_type=JSONB)(bindparam("event", [event], type_=JSONB))
+                )
+                .execution_options(synchronize_session=False)
+            )
+            # Reload on next access instead of holding a stale copy
+            session.expire(self, ["event_timeline"])
+        elif self.event_timeline:
+            self.event_timeline.append(event)
+        else:
+            self.event_timeline = [event]
     
     def __repr__(self):
         return f"<CaseSheet {self.case_number} - Patient: {self.patient_id}>"
@@ -0,0 +1,44 @@
+"""Case sheet event model - one row per timeline event"""
+from sqlalchemy import Column, String, DateTime, ForeignKey, Index
+from sqlalchemy.dialects.postgresql import UUID, JSONB
+from sqlalchemy.orm import relationship
+
+from app.core.database import Base
+from app.core.uuid7 import uuid7
+
+
+class CaseSheetEvent(Base):
+    """
+    A single event in a case sheet timeline.
+
+    Appending an event inserts one row instead of rewriting the case
+    sheet's whole ``event_timeline`` JSONB array, and lookups by type or
+    time can use the indexes below.
+    """
+
+    __tablename__ = "case_sheet_events"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
+    case_sheet_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("case_sheets.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    event_type = Column(String(50), nullable=False)
+    timestamp = Column(DateTime(timezone=True), nullable=False)
+    data = Column(JSONB, nullable=True)
+    by_user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="SET NULL"), nullable=True)
+    by_user_name = Column(String(200), nullable=True)
+    by_user_role = Column(String(50), nullable=True)
+
+    # Relationships
+    case_sheet = relationship("CaseSheet", back_populates="events")
+
+    # Indexes
+    __table_args__ = (
+        Index("ix_case_sheet_events_case_sheet_timestamp", "case_sheet_id", "timestamp"),
+        Index("ix_case_sheet_events_case_sheet_type", "case_sheet_id", "event_type"),
+    )
+
+    def __repr__(self):
+        return f"<CaseSheetEvent {self.event_type} - CaseSheet: {self.case_sheet_id}>"
@@ -1,5 +1,5 @@
 """EMR models for Local and Global EMR"""
-from sqlalchemy import Column, String, DateTime, ForeignKey, Index
+from sqlalchemy import Column, String, DateTime, ForeignKey, Index, Integer, MetaData, Table
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
@@ -81,9 +81,11 @@ class EMRGlobal(Base):
         nullable=True,
         index=True,
     )
+    # hospitals.int_id: emr_global grows with every discharge, so its FK
+    # uses the compact integer key rather than the UUID
     source_hospital_id = Column(
-        UUID(as_uuid=True),
-        ForeignKey("hospitals.id", ondelete="RESTRICT"),
+        Integer,
+        ForeignKey("hospitals.int_id", ondelete="RESTRICT"),
         nullable=False,
         index=True,
     )
@@ -100,7 +102,37 @@ class EMRGlobal(Base):
     # Indexes for global EMR queries
     __table_args__ = (
         Index("ix_emr_global_patient_synced", "patient_id", "synced_at"),
+        # synced_at grows with insertion order: BRIN for time-window scans
+        Index("ix_emr_global_synced_at_brin", "synced_at", postgresql_using="brin"),
     )
 
     def __repr__(self):
         return f"<EMRGlobal {self.record_type} - Patient:{self.patient_id}>"
+
+
+# Materialized views live in their own MetaData so create_all() and
+# autogenerate never try to create them as tables (see migration 016)
+view_metadata = MetaData()
+
+
+class GlobalEMRView(Base):
+    """
+    Read-only per-patient rollup of the global EMR (``mv_global_emr``).
+
+    One row per patient with all synced records grouped by record type:
+    ``records = {"visit_summary": [...], "lab_test": [...], ...}``, oldest
+    first. Refreshed periodically by Celery beat, so reads are a single
+    unique-index lookup instead of scanning and decoding emr_global rows.
+    """
+
+    __table__ = Table(
+        "mv_global_emr",
+        view_metadata,
+        Column("patient_id", UUID(as_uuid=True), primary_key=True),
+        Column("records", JSONB, nullable=False),
+        Column("record_count", Integer, nullable=False),
+        Column("last_synced_at", DateTime(timezone=True), nullable=False),
+    )
+
+    def __repr__(self):
+        return f"<GlobalEMRView Patient:{self.patient_id} ({self.record_count} records)>"
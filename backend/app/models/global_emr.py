@@ -4,9 +4,10 @@ from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 import uuid
-from datetime import datetime
+from datetime import datetime, timezone
 
 from app.core.database import Base
+from app.models.visit_event import VisitEvent
 
 
 class GlobalEMR(Base):
@@ -34,18 +35,15 @@ class GlobalEMR(Base):
         index=True
     )
 
-    # Medical history summary
-    chronic_conditions = Column(JSONB, nullable=True, default=list)  # ["Diabetes Type 2", "Hypertension"]
-    all_diagnoses = Column(JSONB, nullable=True, default=list)  # Historical diagnoses
-    all_procedures = Column(JSONB, nullable=True, default=list)  # All procedures performed
-    all_allergies = Column(JSONB, nullable=True, default=list)  # All known allergies
+    # Hot fields, read on most EMR lookups
+    # Empty defaults are filled in by the database (server_default), so
+    # inserts don't build and ship a '[]' per column per row
+    chronic_conditions = Column(JSONB, nullable=False, server_default="[]")  # ["Diabetes Type 2", "Hypertension"]
+    current_medications = Column(JSONB, nullable=False, server_default="[]")  # Active medications
 
-    # Medication history
-    current_medications = Column(JSONB, nullable=True, default=list)  # Active medications
-    medication_history = Column(JSONB, nullable=True, default=list)  # Past medications
-
-    # Visit history across all hospitals
-    visit_summary = Column(JSONB, nullable=True, default=list)  # Summary of all visits
+    # Append-mostly history in one document (one TOAST fetch instead of seven),
+    # keyed by HISTORY_SECTIONS: {"diagnoses": [...], "procedures": [...], ...}
+    history = Column(JSONB, nullable=False, server_default="{}")
 
     # Family history
     family_history = Column(JSONB, nullable=True)
@@ -53,11 +51,7 @@ class GlobalEMR(Base):
     # Social history
     social_history = Column(JSONB, nullable=True)  # Smoking, alcohol, occupation, etc.
 
-    # Immunization history
-    immunizations = Column(JSONB, nullable=True, default=list)
-
     # Emergency information
-    emergency_contacts = Column(JSONB, nullable=True, default=list)
     advance_directives = Column(Text, nullable=True)
 
     # Metadata
@@ -71,6 +65,61 @@ class GlobalEMR(Base):
     last_updated_by_hospital = relationship("Hospital")
     last_synced_from_visit = relationship("Visit")
 
+    # Containment (@>) lookups across patients, e.g. everyone allergic to X.
+    # jsonb_path_ops only supports @> but is about half the size of the
+    # default GIN opclass
+    __table_args__ = (
+        Index(
+            "ix_global_emr_chronic_conditions_gin",
+            "chronic_conditions",
+            postgresql_using="gin",
+            postgresql_ops={"chronic_conditions": "jsonb_path_ops"},
+        ),
+        Index(
+            "ix_global_emr_current_medications_gin",
+            "current_medications",
+            postgresql_using="gin",
+            postgresql_ops={"current_medications": "jsonb_path_ops"},
+        ),
+        Index(
+            "ix_global_emr_history_gin",
+            "history",
+            postgresql_using="gin",
+            postgresql_ops={"history": "jsonb_path_ops"},
+        ),
+    )
+
+    HISTORY_SECTIONS = (
+        "diagnoses",  # Historical diagnoses
+        "procedures",  # All procedures performed
+        "allergies",  # All known allergies
+        "medication_history",  # Past medications
+        "visit_summary",  # Summary of all visits
+        "immunizations",
+        "emergency_contacts",
+    )
+
+    @classmethod
+    def history_contains(cls, section: str, *entries):
+        """
+        Filter for records whose history section includes all ``entries``.
+
+        Compiles to ``history @> '{"allergies": ["Penicillin"]}'`` so it is
+        answered by the GIN index instead of decoding every row.
+        """
+        return cls.history.contains({section: list(entries)})
+
+    def get_history(self, section: str) -> list:
+        """Entries recorded under one history section"""
+        return (self.history or {}).get(section, [])
+
+    def append_history(self, section: str, *entries):
+        """Append entries to a history section (reassigns so the change is flushed)"""
+        if section not in self.HISTORY_SECTIONS:
+            raise ValueError(f"Unknown GlobalEMR history section: {section}")
+        history = self.history or {}
+        self.history = {**history, section: [*history.get(section, []), *entries]}
+
     def __repr__(self):
         return f"<GlobalEMR Patient: {self.patient_id}>"
 
@@ -102,11 +151,8 @@ class LocalVisitRecord(Base):
     patient_id = Column(UUID(as_uuid=True), ForeignKey("patients.id", ondelete="RESTRICT"), nullable=False, index=True)
     hospital_id = Column(UUID(as_uuid=True), ForeignKey("hospitals.id", ondelete="RESTRICT"), nullable=False, index=True)
 
-    # Visit-specific timeline (chronological log of all events)
-    timeline = Column(JSONB, nullable=True, default=list)
-
     # Daily summaries (one entry per day)
-    daily_summaries = Column(JSONB, nullable=True, default=list)
+    daily_summaries = Column(JSONB, nullable=False, server_default="[]")
 
     # Quick access counts
     total_vitals_recorded = Column(Integer, nullable=False, default=0)
@@ -123,20 +169,25 @@ class LocalVisitRecord(Base):
     visit = relationship("Visit")
     patient = relationship("Patient")
     hospital = relationship("Hospital")
+    # Visit-specific timeline (chronological log of all events), one row
+    # per event; write-only so logging never loads the existing timeline
+    events = relationship(
+        "VisitEvent",
+        primaryjoin="LocalVisitRecord.visit_id == foreign(VisitEvent.visit_id)",
+        lazy="write_only",
+        passive_deletes=True,
+        order_by="VisitEvent.event_timestamp",
+    )
 
     def log_event(self, event_type: str, event_data: dict, timestamp: datetime = None):
         """Add event to timeline"""
-        if not self.timeline:
-            self.timeline = []
-
-        event = {
-            "type": event_type,
-            "timestamp": (timestamp or datetime.utcnow()).isoformat(),
-            "data": event_data
-        }
-
-        self.timeline.append(event)
-        self.updated_at = datetime.utcnow()
+        now = datetime.now(timezone.utc)
+        self.events.add(VisitEvent(
+            event_type=event_type,
+            event_timestamp=timestamp or now,
+            data=event_data,
+        ))
+        self.updated_at = now
 
     def __repr__(self):
         return f"<LocalVisitRecord Visit: {self.visit_id}>"
@@ -1,19 +1,28 @@
 """Hospital model"""
-from sqlalchemy import Column, String, Integer, Boolean, DateTime, ForeignKey, Text
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Column, String, Integer, Boolean, DateTime, ForeignKey, Text, Identity
+from sqlalchemy.dialects.postgresql import UUID, CITEXT
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
+import secrets
 import uuid
 
 from app.core.database import Base
 
 
+def _default_code() -> str:
+    """Generated code for hospitals created without one (e.g. in tests)"""
+    return f"HOSP-{secrets.token_hex(4).upper()}"
+
+
 class Hospital(Base):
     """Hospital facilities within regions"""
 
     __tablename__ = "hospitals"
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    # Compact internal key for joins and new FK columns; ``id`` stays the
+    # public identifier in URLs and tokens
+    int_id = Column(Integer, Identity(), unique=True, nullable=False)
     region_id = Column(
         UUID(as_uuid=True),
         ForeignKey("regions.id", ondelete="RESTRICT"),
@@ -21,11 +30,8 @@ class Hospital(Base):
         index=True,
     )
     name = Column(String(200), nullable=False)
-    # Auto-generate a code if not provided (helps tests that don't set code)
-    def _default_code() -> str:  # type: ignore[override]
-        return f"HOSP-{uuid.uuid4().hex[:8].upper()}"
-
-    code = Column(String(50), unique=True, nullable=False, index=True, default=_default_code)
+    # citext: codes are matched case-insensitively by the unique index itself
+    code = Column(CITEXT, unique=True, nullable=False, index=True, default=_default_code)
     address = Column(Text, nullable=True)
     phone = Column(String(20), nullable=True)
     email = Column(String(100), nullable=True)
@@ -1,6 +1,6 @@
 """Inventory model for supplies tracking"""
-from sqlalchemy import Column, String, Integer, Boolean, Date, DateTime, ForeignKey, Index
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Column, String, Integer, Boolean, Date, DateTime, ForeignKey, Index, Computed, text
+from sqlalchemy.dialects.postgresql import UUID, CITEXT
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 import uuid
@@ -18,15 +18,17 @@ class Inventory(Base):
         UUID(as_uuid=True),
         ForeignKey("hospitals.id", ondelete="RESTRICT"),
         nullable=False,
-        index=True,
     )
     item_type = Column(String(50), nullable=False, index=True)  # medication, supply, reagent, equipment
     item_name = Column(String(200), nullable=False)
-    item_code = Column(String(50), nullable=False)
+    item_code = Column(CITEXT, nullable=False)
     category = Column(String(100), nullable=False, index=True)  # Antibiotics, Bandages, Lab Reagents
     quantity = Column(Integer, nullable=False, default=0)
     unit = Column(String(50), nullable=False)  # tablets, ml, units, pieces
     threshold_alert = Column(Integer, nullable=False, default=10)  # alert when quantity < threshold
+    # Kept by the database so low-stock lookups use the partial index below
+    # instead of comparing two columns on every row
+    low_stock = Column(Boolean, Computed("quantity < threshold_alert", persisted=True))
     expiry_date = Column(Date, nullable=True, index=True)
     location = Column(String(100), nullable=True)  # storage location
     supplier = Column(String(200), nullable=True)
@@ -46,7 +48,7 @@ class Inventory(Base):
     # Indexes for inventory queries and alerts
     __table_args__ = (
         Index("ix_inventory_hospital_code", "hospital_id", "item_code", unique=True),
-        Index("ix_inventory_low_stock", "quantity", "threshold_alert"),
+        Index("ix_inventory_low_stock_partial", "hospital_id", postgresql_where=text("low_stock")),
     )
 
     def __repr__(self):
@@ -1,5 +1,5 @@
 """LabTest model for lab test management"""
-from sqlalchemy import Column, String, DateTime, ForeignKey, Text, Index
+from sqlalchemy import Column, String, DateTime, ForeignKey, Text, Index, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
@@ -63,7 +63,17 @@ class LabTest(Base):
 
     # Index for lab queue queries
     __table_args__ = (
-        Index("ix_lab_test_status_urgency", "status", "urgency", "requested_at"),
+        # Covers the open-work queue (filter on status/urgency, order by
+        # requested_at) including the listed columns, so queue pages can be
+        # served by an index-only scan; completed history is left out
+        Index(
+            "ix_lab_test_queue",
+            "status",
+            "urgency",
+            "requested_at",
+            postgresql_include=["test_type", "patient_id", "assigned_to_id", "visit_id"],
+            postgresql_where=text("status IN ('pending', 'accepted', 'in_progress')"),
+        ),
     )
 
     def __repr__(self):
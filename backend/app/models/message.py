@@ -1,11 +1,13 @@
 """Secure message entity"""
-from sqlalchemy import Column, Text, DateTime, ForeignKey
+from sqlalchemy import Column, DateTime, ForeignKey, Index
 from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.ext.associationproxy import association_proxy
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 import uuid
 
 from app.core.database import Base
+from app.models.message_body import MessageBody
 
 
 class Message(Base):
@@ -14,11 +16,31 @@ class Message(Base):
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     thread_id = Column(UUID(as_uuid=True), ForeignKey("message_threads.id", ondelete="CASCADE"), nullable=False, index=True)
     sender_user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="SET NULL"), nullable=True)
-    content = Column(Text, nullable=False)
     read_at = Column(DateTime(timezone=True), nullable=True)
 
+    # Denormalized from the thread (set when the message is sent) so unread
+    # counts and mark-read filter messages without joining threads/patients
+    recipient_user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="SET NULL"), nullable=True)
+
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
 
     # Relationships
     thread = relationship("MessageThread", back_populates="messages")
-    sender = relationship("User")
+    sender = relationship("User", foreign_keys=[sender_user_id])
+    body = relationship(
+        "MessageBody",
+        uselist=False,
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+    )
+
+    # The text lives in message_bodies; ``Message(content=...)`` and
+    # ``msg.content`` go through the body row
+    content = association_proxy(
+        "body", "content", creator=lambda content: MessageBody(content=content)
+    )
+
+    # Index for unread-message lookups
+    __table_args__ = (
+        Index("ix_messages_recipient_read", "recipient_user_id", "read_at"),
+    )
@@ -0,0 +1,23 @@
+"""Message body model - the text of a secure message"""
+from sqlalchemy import Column, Text, ForeignKey
+from sqlalchemy.dialects.postgresql import UUID
+
+from app.core.database import Base
+
+
+class MessageBody(Base):
+    """
+    The content of a Message, kept 1:1 in its own table.
+
+    Unread counts and inbox lookups only touch the narrow ``messages`` row;
+    the body is loaded when a thread is actually rendered.
+    """
+
+    __tablename__ = "message_bodies"
+
+    message_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("messages.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    content = Column(Text, nullable=False)
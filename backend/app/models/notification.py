@@ -1,15 +1,28 @@
 """Notification model for notification queue"""
-from sqlalchemy import Column, String, Integer, DateTime, ForeignKey, Text, Index
+from datetime import date, timedelta
+from typing import Dict, List
+
+from sqlalchemy import DDL, Column, String, Integer, DateTime, Enum, ForeignKey, Text, Index, event, insert, select, text, update
 from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import Session, raiseload, relationship
 from sqlalchemy.sql import func
 import uuid
 
 from app.core.database import Base
 
+NOTIFICATION_STATUSES = ("pending", "processing", "sent", "delivered", "failed", "cancelled")
+
 
 class Notification(Base):
-    """Notification queue and delivery logs"""
+    """
+    Notification queue and delivery logs.
+
+    The table is range-partitioned by month on ``created_at`` so queue scans
+    and cleanup prune to recent partitions; rows outside the monthly
+    partitions land in ``notifications_default``. The table's primary key
+    is ``(id, created_at)`` as partitioning requires, while the ORM
+    identifies rows by ``id`` alone.
+    """
 
     __tablename__ = "notifications"
 
@@ -25,14 +38,20 @@ class Notification(Base):
     recipient_address = Column(String(255), nullable=False)  # email address, phone number, etc.
     subject = Column(String(255), nullable=True)
     message = Column(Text, nullable=False)
-    status = Column(String(50), nullable=False, default="pending", index=True)  # pending, sent, delivered, failed, cancelled
+    # Native enum: 4 bytes per row on the queue table instead of a varchar
+    status = Column(
+        Enum(*NOTIFICATION_STATUSES, name="notification_status"),
+        nullable=False,
+        default="pending",
+        index=True,
+    )
     sent_at = Column(DateTime(timezone=True), nullable=True)
     delivered_at = Column(DateTime(timezone=True), nullable=True)
     failed_at = Column(DateTime(timezone=True), nullable=True)
     failure_reason = Column(Text, nullable=True)
     retry_count = Column(Integer, nullable=False, default=0)
     max_retries = Column(Integer, nullable=False, default=3)
-    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    created_at = Column(DateTime(timezone=True), primary_key=True, server_default=func.now(), nullable=False)
     updated_at = Column(
         DateTime(timezone=True),
         server_default=func.now(),
@@ -47,7 +66,99 @@ class Notification(Base):
     __table_args__ = (
         Index("ix_notification_status_created", "status", "created_at"),
         Index("ix_notification_recipient_created", "recipient_user_id", "created_at"),
+        # Queue scans only touch pending rows; this stays as small as the
+        # backlog instead of growing with delivered/failed history
+        Index("ix_notification_pending_queue", "created_at", postgresql_where=text("status = 'pending'")),
+        Index(
+            "ix_notification_created_brin",
+            "created_at",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
+        {"postgresql_partition_by": "RANGE (created_at)"},
     )
+    __mapper_args__ = {"primary_key": [id]}
+
+    @classmethod
+    def create_month_partition(cls, session: Session, month: date) -> str:
+        """Create the partition holding ``month`` if it doesn't exist; returns its name"""
+        start = month.replace(day=1)
+        end = (start + timedelta(days=32)).replace(day=1)
+        name = f"{cls.__tablename__}_{start:%Y_%m}"
+        session.execute(text(
+            f"CREATE TABLE IF NOT EXISTS {name} PARTITION OF {cls.__tablename__} "
+            f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+        ))
+        return name
+
+    @classmethod
+    def bulk_create(cls, session: Session, rows: List[Dict]) -> List[uuid.UUID]:
+        """
+        Queue many notifications with a single multi-row INSERT.
+
+        ``rows`` are column dicts; ``id`` and ``status`` are filled in when
+        missing. Ids are generated client-side so they are known without a
+        flush or RETURNING. Returns the ids in row order.
+        """
+        if not rows:
+            return []
+        for row in rows:
+            row.setdefault("id", uuid.uuid4())
+            row.setdefault("status", "pending")
+        session.execute(insert(cls), rows)
+        return [row["id"] for row in rows]
+
+    @classmethod
+    def claim_batch(cls, session: Session, n: int) -> List["Notification"]:
+        """
+        Claim up to ``n`` of the oldest pending notifications for this worker.
+
+        Rows are picked with ``FOR UPDATE SKIP LOCKED`` and flipped to
+        ``processing`` in the same statement, so concurrent workers each
+        get a disjoint batch instead of queueing on the oldest row. The
+        caller must commit to publish the claim, then move each row to
+        ``sent``/``failed`` (or back to ``pending`` to retry).
+
+        Claimed rows carry everything a provider needs (``recipient_address``,
+        ``subject``, ``message``); relationships are set to raise so a lazy
+        load per notification can't creep into the send loop.
+        """
+        claimable = (
+            select(cls.id)
+            .where(cls.status == "pending", cls.retry_count < cls.max_retries)
+            .order_by(cls.created_at)
+            .limit(n)
+            .with_for_update(skip_locked=True)
+        )
+        claimed = session.scalars(
+            update(cls)
+            .where(cls.id.in_(claimable))
+            .values(status="processing", updated_at=func.now())
+            .returning(cls)
+            .options(raiseload("*")),
+            execution_options={"synchronize_session": False},
+        ).all()
+        return sorted(claimed, key=lambda notification: notification.created_at)
+
+    @classmethod
+    def requeue_stale(cls, session: Session, older_than: timedelta) -> int:
+        """Return claims abandoned by a crashed worker to the pending queue"""
+        result = session.execute(
+            update(cls)
+            .where(cls.status == "processing", cls.updated_at < func.now() - older_than)
+            .values(status="pending", updated_at=func.now())
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount
 
     def __repr__(self):
         return f"<Notification {self.notification_type} - {self.status}>"
+
+
+# A partitioned table accepts no rows until it has a partition
+event.listen(
+    Notification.__table__,
+    "after_create",
+    DDL("CREATE TABLE IF NOT EXISTS notifications_default PARTITION OF notifications DEFAULT")
+    .execute_if(dialect="postgresql"),
+)
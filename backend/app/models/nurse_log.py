@@ -24,7 +24,6 @@ class NurseLog(Base):
         UUID(as_uuid=True),
         ForeignKey("visits.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
     nurse_id = Column(
         UUID(as_uuid=True),
@@ -34,7 +33,7 @@ class NurseLog(Base):
     )
     log_type = Column(String(50), nullable=False)  # observation, care_activity, incident, note, handoff
     content = Column(Text, nullable=False)
-    logged_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False, index=True)
+    logged_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
 
     # Relationships
@@ -45,6 +44,14 @@ class NurseLog(Base):
     # Index for timeline queries
     __table_args__ = (
         Index("ix_nurse_log_visit_logged", "visit_id", "logged_at"),
+        # Append-only timestamps: BRIN serves time-range scans at a fraction
+        # of a B-tree's size
+        Index(
+            "ix_nurse_log_logged_brin",
+            "logged_at",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
     )
 
     def __repr__(self):
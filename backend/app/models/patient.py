@@ -69,11 +69,13 @@ class Patient(Base):
     hospital = relationship("Hospital", back_populates="patients")
     hospital_links = relationship("PatientHospital", back_populates="patient", lazy="dynamic")
     visits = relationship("Visit", back_populates="patient", lazy="dynamic")
-    vitals = relationship("Vitals", back_populates="patient", lazy="dynamic")
-    nurse_logs = relationship("NurseLog", back_populates="patient", lazy="dynamic")
     lab_tests = relationship("LabTest", back_populates="patient", lazy="dynamic")
     prescriptions = relationship("Prescription", back_populates="patient", lazy="dynamic")
-    appointments = relationship("Appointment", back_populates="patient", lazy="dynamic")
+    # Queried by patient_id, never walked from a Patient; touching these
+    # without selectinload() raises instead of issuing a query per patient
+    vitals = relationship("Vitals", back_populates="patient", lazy="raise_on_sql")
+    nurse_logs = relationship("NurseLog", back_populates="patient", lazy="raise_on_sql")
+    appointments = relationship("Appointment", back_populates="patient", lazy="raise_on_sql")
     global_emr = relationship("GlobalEMR", back_populates="patient", uselist=False)
 
     # Composite index for patient search
@@ -22,14 +22,12 @@ class PatientHospital(Base):
         UUID(as_uuid=True),
         ForeignKey("patients.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
 
     hospital_id = Column(
         UUID(as_uuid=True),
         ForeignKey("hospitals.id", ondelete="RESTRICT"),
         nullable=False,
-        index=True,
     )
 
     # Medical Record Number - unique PER HOSPITAL (not globally)
@@ -44,7 +42,7 @@ class PatientHospital(Base):
 
     last_visit_date = Column(DateTime(timezone=True), nullable=True, index=True)
 
-    is_active = Column(Boolean, nullable=False, default=True, index=True)
+    is_active = Column(Boolean, nullable=False, default=True)
 
     # Notes about this patient-hospital relationship
     notes = Column(String(500), nullable=True)
@@ -1,5 +1,5 @@
 """Push subscription model for web push notifications"""
-from sqlalchemy import Column, String, DateTime, ForeignKey, Text, Index, Boolean
+from sqlalchemy import Column, String, DateTime, ForeignKey, Text, Index, Boolean, text
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
@@ -40,6 +40,10 @@ class PushSubscription(Base):
     # Indexes
     __table_args__ = (
         Index("ix_push_subscription_user_active", "user_id", "is_active"),
+        # Subscriptions are looked up by endpoint (its own unique index) or
+        # by client key; a narrow expression index on the key replaces a GIN
+        # over the whole subscription object
+        Index("ix_push_sub_p256dh", text("(subscription_data->'keys'->>'p256dh')")),
     )
 
     def __repr__(self):
@@ -1,6 +1,6 @@
 """Region model for multi-tenancy"""
-from sqlalchemy import Column, String, Boolean, DateTime
-from sqlalchemy.dialects.postgresql import UUID, JSONB
+from sqlalchemy import Column, String, Integer, Boolean, DateTime, Identity
+from sqlalchemy.dialects.postgresql import UUID, JSONB, CITEXT
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 import uuid
@@ -14,8 +14,11 @@ class Region(Base):
     __tablename__ = "regions"
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    # Compact internal key for joins and new FK columns; ``id`` stays the
+    # public identifier in URLs and tokens
+    int_id = Column(Integer, Identity(), unique=True, nullable=False)
     name = Column(String(100), unique=True, nullable=False)
-    code = Column(String(20), unique=True, nullable=False, index=True)
+    code = Column(CITEXT, unique=True, nullable=False, index=True)
     theme_settings = Column(JSONB, nullable=True)
     is_active = Column(Boolean, nullable=False, default=True, index=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
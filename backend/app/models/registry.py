@@ -0,0 +1,35 @@
+"""
+Import every model so the mapper registry and Base.metadata are complete.
+
+Imported by Alembic and test setup, and automatically before mappers are
+configured (see app.models).
+"""
+
+from app.models.role import Role
+from app.models.region import Region
+from app.models.hospital import Hospital
+from app.models.user import User
+from app.models.patient import Patient
+from app.models.visit import Visit
+from app.models.bed import Bed
+from app.models.api_key import ApiKey
+from app.models.vitals import Vitals
+from app.models.nurse_log import NurseLog
+from app.models.lab_test import LabTest
+from app.models.prescription import Prescription
+from app.models.appointment import Appointment
+from app.models.inventory import Inventory
+from app.models.emr import EMRLocal, EMRGlobal, GlobalEMRView
+from app.models.notification import Notification
+from app.models.push_subscription import PushSubscription
+from app.models.audit_log import AuditLog
+from app.models.ai_draft import AIDraft
+from app.models.case_sheet import CaseSheet
+from app.models.case_sheet_event import CaseSheetEvent
+from app.models.global_emr import GlobalEMR, LocalVisitRecord
+from app.models.visit_event import VisitEvent
+from app.models.patient_hospital import PatientHospital
+from app.models.message_thread import MessageThread
+from app.models.message import Message
+from app.models.message_body import MessageBody
+
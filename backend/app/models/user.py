@@ -3,6 +3,8 @@ from sqlalchemy import Column, String, Boolean, DateTime, ForeignKey
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
+from functools import cached_property
+import sys
 import uuid
 
 from app.core.database import Base
@@ -53,10 +55,24 @@ class User(Base):
     )
 
     # Relationships
-    role = relationship("Role", lazy="joined")
+    # Loaded on access; auth and list queries ask for it explicitly
+    # (joinedload/selectinload) so other User queries skip the join
+    role = relationship("Role")
     region = relationship("Region", back_populates="users")
     hospital = relationship("Hospital", back_populates="users")
     push_subscriptions = relationship("PushSubscription", back_populates="user", cascade="all, delete-orphan")
 
+    @cached_property
+    def permission_set(self) -> frozenset:
+        """Permissions granted by the user's role (built once per instance)"""
+        if not self.role or not self.role.permissions:
+            return frozenset()
+        # Keys decoded from JSONB are fresh strings; interning them lets
+        # lookups with the (compiler-interned) Permission constants match
+        # by identity before comparing characters
+        return frozenset(
+            sys.intern(name) for name, granted in self.role.permissions.items() if granted
+        )
+
     def __repr__(self):
         return f"<User {self.email}>"
@@ -1,5 +1,5 @@
 """Visit model for hospital admissions"""
-from sqlalchemy import Column, String, Boolean, DateTime, ForeignKey, Text, Index, Integer
+from sqlalchemy import Column, String, Boolean, DateTime, ForeignKey, Text, Index, Integer, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
@@ -24,7 +24,6 @@ class Visit(Base):
         UUID(as_uuid=True),
         ForeignKey("hospitals.id", ondelete="RESTRICT"),
         nullable=False,
-        index=True,
     )
     attending_doctor_id = Column(
         UUID(as_uuid=True),
@@ -60,16 +59,30 @@ class Visit(Base):
     patient = relationship("Patient", back_populates="visits")
     hospital = relationship("Hospital")
     attending_doctor = relationship("User", foreign_keys=[attending_doctor_id])
-    vitals = relationship("Vitals", back_populates="visit", lazy="dynamic", cascade="all, delete-orphan")
-    nurse_logs = relationship("NurseLog", back_populates="visit", lazy="dynamic", cascade="all, delete-orphan")
-    lab_tests = relationship("LabTest", back_populates="visit", lazy="dynamic", cascade="all, delete-orphan")
-    prescriptions = relationship("Prescription", back_populates="visit", lazy="dynamic", cascade="all, delete-orphan")
+    # Vitals and nurse logs grow throughout a stay and are read as "latest N"
+    # queries; they raise if touched without selectinload() so a visit list
+    # can't turn into one query per visit
+    vitals = relationship(
+        "Vitals", back_populates="visit", lazy="raise_on_sql",
+        cascade="all, delete-orphan", passive_deletes=True,
+    )
+    nurse_logs = relationship(
+        "NurseLog", back_populates="visit", lazy="raise_on_sql",
+        cascade="all, delete-orphan", passive_deletes=True,
+    )
+    lab_tests = relationship("LabTest", back_populates="visit", cascade="all, delete-orphan", passive_deletes=True)
+    prescriptions = relationship("Prescription", back_populates="visit", cascade="all, delete-orphan", passive_deletes=True)
     beds = relationship("Bed", back_populates="visit", lazy="dynamic")
 
     # Composite index for patient visit history
     __table_args__ = (
         Index("ix_visit_patient_status", "patient_id", "status"),
         Index("ix_visit_priority_status", "priority", "status"),
+        # Hospital dashboards: visits by status, ordered by priority
+        Index("ix_visit_hosp_status_prio", "hospital_id", "status", "priority"),
+        Index("ix_visit_active_hospital", "hospital_id", "priority", postgresql_where=text("status = 'active'")),
+        # Discharge sync only looks at visits not yet synced
+        Index("ix_visit_sync_pending", "sync_status", postgresql_where=text("is_synced_to_global = false")),
     )
 
     def __repr__(self):
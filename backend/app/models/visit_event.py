@@ -0,0 +1,35 @@
+"""Visit event model - one row per event in a local visit timeline"""
+from sqlalchemy import Column, String, DateTime, ForeignKey, Index
+from sqlalchemy.dialects.postgresql import UUID, JSONB
+
+from app.core.database import Base
+from app.core.uuid7 import uuid7
+
+
+class VisitEvent(Base):
+    """
+    A single event in a visit's local timeline.
+
+    Logging an event is one INSERT; timelines are read (and paginated) by
+    ``(visit_id, event_timestamp)``.
+    """
+
+    __tablename__ = "visit_events"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
+    visit_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("visits.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    event_type = Column(String(50), nullable=False)
+    event_timestamp = Column(DateTime(timezone=True), nullable=False)
+    data = Column(JSONB, nullable=True)
+
+    # Indexes
+    __table_args__ = (
+        Index("ix_visit_events_visit_ts", "visit_id", "event_timestamp"),
+    )
+
+    def __repr__(self):
+        return f"<VisitEvent {self.event_type} - Visit: {self.visit_id}>"
@@ -1,5 +1,5 @@
 """Vitals model for patient vital signs"""
-from sqlalchemy import Column, Integer, Boolean, DateTime, ForeignKey, Text, Index, Numeric, String
+from sqlalchemy import Column, Integer, Boolean, DateTime, ForeignKey, Text, Index, REAL, String
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
@@ -24,7 +24,6 @@ class Vitals(Base):
         UUID(as_uuid=True),
         ForeignKey("visits.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
     recorded_by_id = Column(
         UUID(as_uuid=True),
@@ -32,18 +31,19 @@ class Vitals(Base):
         nullable=False,
         index=True,
     )
-    recorded_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False, index=True)
+    recorded_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
 
-    # Vital signs measurements
-    temperature = Column(Numeric(4, 1), nullable=True)  # Celsius
+    # Vital signs measurements. Measurements are float4 (REAL): ample for
+    # instrument precision, fixed 4 bytes instead of a variable-length NUMERIC
+    temperature = Column(REAL, nullable=True)  # Celsius
     heart_rate = Column(Integer, nullable=True)  # bpm
     blood_pressure_systolic = Column(Integer, nullable=True)  # mmHg
     blood_pressure_diastolic = Column(Integer, nullable=True)  # mmHg
     respiratory_rate = Column(Integer, nullable=True)  # breaths per minute
     spo2 = Column(Integer, nullable=True)  # oxygen saturation percentage
-    weight = Column(Numeric(5, 2), nullable=True)  # kg
-    height = Column(Numeric(5, 2), nullable=True)  # cm
-    bmi = Column(Numeric(4, 2), nullable=True)  # calculated
+    weight = Column(REAL, nullable=True)  # kg
+    height = Column(REAL, nullable=True)  # cm
+    bmi = Column(REAL, nullable=True)  # calculated
 
     notes = Column(Text, nullable=True)
     is_abnormal = Column(Boolean, nullable=False, default=False, index=True)
@@ -69,6 +69,14 @@ class Vitals(Base):
     # Index for timeline queries
     __table_args__ = (
         Index("ix_vitals_visit_recorded", "visit_id", "recorded_at"),
+        # Hospital-wide time-range scans (analytics, early warning); vitals
+        # are appended in time order, so BRIN stays tiny
+        Index(
+            "ix_vitals_recorded_brin",
+            "recorded_at",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
     )
 
     def __repr__(self):
@@ -1,8 +1,12 @@
 """
 Base notification provider interface
 """
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Dict, Any
+from typing import Dict, Any, List, Tuple
+
+# Cap on concurrent sends per provider in send_many
+SEND_CONCURRENCY = 32
 
 
 class NotificationProvider(ABC):
@@ -38,3 +42,31 @@ class NotificationProvider(ABC):
     def get_provider_name(self) -> str:
         """Get provider name"""
         pass
+
+    async def send_many(
+        self,
+        items: List[Tuple[str, str, str, Dict[str, Any]]],
+    ) -> List[Dict[str, Any]]:
+        """
+        Send several notifications concurrently.
+
+        ``items`` are ``(recipient, subject, message, metadata)`` tuples;
+        results come back in the same order, in ``send``'s format. At most
+        SEND_CONCURRENCY sends are in flight at once.
+        """
+        semaphore = asyncio.Semaphore(SEND_CONCURRENCY)
+
+        async def send_one(item):
+            async with semaphore:
+                return await self.send(*item)
+
+        results = await asyncio.gather(*(send_one(item) for item in items), return_exceptions=True)
+        return [
+            {"success": False, "error": str(result), "provider": self.get_provider_name()}
+            if isinstance(result, Exception) else result
+            for result in results
+        ]
+
+    async def aclose(self) -> None:
+        """Release connections held between sends (no-op by default)"""
+        return None
@@ -2,14 +2,53 @@
 Email notification provider using SMTP (Gmail free service)
 """
 import os
+import asyncio
+import base64
 import logging
+import secrets
+from string import Template
 from typing import Dict, Any
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
+from email.header import Header
 from .base import NotificationProvider
 
 logger = logging.getLogger(__name__)
 
+# multipart/alternative with a text and an HTML part, both UTF-8 base64 -
+# the same wire format MIMEMultipart + MIMEText produce, without building
+# the object graph per message. Base64 lines never start with "--", so a
+# fixed boundary can't collide with a body.
+_MESSAGE_TEMPLATE = Template(
+    "From: $sender\r\n"
+    "To: $recipient\r\n"
+    "Subject: $subject\r\n"
+    "MIME-Version: 1.0\r\n"
+    'Content-Type: multipart/alternative; boundary="$boundary"\r\n'
+    "\r\n"
+    "--$boundary\r\n"
+    'Content-Type: text/plain; charset="utf-8"\r\n'
+    "Content-Transfer-Encoding: base64\r\n"
+    "\r\n"
+    "$text\r\n"
+    "--$boundary\r\n"
+    'Content-Type: text/html; charset="utf-8"\r\n'
+    "Content-Transfer-Encoding: base64\r\n"
+    "\r\n"
+    "$html\r\n"
+    "--$boundary--\r\n"
+)
+
+
+def _header_value(value: str) -> str:
+    """Single-line header value; RFC 2047-encoded when not plain ASCII"""
+    value = " ".join(value.splitlines())
+    if value.isascii():
+        return value
+    return Header(value, "utf-8").encode()
+
+
+def _base64_body(value: str) -> str:
+    return base64.encodebytes(value.encode("utf-8")).decode("ascii").rstrip("\n").replace("\n", "\r\n")
+
 
 class EmailProvider(NotificationProvider):
     """
@@ -30,6 +69,66 @@ class EmailProvider(NotificationProvider):
         self.smtp_password = os.getenv("SMTP_PASSWORD")
         self.from_email = os.getenv("SMTP_FROM_EMAIL", self.smtp_user or "noreply@hospital.com")
         self.use_tls = os.getenv("SMTP_USE_TLS", "true").lower() == "true"
+        # Per-provider constants of every message this provider sends
+        self._template = Template(_MESSAGE_TEMPLATE.safe_substitute(
+            sender=_header_value(self.from_email).replace("$", "$$"),
+            boundary=f"=_{secrets.token_hex(16)}",
+        ))
+        # One SMTP connection reused across sends (TLS handshake and AUTH
+        # once per batch, not per email); created on first send because it
+        # belongs to the running event loop
+        self._client = None
+        self._client_lock = None
+
+    async def _smtp_client(self):
+        """Connected, logged-in SMTP client, (re)connecting as needed"""
+        import aiosmtplib
+
+        if self._client is None or not self._client.is_connected:
+            self._client = aiosmtplib.SMTP(
+                hostname=self.smtp_host,
+                port=self.smtp_port,
+                username=self.smtp_user,
+                password=self.smtp_password,
+                use_tls=self.use_tls,
+            )
+            await self._client.connect()
+        return self._client
+
+    async def _sendmail(self, recipient: str, raw: bytes) -> None:
+        import aiosmtplib
+
+        if self._client_lock is None:
+            self._client_lock = asyncio.Lock()
+        # SMTP is one transaction at a time per connection
+        async with self._client_lock:
+            try:
+                client = await self._smtp_client()
+                await client.sendmail(self.from_email, [recipient], raw)
+            except aiosmtplib.SMTPServerDisconnected:
+                # Server dropped an idle connection; reconnect once
+                self._client = None
+                client = await self._smtp_client()
+                await client.sendmail(self.from_email, [recipient], raw)
+
+    async def aclose(self) -> None:
+        """QUIT the shared SMTP connection"""
+        client, self._client = self._client, None
+        if client is not None and client.is_connected:
+            try:
+                await client.quit()
+            except Exception as e:
+                logger.debug(f"[EMAIL] Error closing SMTP connection: {e}")
+                client.close()
+
+    def build_message(self, recipient: str, subject: str, message: str) -> bytes:
+        """Raw RFC 5322 bytes for a text + HTML email"""
+        return self._template.substitute(
+            recipient=_header_value(recipient),
+            subject=_header_value(subject),
+            text=_base64_body(message),
+            html=_base64_body(f"<pre>{message}</pre>"),
+        ).encode("ascii")
 
     async def send(
         self,
@@ -53,30 +152,9 @@ class EmailProvider(NotificationProvider):
             }
 
         try:
-            # Use aiosmtplib for async SMTP (install: pip install aiosmtplib)
-            import aiosmtplib
-            
-            # Create message
-            msg = MIMEMultipart("alternative")
-            msg["From"] = self.from_email
-            msg["To"] = recipient
-            msg["Subject"] = subject
-            
-            # Create plain text and HTML versions
-            text_part = MIMEText(message, "plain")
-            html_part = MIMEText(f"<pre>{message}</pre>", "html")
-            msg.attach(text_part)
-            msg.attach(html_part)
-            
-            # Send email
-            await aiosmtplib.send(
-                msg,
-                hostname=self.smtp_host,
-                port=self.smtp_port,
-                username=self.smtp_user,
-                password=self.smtp_password,
-                use_tls=self.use_tls,
-            )
+            # Send email (plain text and HTML versions) over the shared
+            # aiosmtplib connection (install: pip install aiosmtplib)
+            await self._sendmail(recipient, self.build_message(recipient, subject, message))
             
             logger.info(f"[EMAIL] Successfully sent to {recipient}: {subject}")
             return {
@@ -3,13 +3,22 @@ Web Push notification provider for mobile notifications (works when app is close
 Sends push notifications to mobile browsers even when the web app is not open
 """
 import os
+import time
 import logging
 import json
-from typing import Dict, Any
-from .base import NotificationProvider
+from typing import Dict, Any, Tuple
+from urllib.parse import urlsplit
+from .base import NotificationProvider, SEND_CONCURRENCY
 
 logger = logging.getLogger(__name__)
 
+# VAPID JWTs are signed per push-service origin and reused until close to
+# expiry (push services accept up to 24h)
+VAPID_TOKEN_TTL = 12 * 60 * 60
+VAPID_TOKEN_REFRESH_MARGIN = 60 * 60
+# Seconds the push service keeps an undelivered message
+PUSH_TTL = 60
+
 
 class PushProvider(NotificationProvider):
     """
@@ -17,6 +26,10 @@ class PushProvider(NotificationProvider):
     Sends push notifications to subscribed devices
     Works even when web app is closed
 
+    Payloads are encrypted (aes128gcm) with pywebpush's WebPusher and POSTed
+    with a shared httpx.AsyncClient. The VAPID key is parsed once and each
+    push service origin's Authorization header is signed once and reused.
+
     Setup:
     1. Generate VAPID keys: python -c "from pywebpush import webpush; import os; print(webpush.generate_vapid_keys())"
     2. Add keys to .env: VAPID_PUBLIC_KEY and VAPID_PRIVATE_KEY
@@ -27,6 +40,48 @@ class PushProvider(NotificationProvider):
         self.vapid_private_key = os.getenv("VAPID_PRIVATE_KEY")
         self.vapid_public_key = os.getenv("VAPID_PUBLIC_KEY")
         self.vapid_email = os.getenv("VAPID_EMAIL", "noreply@hospital.com")
+        self._vapid = None
+        # origin -> (Authorization headers, expiry timestamp)
+        self._vapid_headers_cache: Dict[str, Tuple[Dict[str, str], float]] = {}
+        self._http = None
+
+    def _vapid_headers(self, endpoint: str) -> Dict[str, str]:
+        """Signed VAPID Authorization header for the endpoint's origin"""
+        from py_vapid import Vapid
+
+        parts = urlsplit(endpoint)
+        origin = f"{parts.scheme}://{parts.netloc}"
+        now = time.time()
+        cached = self._vapid_headers_cache.get(origin)
+        if cached and cached[1] - now > VAPID_TOKEN_REFRESH_MARGIN:
+            return cached[0]
+
+        if self._vapid is None:
+            self._vapid = Vapid.from_string(private_key=self.vapid_private_key)
+        expiry = int(now) + VAPID_TOKEN_TTL
+        headers = self._vapid.sign({
+            "sub": f"mailto:{self.vapid_email}",
+            "aud": origin,
+            "exp": expiry,
+        })
+        self._vapid_headers_cache[origin] = (headers, expiry)
+        return headers
+
+    def _client(self):
+        import httpx
+
+        if self._http is None:
+            self._http = httpx.AsyncClient(
+                timeout=10.0,
+                limits=httpx.Limits(max_connections=SEND_CONCURRENCY),
+            )
+        return self._http
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP client"""
+        client, self._http = self._http, None
+        if client is not None:
+            await client.aclose()
 
     async def send(
         self,
@@ -49,11 +104,12 @@ class PushProvider(NotificationProvider):
             }
 
         try:
-            # Use pywebpush to send notification
-            from pywebpush import webpush, WebPushException
+            # pywebpush encrypts the payload; delivery goes through httpx
+            from pywebpush import WebPusher
 
             # Parse subscription info
             subscription_info = json.loads(recipient)
+            endpoint = subscription_info["endpoint"]
 
             # Prepare notification payload
             notification_data = {
@@ -67,16 +123,20 @@ class PushProvider(NotificationProvider):
                 }
             }
 
-            # Send push notification
-            response = webpush(
-                subscription_info=subscription_info,
-                data=json.dumps(notification_data),
-                vapid_private_key=self.vapid_private_key,
-                vapid_claims={
-                    "sub": f"mailto:{self.vapid_email}",
-                    "aud": subscription_info.get("endpoint", "").split("/")[2] if subscription_info.get("endpoint") else None
-                }
+            encoded = WebPusher(subscription_info).encode(
+                json.dumps(notification_data), content_encoding="aes128gcm"
             )
+            headers = {
+                **self._vapid_headers(endpoint),
+                "TTL": str(PUSH_TTL),
+                "Content-Type": "application/octet-stream",
+                "Content-Encoding": "aes128gcm",
+            }
+
+            # Send push notification
+            response = await self._client().post(endpoint, content=encoded["body"], headers=headers)
+            if response.status_code > 202:
+                raise RuntimeError(f"Push service returned {response.status_code}: {response.text[:200]}")
 
             logger.info(f"[PUSH] Successfully sent push notification: {subject}")
             return {
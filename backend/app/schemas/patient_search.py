@@ -1,8 +1,8 @@
 """Global patient search Pydantic schemas"""
-from typing import Optional, List, Dict
+from typing import Any, Optional, List, Dict
 from uuid import UUID
 from pydantic import BaseModel, Field
-from datetime import date
+from datetime import date, datetime
 
 
 class GlobalPatientSearchRequest(BaseModel):
@@ -34,6 +34,17 @@ class GlobalPatientSearchResponse(BaseModel):
         from_attributes = True
 
 
+class GlobalEMRResponse(BaseModel):
+    """Schema for a patient's global EMR, grouped by record type"""
+    patient_id: UUID
+    records: Dict[str, List[Dict[str, Any]]]
+    record_count: int
+    last_synced_at: datetime
+
+    class Config:
+        from_attributes = True
+
+
 class PatientHospitalCreate(BaseModel):
     """Schema for creating patient-hospital link"""
     patient_id: UUID
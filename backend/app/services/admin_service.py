@@ -1,7 +1,7 @@
 """Admin service for Super Admin operations"""
 from typing import Optional, List, Dict, Any
 from uuid import UUID
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, selectinload
 from sqlalchemy import func, case, and_
 from fastapi import HTTPException, status
 
@@ -113,7 +113,16 @@ class AdminService:
 
         # Apply pagination
         offset = (page - 1) * page_size
-        users = query.offset(offset).limit(page_size).all()
+        users = (
+            query.options(
+                selectinload(User.role),
+                selectinload(User.region),
+                selectinload(User.hospital),
+            )
+            .offset(offset)
+            .limit(page_size)
+            .all()
+        )
 
         # Convert to response schema
         user_responses = []
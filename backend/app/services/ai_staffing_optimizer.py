@@ -13,7 +13,7 @@ Solves the problem of staff mis-allocation and inefficient scheduling.
 from datetime import datetime, timedelta, time
 from typing import Dict, List, Optional
 from uuid import UUID
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, selectinload
 from sqlalchemy import and_, func
 
 from app.models import User, Hospital, Visit, Bed
@@ -273,7 +273,7 @@ class AIStaffingOptimizer:
 
     def _get_available_staff(self, hospital_id: UUID, date: datetime, department: Optional[str] = None) -> List[Dict]:
         """Get available staff for a given date"""
-        query = self.db.query(User).filter(
+        query = self.db.query(User).options(selectinload(User.role)).filter(
             and_(
                 User.hospital_id == hospital_id,
                 User.role.has(name__in=["doctor", "nurse", "lab_tech"])
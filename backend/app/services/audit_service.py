@@ -64,7 +64,13 @@ class AuditService:
     def get_audit_logs(
         self, filters: Optional[AuditLogFilters] = None, page: int = 1, page_size: int = 50
     ) -> PaginatedAuditLogs:
-        """Get paginated audit logs with filters"""
+        """
+        Get paginated audit logs with filters.
+
+        Rows are read as plain column tuples with the acting user's name and
+        email outer-joined in, so a page costs one query and no ORM instances
+        (no per-row identity-map state or lazy ``log.user`` loads).
+        """
         query = self.db.query(AuditLog)
 
         # Apply filters
@@ -82,41 +88,53 @@ class AuditService:
             if filters.end_date:
                 query = query.filter(AuditLog.created_at <= filters.end_date)
 
-        # Order by most recent first
-        query = query.order_by(AuditLog.created_at.desc())
-
         # Get total count
         total = query.count()
 
-        # Apply pagination
+        # Apply pagination, most recent first
         offset = (page - 1) * page_size
-        audit_logs = query.offset(offset).limit(page_size).all()
+        rows = (
+            query.outerjoin(User, User.id == AuditLog.user_id)
+            .with_entities(
+                AuditLog.id,
+                AuditLog.user_id,
+                AuditLog.action,
+                AuditLog.resource_type,
+                AuditLog.resource_id,
+                AuditLog.before_state,
+                AuditLog.after_state,
+                AuditLog.ip_address,
+                AuditLog.user_agent,
+                AuditLog.notes,
+                AuditLog.created_at,
+                User.email,
+                User.first_name,
+                User.last_name,
+            )
+            .order_by(AuditLog.created_at.desc())
+            .offset(offset)
+            .limit(page_size)
+            .all()
+        )
 
         # Convert to response schema
-        log_responses = []
-        for log in audit_logs:
-            user_email = None
-            user_name = None
-            if log.user:
-                user_email = log.user.email
-                user_name = f"{log.user.first_name} {log.user.last_name}"
-
-            log_responses.append(
-                AuditLogResponse(
-                    id=log.id,
-                    user_id=log.user_id,
-                    user_email=user_email,
-                    user_name=user_name,
-                    action=log.action,
-                    resource_type=log.resource_type,
-                    resource_id=log.resource_id,
-                    before_state=log.before_state,
-                    after_state=log.after_state,
-                    ip_address=str(log.ip_address) if log.ip_address else None,
-                    user_agent=log.user_agent,
-                    notes=log.notes,
-                    created_at=log.created_at,
-                )
+        log_responses = [
+            AuditLogResponse(
+                id=row.id,
+                user_id=row.user_id,
+                user_email=row.email,
+                user_name=f"{row.first_name} {row.last_name}" if row.email else None,
+                action=row.action,
+                resource_type=row.resource_type,
+                resource_id=row.resource_id,
+                before_state=row.before_state,
+                after_state=row.after_state,
+                ip_address=str(row.ip_address) if row.ip_address else None,
+                user_agent=row.user_agent,
+                notes=row.notes,
+                created_at=row.created_at,
             )
+            for row in rows
+        ]
 
         return PaginatedAuditLogs(logs=log_responses, total=total, page=page, page_size=page_size)
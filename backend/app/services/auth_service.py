@@ -1,6 +1,6 @@
 """Authentication service"""
 from typing import Optional, Tuple
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload
 from fastapi import HTTPException, status
 from datetime import datetime
 import pyotp
@@ -219,7 +219,8 @@ class AuthService:
                 headers={"WWW-Authenticate": "Bearer"},
             )
 
-        user = self.db.query(User).filter(
+        # Role is read on every authenticated request; load it in the same query
+        user = self.db.query(User).options(joinedload(User.role)).filter(
             User.id == user_id,
             User.is_active == True,
             User.is_deleted == False
@@ -2,9 +2,13 @@
 EMR synchronization service - Local → Global
 Merges visit data, vitals, lab tests, and prescriptions to Global EMR
 """
+from typing import Optional
+from sqlalchemy import select, text
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
 from app.models.visit import Visit
-from app.models.emr import EMRLocal, EMRGlobal
+from app.models.hospital import Hospital
+from app.models.emr import EMRLocal, EMRGlobal, GlobalEMRView
 from app.models.vitals import Vitals
 from app.models.lab_test import LabTest
 from app.models.prescription import Prescription
@@ -146,6 +150,32 @@ class EMRSyncService:
             "prescriptions_synced": len(prescriptions),
         }
 
+    def refresh_global_emr_view(self) -> bool:
+        """
+        Refresh the mv_global_emr rollup (run periodically by Celery beat).
+
+        CONCURRENTLY keeps the view readable during the refresh. A failure
+        only leaves reads stale until the next run, so it is logged rather
+        than raised.
+        """
+        try:
+            self.db.execute(text("REFRESH MATERIALIZED VIEW CONCURRENTLY mv_global_emr"))
+            self.db.commit()
+            return True
+        except SQLAlchemyError as e:
+            self.db.rollback()
+            logger.warning(f"Failed to refresh mv_global_emr: {e}")
+            return False
+
+    def get_global_emr(self, patient_id: UUID) -> Optional[GlobalEMRView]:
+        """Patient's global EMR records grouped by type (as of the last refresh)"""
+        return self.db.get(GlobalEMRView, patient_id)
+
+    @staticmethod
+    def _hospital_int_id(hospital_id: UUID):
+        """hospitals.int_id for a hospital UUID, resolved inside the INSERT"""
+        return select(Hospital.int_id).where(Hospital.id == hospital_id).scalar_subquery()
+
     def _create_global_visit_record(self, visit: Visit) -> bool:
         """Create global EMR record for visit summary"""
         # Check for duplicate
@@ -182,7 +212,7 @@ class EMRSyncService:
         record = EMRGlobal(
             patient_id=visit.patient_id,
             visit_id=visit.id,
-            source_hospital_id=visit.hospital_id,
+            source_hospital_id=self._hospital_int_id(visit.hospital_id),
             record_type="visit_summary",
             data={
                 "admission_date": visit.admission_date.isoformat() if visit.admission_date else None,
@@ -216,7 +246,7 @@ class EMRSyncService:
         record = EMRGlobal(
             patient_id=patient_id,
             visit_id=vital.visit_id,
-            source_hospital_id=vital.visit.hospital_id,
+            source_hospital_id=self._hospital_int_id(vital.visit.hospital_id),
             record_type="vitals",
             data={
                 "recorded_at": vital.recorded_at.isoformat(),
@@ -265,7 +295,7 @@ class EMRSyncService:
         record = EMRGlobal(
             patient_id=patient_id,
             visit_id=test.visit_id,
-            source_hospital_id=test.visit.hospital_id,
+            source_hospital_id=self._hospital_int_id(test.visit.hospital_id),
             record_type="lab_test",
             data={
                 "test_id": str(test.id),
@@ -299,7 +329,7 @@ class EMRSyncService:
         record = EMRGlobal(
             patient_id=patient_id,
             visit_id=prescription.visit_id,
-            source_hospital_id=prescription.visit.hospital_id,
+            source_hospital_id=self._hospital_int_id(prescription.visit.hospital_id),
             record_type="prescription",
             data={
                 "prescription_id": str(prescription.id),
@@ -337,7 +367,7 @@ class EMRSyncService:
         record = EMRGlobal(
             patient_id=local_record.patient_id,
             visit_id=local_record.visit_id,
-            source_hospital_id=local_record.hospital_id,
+            source_hospital_id=self._hospital_int_id(local_record.hospital_id),
             record_type=local_record.record_type,
             data=local_record.data,
         )
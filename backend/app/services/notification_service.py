@@ -60,63 +60,61 @@ class NotificationService:
         
         Returns list of created notification IDs
         """
-        notification_ids = []
-        
-        if not user or not user.email:
-            return notification_ids
-        
-        # 1. Create in-app notification (web app pop-up)
-        in_app_notification = Notification(
-            recipient_user_id=user.id,
-            notification_type=notification_type,
-            channel="in_app",
-            recipient_address=str(user.id),
-            subject=subject,
-            message=message,
-            status="pending",
-        )
-        self.db.add(in_app_notification)
-        self.db.flush()
-        notification_ids.append(in_app_notification.id)
-        
-        # 2. Create email notification
-        email_notification = Notification(
-            recipient_user_id=user.id,
-            notification_type=notification_type,
-            channel="email",
-            recipient_address=user.email,
-            subject=subject,
-            message=message,
-            status="pending",
-        )
-        self.db.add(email_notification)
-        self.db.flush()
-        notification_ids.append(email_notification.id)
-        
-        # 3. Create push notifications for all subscribed devices
+        return self._fanout_notifications([user], notification_type, subject, message, metadata)
+
+    def _fanout_notifications(
+        self,
+        users: list[User],
+        notification_type: str,
+        subject: str,
+        message: str,
+        metadata: dict = None
+    ) -> list[UUID]:
+        """
+        Multi-channel notifications for several users at once.
+
+        Push subscriptions for all users are read in one query and every
+        notification goes out in one multi-row INSERT, so notifying N staff
+        costs the same round trips as notifying one.
+        """
+        users = [user for user in users if user and user.email]
+        if not users:
+            return []
+
+        def row(user: User, channel: str, recipient_address: str) -> dict:
+            return {
+                "recipient_user_id": user.id,
+                "notification_type": notification_type,
+                "channel": channel,
+                "recipient_address": recipient_address,
+                "subject": subject,
+                "message": message,
+            }
+
+        # 1. In-app notification (web app pop-up)
+        # 2. Email notification
+        rows = []
+        for user in users:
+            rows.append(row(user, "in_app", str(user.id)))
+            rows.append(row(user, "email", user.email))
+
+        # 3. Push notifications for all subscribed devices
+        users_by_id = {user.id: user for user in users}
         push_subscriptions = (
-            self.db.query(PushSubscription)
+            self.db.query(PushSubscription.user_id, PushSubscription.subscription_data)
             .filter(
-                PushSubscription.user_id == user.id,
+                PushSubscription.user_id.in_(users_by_id),
                 PushSubscription.is_active == True
             )
             .all()
         )
-        
-        for subscription in push_subscriptions:
-            push_notification = Notification(
-                recipient_user_id=user.id,
-                notification_type=notification_type,
-                channel="push",
-                recipient_address=str(subscription.subscription_data),  # Full subscription JSON
-                subject=subject,
-                message=message,
-                status="pending",
-            )
-            self.db.add(push_notification)
-            self.db.flush()
-            notification_ids.append(push_notification.id)
-        
+        rows.extend(
+            row(users_by_id[subscription.user_id], "push", str(subscription.subscription_data))  # Full subscription JSON
+            for subscription in push_subscriptions
+        )
+
+        notification_ids = Notification.bulk_create(self.db, rows)
+
         # Commit to database
         self.db.commit()
         
@@ -382,14 +380,12 @@ Best regards,
 Hospital Automation System
         """.strip()
 
-        for admin in admins:
-            ids = self._create_multi_channel_notifications(
-                admin,
-                "discharge_complete",
-                subject,
-                message
-            )
-            notification_ids.extend(ids)
+        notification_ids = self._fanout_notifications(
+            admins,
+            "discharge_complete",
+            subject,
+            message
+        )
 
         self.db.commit()
 
@@ -563,15 +559,13 @@ Respond immediately!
             body_lines.append(f"- {it['item_name']}: {it['quantity']} {it.get('unit','')} remaining")
         message = "\n".join(body_lines)
 
-        for user in recipients:
-            ids = self._create_multi_channel_notifications(
-                user,
-                "inventory_low_stock",
-                subject,
-                message,
-                {"hospital_id": str(hospital_id)}
-            )
-            notification_ids.extend(ids)
+        notification_ids = self._fanout_notifications(
+            recipients,
+            "inventory_low_stock",
+            subject,
+            message,
+            {"hospital_id": str(hospital_id)}
+        )
 
         self.db.commit()
         return notification_ids
@@ -611,15 +605,13 @@ Respond immediately!
             body_lines.append(f"- {it['item_name']} (expires {it['expiry_date']})")
         message = "\n".join(body_lines)
 
-        for user in recipients:
-            ids = self._create_multi_channel_notifications(
-                user,
-                "inventory_expiring",
-                subject,
-                message,
-                {"hospital_id": str(hospital_id)}
-            )
-            notification_ids.extend(ids)
+        notification_ids = self._fanout_notifications(
+            recipients,
+            "inventory_expiring",
+            subject,
+            message,
+            {"hospital_id": str(hospital_id)}
+        )
 
         self.db.commit()
         return notification_ids
@@ -4,6 +4,8 @@ Uses HTML template that can be converted to PDF via browser or headless chrome
 """
 from sqlalchemy.orm import Session
 from app.models.visit import Visit
+from app.models.vitals import Vitals
+from app.models.nurse_log import NurseLog
 from app.services.file_storage_service import FileStorageService
 from jinja2 import Template
 from datetime import datetime
@@ -42,10 +44,22 @@ class PDFService:
         region = hospital.region
 
         # Get related data (latest records)
-        vitals = list(visit.vitals.order_by(Visit.vitals.property.mapper.class_.recorded_at.desc()).limit(5))
+        vitals = (
+            self.db.query(Vitals)
+            .filter(Vitals.visit_id == visit.id)
+            .order_by(Vitals.recorded_at.desc())
+            .limit(5)
+            .all()
+        )
         lab_tests = [test for test in visit.lab_tests if test.status == "completed"]
-        prescriptions = list(visit.prescriptions.all())
-        nurse_logs = list(visit.nurse_logs.order_by(Visit.nurse_logs.property.mapper.class_.logged_at.desc()).limit(10))
+        prescriptions = list(visit.prescriptions)
+        nurse_logs = (
+            self.db.query(NurseLog)
+            .filter(NurseLog.visit_id == visit.id)
+            .order_by(NurseLog.logged_at.desc())
+            .limit(10)
+            .all()
+        )
 
         # Render HTML from template
         html_content = self._render_template({
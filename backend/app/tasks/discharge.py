@@ -33,7 +33,8 @@ class DatabaseTask(Task):
             self._db = None
 
 
-@celery_app.task(bind=True, base=DatabaseTask, max_retries=3, default_retry_delay=60)
+# Result kept: the discharge endpoint returns this task's id for polling
+@celery_app.task(bind=True, base=DatabaseTask, max_retries=3, default_retry_delay=60, ignore_result=False)
 def autosync_discharge(self, visit_id: str):
     """
     Automatically sync Local EMR to Global EMR on discharge
@@ -136,3 +137,14 @@ def autosync_discharge(self, visit_id: str):
         logger.error(f"Error in autosync_discharge for visit {visit_id}: {str(e)}")
         # Retry with exponential backoff
         raise self.retry(exc=e)
+
+
+@celery_app.task(bind=True, base=DatabaseTask)
+def refresh_global_emr_view(self):
+    """
+    Refresh the mv_global_emr rollup (Celery beat).
+
+    Runs on a schedule instead of after every discharge, so one refresh of
+    the whole view covers all syncs since the previous run.
+    """
+    return {"refreshed": EMRSyncService(self.db).refresh_global_emr_view()}
@@ -5,6 +5,7 @@ Celery periodic tasks for inventory monitoring:
 """
 from celery import shared_task
 from datetime import datetime, timedelta
+from typing import Optional
 from sqlalchemy.orm import Session
 from app.core.database import SessionLocal
 from app.models.inventory import Inventory
@@ -23,9 +24,11 @@ def _group_by_hospital(items):
 
 
 @shared_task(name="inventory_check_low_stock")
-def inventory_check_low_stock(threshold: int = 10):
+def inventory_check_low_stock(threshold: Optional[int] = None):
     """
     Scan inventory for items below threshold and notify pharmacist/manager.
+
+    Without an explicit threshold each item's own threshold_alert applies.
     """
     db: Session = SessionLocal()
     try:
@@ -34,7 +37,7 @@ def inventory_check_low_stock(threshold: int = 10):
             .filter(
                 Inventory.item_type == "medication",
                 Inventory.is_active == True,
-                Inventory.quantity < threshold,
+                Inventory.low_stock if threshold is None else Inventory.quantity < threshold,
             )
             .all()
         )
@@ -3,18 +3,23 @@ Celery task for sending notifications
 Processes pending notifications and sends them via appropriate channels
 """
 from celery import shared_task
-from sqlalchemy.orm import Session
+from sqlalchemy import func
+from sqlalchemy.orm import Session, raiseload
 from app.core.database import SessionLocal
 from app.models.notification import Notification
 from app.notifications.email_provider import EmailProvider
 from app.notifications.push_provider import PushProvider
 from app.notifications.in_app_provider import InAppProvider
-from datetime import datetime
+from datetime import datetime, timedelta
 import logging
 import asyncio
 
 logger = logging.getLogger(__name__)
 
+NOTIFICATION_BATCH_SIZE = 100
+# Claims older than this belong to a worker that died mid-batch
+STALE_CLAIM_AFTER = timedelta(minutes=10)
+
 
 def get_provider(channel: str):
     """Get notification provider based on channel"""
@@ -28,25 +33,61 @@ def get_provider(channel: str):
         raise ValueError(f"Unknown notification channel: {channel}")
 
 
+def _send_args(notification: Notification) -> tuple:
+    """(recipient, subject, message, metadata) for NotificationProvider.send"""
+    return (
+        notification.recipient_address,
+        notification.subject or "",
+        notification.message,
+        {
+            "notification_type": notification.notification_type,
+            "notification_id": str(notification.id)
+        },
+    )
+
+
 async def send_notification_async(notification: Notification) -> bool:
     """Send a single notification via its channel"""
+    provider = None
     try:
         provider = get_provider(notification.channel)
-
-        result = await provider.send(
-            recipient=notification.recipient_address,
-            subject=notification.subject or "",
-            message=notification.message,
-            metadata={
-                "notification_type": notification.notification_type,
-                "notification_id": str(notification.id)
-            }
-        )
-
+        result = await provider.send(*_send_args(notification))
         return result.get("success", False)
     except Exception as e:
         logger.error(f"Failed to send notification {notification.id}: {e}")
         return False
+    finally:
+        if provider is not None:
+            await provider.aclose()
+
+
+async def send_batch_async(notifications: list) -> list:
+    """
+    Send a batch in one event loop; returns per-notification success.
+
+    Each channel gets one provider whose send_many() sends its share of the
+    batch concurrently; channels run side by side.
+    """
+    results = [False] * len(notifications)
+    by_channel = {}
+    for index, notification in enumerate(notifications):
+        by_channel.setdefault(notification.channel, []).append(index)
+
+    async def send_channel(channel: str, indexes: list):
+        try:
+            provider = get_provider(channel)
+        except ValueError as e:
+            logger.error(f"Failed to send {len(indexes)} notifications: {e}")
+            return
+        try:
+            sent = await provider.send_many([_send_args(notifications[i]) for i in indexes])
+        finally:
+            await provider.aclose()
+        for index, result in zip(indexes, sent):
+            results[index] = result.get("success", False)
+
+    await asyncio.gather(*(send_channel(channel, indexes) for channel, indexes in by_channel.items()))
+    return results
 
 
 @shared_task(name="send_pending_notifications", bind=True, max_retries=3)
@@ -54,20 +95,22 @@ def send_pending_notifications(self):
     """
     Process all pending notifications and send them
     This task runs continuously or on schedule to ensure all notifications are sent
+
+    Batches are claimed with FOR UPDATE SKIP LOCKED (see
+    Notification.claim_batch), so several workers can drain the queue in
+    parallel without sending the same notification twice.
     """
-    db = SessionLocal()
+    # Claimed rows stay loaded across the claim commit instead of being
+    # re-selected one by one when the batch is sent
+    db = SessionLocal(expire_on_commit=False)
     try:
-        # Get all pending notifications
-        pending = (
-            db.query(Notification)
-            .filter(
-                Notification.status == "pending",
-                Notification.retry_count < Notification.max_retries
-            )
-            .order_by(Notification.created_at.asc())
-            .limit(100)  # Process in batches of 100
-            .all()
-        )
+        requeued = Notification.requeue_stale(db, STALE_CLAIM_AFTER)
+        if requeued:
+            logger.warning(f"Requeued {requeued} notifications from abandoned claims")
+
+        # Claim a batch of pending notifications; commit publishes the claim
+        pending = Notification.claim_batch(db, NOTIFICATION_BATCH_SIZE)
+        db.commit()
 
         if not pending:
             logger.debug("No pending notifications to send")
@@ -78,12 +121,12 @@ def send_pending_notifications(self):
         success_count = 0
         failed_count = 0
 
+        # Send the whole batch in one event loop, over shared connections
+        results = asyncio.run(send_batch_async(pending))
+
         # Process each notification
-        for notification in pending:
+        for notification, success in zip(pending, results):
             try:
-                # Send the notification (async)
-                success = asyncio.run(send_notification_async(notification))
-
                 if success:
                     # Update notification as sent
                     notification.status = "sent"
@@ -100,6 +143,7 @@ def send_pending_notifications(self):
                         notification.failure_reason = "Max retries exceeded"
                         logger.error(f"✗ Failed to send notification {notification.id} after {notification.retry_count} retries")
                     else:
+                        notification.status = "pending"
                         logger.warning(f"⚠ Failed to send notification {notification.id}, will retry ({notification.retry_count}/{notification.max_retries})")
 
                     failed_count += 1
@@ -114,6 +158,8 @@ def send_pending_notifications(self):
                     notification.status = "failed"
                     notification.failed_at = datetime.utcnow()
                     notification.failure_reason = str(e)
+                else:
+                    notification.status = "pending"
 
                 db.commit()
                 failed_count += 1
@@ -143,7 +189,7 @@ def send_notification_immediately(self, notification_id: str):
     """
     db = SessionLocal()
     try:
-        notification = db.query(Notification).filter(
+        notification = db.query(Notification).options(raiseload("*")).filter(
             Notification.id == notification_id
         ).first()
 
@@ -151,9 +197,18 @@ def send_notification_immediately(self, notification_id: str):
             logger.error(f"Notification {notification_id} not found")
             return {"success": False, "error": "Notification not found"}
 
-        if notification.status != "pending":
+        # Claim it the same way batch workers do, so it is sent only once
+        claimed = (
+            db.query(Notification)
+            .filter(Notification.id == notification_id, Notification.status == "pending")
+            .update({"status": "processing", "updated_at": func.now()}, synchronize_session=False)
+        )
+        db.commit()
+        if not claimed:
+            db.refresh(notification)
             logger.warning(f"Notification {notification_id} already processed (status: {notification.status})")
             return {"success": True, "note": "Already processed"}
+        db.refresh(notification)
 
         # Send the notification
         success = asyncio.run(send_notification_async(notification))
@@ -165,7 +220,9 @@ def send_notification_immediately(self, notification_id: str):
             logger.info(f"✓ Immediately sent {notification.channel} notification {notification_id}")
             return {"success": True}
         else:
+            # Hand it back to the batch worker for retries
             notification.retry_count += 1
+            notification.status = "pending"
             db.commit()
             logger.error(f"✗ Failed to immediately send notification {notification_id}")
             return {"success": False, "error": "Send failed"}
@@ -178,6 +235,33 @@ def send_notification_immediately(self, notification_id: str):
         db.close()
 
 
+@shared_task(name="create_notification_partitions", bind=True)
+def create_notification_partitions(self, months_ahead: int = 1):
+    """
+    Create this month's and the next ``months_ahead`` monthly partitions
+    of the notifications table, so new rows never land in the default
+    partition (which would block creating their month's partition later).
+    """
+    db = SessionLocal()
+    try:
+        month = datetime.utcnow().date().replace(day=1)
+        created = []
+        for _ in range(months_ahead + 1):
+            created.append(Notification.create_month_partition(db, month))
+            month = (month + timedelta(days=32)).replace(day=1)
+        db.commit()
+
+        logger.info(f"Ensured notification partitions: {', '.join(created)}")
+        return {"partitions": created}
+
+    except Exception as e:
+        logger.error(f"Error creating notification partitions: {e}")
+        db.rollback()
+        return {"error": str(e)}
+    finally:
+        db.close()
+
+
 @shared_task(name="cleanup_old_notifications", bind=True)
 def cleanup_old_notifications(self, days_old: int = 30):
     """
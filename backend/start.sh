@@ -4,6 +4,13 @@ set -e
 # Run database migrations (handle multiple branches)
 alembic upgrade heads
 
+# Fresh prometheus_client multiprocess directory (stale mmap files from a
+# previous run would be summed into /metrics)
+if [ -n "$PROMETHEUS_MULTIPROC_DIR" ]; then
+  rm -rf "$PROMETHEUS_MULTIPROC_DIR"
+  mkdir -p "$PROMETHEUS_MULTIPROC_DIR"
+fi
+
 # Start the application server
 exec uvicorn app.main:app \
   --host 0.0.0.0 \
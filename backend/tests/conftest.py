@@ -11,17 +11,20 @@ if str(ROOT) not in sys.path:
 
 import pytest
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
 from fastapi.testclient import TestClient
 
 from app.core.database import Base
 # Import models to ensure SQLAlchemy metadata is populated before create_all
-import app.models  # noqa: F401
+import app.models.registry  # noqa: F401
 from app.main import app
-from app.core.database import get_db
+from app.core.database import get_db, get_db_readonly, get_async_db, get_async_db_readonly
 
 # Test database URL (use file-based SQLite so the schema persists across connections)
 TEST_DATABASE_URL = "sqlite:///./test.db"
+# Same file through aiosqlite for endpoints that take an AsyncSession
+TEST_ASYNC_DATABASE_URL = "sqlite+aiosqlite:///./test.db"
 
 # Compatibility: map PostgreSQL-specific types to SQLite equivalents for DDL
 # so models using UUID / JSONB can create tables under SQLite for fast unit tests.
@@ -44,6 +47,24 @@ try:
     @compiles(PG_INET, "sqlite")
     def _compile_inet_sqlite(element: TypeEngine, compiler, **kw):  # type: ignore[override]
         return "TEXT"
+
+    # CITEXT becomes TEXT COLLATE NOCASE, SQLite's case-insensitive equivalent
+    from sqlalchemy.dialects.postgresql import CITEXT as PG_CITEXT  # type: ignore
+
+    @compiles(PG_CITEXT, "sqlite")
+    def _compile_citext_sqlite(element: TypeEngine, compiler, **kw):  # type: ignore[override]
+        return "TEXT COLLATE NOCASE"
+
+    # SQLite has no identity columns, so it cannot fill a NOT NULL Identity()
+    # column (e.g. hospitals.int_id); leave such columns nullable there
+    from sqlalchemy.schema import CreateColumn
+
+    @compiles(CreateColumn, "sqlite")
+    def _compile_identity_column_sqlite(element, compiler, **kw):  # type: ignore[override]
+        text = compiler.visit_create_column(element, **kw)
+        if text is not None and element.element.identity is not None:
+            text = text.replace(" NOT NULL", "")
+        return text
 except Exception:
     # If imports fail (older SQLAlchemy), tests will skip DDL fallback
     pass
@@ -76,7 +97,19 @@ def client(test_db):
         finally:
             pass
     
+    async_engine = create_async_engine(TEST_ASYNC_DATABASE_URL)
+    TestingAsyncSessionLocal = async_sessionmaker(
+        async_engine, autoflush=False, expire_on_commit=False
+    )
+
+    async def override_get_async_db():
+        async with TestingAsyncSessionLocal() as db:
+            yield db
+
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_db_readonly] = override_get_db
+    app.dependency_overrides[get_async_db] = override_get_async_db
+    app.dependency_overrides[get_async_db_readonly] = override_get_async_db
     
     with TestClient(app) as test_client:
         yield test_client
@@ -0,0 +1,115 @@
+from datetime import date, datetime, timezone
+from uuid import uuid4
+
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.main import app
+from app.core.dependencies import user_with_role
+from app.models.case_sheet import CaseSheet
+from app.models.patient import Patient
+from app.models.role import Role
+from app.models.user import User
+
+
+def _seed_case_sheet(test_db: Session):
+    role = Role(name="nurse", display_name="Nurse", permissions={})
+    test_db.add(role)
+    test_db.flush()
+
+    nurse = User(
+        email="nurse@example.com",
+        password_hash="x",
+        first_name="Nur",
+        last_name="Se",
+        role_id=role.id,
+        is_active=True,
+    )
+    test_db.add(nurse)
+    test_db.flush()
+
+    patient = Patient(
+        first_name="Pat",
+        last_name="Ient",
+        date_of_birth=date(1990, 1, 1),
+        gender="male",
+    )
+    test_db.add(patient)
+    test_db.flush()
+
+    # SQLite does not enforce the visit/hospital foreign keys
+    case_sheet = CaseSheet(
+        patient_id=patient.id,
+        visit_id=uuid4(),
+        hospital_id=uuid4(),
+        case_number="CS-1",
+        admission_date=datetime.now(timezone.utc),
+        chief_complaint="Fever",
+        created_by=nurse.id,
+        event_timeline=[
+            {"type": "doctor_visit", "description": "Rounds", "requires_acknowledgment": False},
+            {"type": "medication_administered", "description": "Give paracetamol",
+             "requires_acknowledgment": True, "acknowledged": False},
+        ],
+    )
+    test_db.add(case_sheet)
+    test_db.commit()
+    test_db.refresh(nurse)
+    test_db.refresh(case_sheet)
+    return nurse, case_sheet
+
+
+def test_case_sheet_event_routes(client: TestClient, test_db: Session):
+    nurse, case_sheet = _seed_case_sheet(test_db)
+
+    app.dependency_overrides[user_with_role()] = lambda: nurse
+    app.dependency_overrides[user_with_role("doctor", "nurse", "manager")] = lambda: nurse
+
+    # Pending acknowledgments are read through the async read-only session
+    resp = client.get(
+        f"/api/v1/case-sheets/{case_sheet.id}/events/pending",
+        headers={"Authorization": "Bearer test"},
+    )
+    assert resp.status_code == 200, resp.text
+    body = resp.json()
+    assert body["case_number"] == "CS-1"
+    assert body["pending_count"] == 1
+    assert body["pending_events"][0]["index"] == 1
+
+    # The batch endpoint is mounted and validates before touching the timeline
+    resp = client.post(
+        f"/api/v1/case-sheets/{case_sheet.id}/events/batch",
+        json=[],
+        headers={"Authorization": "Bearer test"},
+    )
+    assert resp.status_code == 400
+
+    resp = client.post(
+        f"/api/v1/case-sheets/{uuid4()}/events/batch",
+        json=[{"event_type": "doctor_visit", "description": "Rounds"}],
+        headers={"Authorization": "Bearer test"},
+    )
+    assert resp.status_code == 404
+
+
+def test_case_sheet_read_only_routes(client: TestClient, test_db: Session):
+    nurse, case_sheet = _seed_case_sheet(test_db)
+
+    from app.core.dependencies import get_current_active_user
+
+    app.dependency_overrides[get_current_active_user] = lambda: nurse
+
+    # Both routes take their session from get_db_readonly
+    resp = client.get(
+        f"/api/v1/case-sheets/{case_sheet.id}",
+        headers={"Authorization": "Bearer test"},
+    )
+    assert resp.status_code == 200, resp.text
+    assert resp.json()["case_number"] == "CS-1"
+
+    resp = client.get(
+        f"/api/v1/case-sheets/by-visit/{case_sheet.visit_id}",
+        headers={"Authorization": "Bearer test"},
+    )
+    assert resp.status_code == 200, resp.text
+    assert resp.json()["id"] == str(case_sheet.id)
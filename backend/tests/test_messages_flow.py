@@ -82,6 +82,10 @@ def test_messages_thread_and_send(client: TestClient, test_db: Session):
 
     app.dependency_overrides[get_current_active_user] = _override_current_user_patient
 
+    resp = client.get("/api/v1/messages/threads", headers={"Authorization": "Bearer test"})
+    assert resp.status_code == 200
+    assert resp.json()[0]["unread_count"] == 1
+
     resp = client.get(
         f"/api/v1/messages/threads/{thread['id']}/messages",
         headers={"Authorization": "Bearer test"},
@@ -91,4 +95,8 @@ def test_messages_thread_and_send(client: TestClient, test_db: Session):
     assert len(msgs) == 1
     assert msgs[0]["content"] == "Hello, how are you?"
 
+    # Opening the thread marked the message read
+    resp = client.get("/api/v1/messages/threads", headers={"Authorization": "Bearer test"})
+    assert resp.json()[0]["unread_count"] == 0
+
     app.dependency_overrides.clear()
@@ -0,0 +1,77 @@
+"""
+Unit tests for the Redis cache layer (no Redis server required)
+"""
+from datetime import datetime, timezone
+from uuid import uuid4
+
+from app.core.cache import cache, _dumps, _loads
+
+
+def test_json_payload_roundtrip():
+    """JSON-native values round-trip through the JSON codec"""
+    value = {"hospital_id": "abc", "beds": [1, 2, 3], "occupancy": 0.75}
+    assert _loads(_dumps(value)) == value
+
+
+def test_non_json_payload_falls_back_to_pickle():
+    """Values JSON cannot encode still round-trip"""
+    value = {1, 2, 3}
+    assert _loads(_dumps(value)) == value
+
+
+def test_uuid_and_datetime_keep_their_types():
+    """A cache hit returns the same types as the original value"""
+    value = {"id": uuid4(), "at": datetime.now(timezone.utc), "pair": (1, 2)}
+    assert _loads(_dumps(value)) == value
+
+
+def test_generate_key_is_stable_and_prefixed():
+    """Same arguments give the same key; different arguments do not"""
+    patient_id = uuid4()
+    key = cache._generate_key("patient_data", patient_id, page=1)
+
+    assert key.startswith("cache:patient_data:")
+    assert key == cache._generate_key("patient_data", patient_id, page=1)
+    assert key != cache._generate_key("patient_data", patient_id, page=2)
+
+
+def test_l1_hit_skips_redis():
+    """Values in the in-process L1 cache are served without Redis"""
+    key = cache._generate_key("kpi_data", "hospital-1")
+    cache._l1_set(key, _dumps({"admissions": 12}))
+    try:
+        assert cache.get(key) == {"admissions": 12}
+        assert cache.mget([key]) == [{"admissions": 12}]
+    finally:
+        cache._l1_discard(key)
+
+
+def test_l1_hits_are_independent_copies():
+    """Mutating a value from an L1 hit does not change what others see"""
+    key = cache._generate_key("kpi_data", "hospital-2")
+    cache._l1_set(key, _dumps({"wards": ["A"]}))
+    try:
+        cache.get(key)["wards"].append("B")
+        assert cache.get(key) == {"wards": ["A"]}
+    finally:
+        cache._l1_discard(key)
+
+
+def test_l1_discard_matches_prefix_pattern():
+    """Pattern invalidation drops matching L1 entries only"""
+    kept = cache._generate_key("kpi_data", "hospital-1")
+    dropped = cache._generate_key("dashboard_metrics", "hospital-1")
+    cache._l1_set(kept, _dumps(1))
+    cache._l1_set(dropped, _dumps(2))
+
+    cache._l1_discard("cache:dashboard_metrics:*")
+
+    assert cache._l1_get(dropped) is None
+    assert cache._l1_get(kept) == 1
+    cache._l1_discard(kept)
+
+
+def test_large_payload_roundtrip():
+    """Payloads above the compression threshold round-trip intact"""
+    value = {"rows": [{"bed": i, "status": "occupied"} for i in range(500)]}
+    assert _loads(_dumps(value)) == value
@@ -0,0 +1,47 @@
+"""
+Unit tests for raw email message assembly
+"""
+from email import message_from_bytes
+from email.header import decode_header, make_header
+
+from app.notifications.email_provider import EmailProvider
+
+
+def _parse(raw: bytes):
+    return message_from_bytes(raw)
+
+
+def test_build_message_has_text_and_html_parts():
+    """Messages are multipart/alternative with matching text and HTML bodies"""
+    raw = EmailProvider().build_message("patient@example.com", "Lab results", "Your results are ready.")
+    msg = _parse(raw)
+
+    assert msg.get_content_type() == "multipart/alternative"
+    assert msg["To"] == "patient@example.com"
+    assert msg["Subject"] == "Lab results"
+    text, html = msg.get_payload()
+    assert text.get_content_type() == "text/plain"
+    assert text.get_payload(decode=True).decode() == "Your results are ready."
+    assert html.get_content_type() == "text/html"
+    assert html.get_payload(decode=True).decode() == "<pre>Your results are ready.</pre>"
+
+
+def test_build_message_encodes_non_ascii_subject_and_body():
+    """Non-ASCII subjects are RFC 2047 encoded and bodies round-trip as UTF-8"""
+    body = "Température: 38,5 °C\n" + "x" * 2000
+    raw = EmailProvider().build_message("patient@example.com", "Résultats", body)
+    msg = _parse(raw)
+
+    assert str(make_header(decode_header(msg["Subject"]))) == "Résultats"
+    text, _ = msg.get_payload()
+    assert text.get_payload(decode=True).decode("utf-8") == body
+    assert all(len(line) <= 998 for line in raw.split(b"\r\n"))
+
+
+def test_build_message_keeps_headers_on_one_line():
+    """Line breaks in header values cannot inject extra headers"""
+    raw = EmailProvider().build_message("patient@example.com", "Hi\r\nBcc: someone@example.com", "Body")
+    msg = _parse(raw)
+
+    assert msg["Bcc"] is None
+    assert msg["Subject"] == "Hi Bcc: someone@example.com"
@@ -0,0 +1,50 @@
+"""
+Unit tests for the Prometheus metrics collector
+"""
+from app.core.metrics import DURATION_BUCKETS, Histogram, MetricsCollector, _normalize_path
+
+
+def test_histogram_buckets_are_cumulative():
+    """Exported bucket counts are cumulative and end with +Inf == count"""
+    histogram = Histogram("latency_seconds", 'path="/x"')
+    for value in (0.0005, 0.002, 0.002, 1000.0):
+        histogram.observe(value)
+
+    lines = histogram.prometheus_lines()
+    buckets = [int(line.rsplit(" ", 1)[1]) for line in lines if "_bucket" in line]
+
+    assert buckets == sorted(buckets)
+    assert buckets[0] == 1
+    assert buckets[-1] == histogram.count == 4
+    assert len(buckets) == len(DURATION_BUCKETS) + 1
+
+
+def test_request_duration_exported_as_histogram():
+    """Paths containing underscores keep their labels intact"""
+    collector = MetricsCollector()
+    collector.record_request("GET", "/api/v1/case_sheets", 200, 0.05)
+
+    output = collector.get_prometheus_metrics()
+
+    assert 'http_request_duration_seconds_count{method="GET",path="/api/v1/case_sheets"} 1' in output
+    assert 'http_request_duration_seconds_bucket{method="GET",path="/api/v1/case_sheets",le="+Inf"} 1' in output
+    assert "_avg" not in output
+
+
+def test_normalize_path_collapses_ids_only():
+    """Numeric and UUID segments become {id}; version segments are kept"""
+    path = "/api/v1/patients/3fa85f64-5717-4562-b3fc-2c963f66afa6/vitals/42"
+    assert _normalize_path(path) == "/api/v1/patients/{id}/vitals/{id}"
+
+
+def test_expire_stale_drops_idle_series():
+    """Series idle longer than the TTL disappear from the export"""
+    collector = MetricsCollector(series_ttl=0)
+    collector.record_request("GET", "/api/v1/beds", 500, 0.01)
+    collector.record_celery_task("cleanup", 1.0, "success")
+
+    assert collector.expire_stale() == 2
+
+    output = collector.get_prometheus_metrics()
+    assert "/api/v1/beds" not in output
+    assert 'task="cleanup"' not in output
@@ -0,0 +1,47 @@
+"""
+Unit tests for concurrent notification fan-out (NotificationProvider.send_many)
+"""
+import asyncio
+
+from app.notifications import base
+from app.notifications.base import NotificationProvider
+
+
+class _RecordingProvider(NotificationProvider):
+    def __init__(self):
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def send(self, recipient, subject, message, metadata=None):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0)
+        self.in_flight -= 1
+        if recipient == "broken":
+            raise RuntimeError("provider error")
+        return {"success": True, "message_id": recipient, "provider": "test"}
+
+    def get_provider_name(self):
+        return "test"
+
+
+def test_send_many_returns_results_in_order():
+    """Results line up with the input items, failures included"""
+    provider = _RecordingProvider()
+    items = [("a", "s", "m", {}), ("broken", "s", "m", {}), ("c", "s", "m", {})]
+
+    results = asyncio.run(provider.send_many(items))
+
+    assert [r["success"] for r in results] == [True, False, True]
+    assert results[0]["message_id"] == "a"
+    assert results[1] == {"success": False, "error": "provider error", "provider": "test"}
+
+
+def test_send_many_caps_concurrency(monkeypatch):
+    """No more than SEND_CONCURRENCY sends run at once"""
+    monkeypatch.setattr(base, "SEND_CONCURRENCY", 3)
+    provider = _RecordingProvider()
+
+    asyncio.run(provider.send_many([(str(i), "s", "m", {}) for i in range(10)]))
+
+    assert provider.max_in_flight == 3
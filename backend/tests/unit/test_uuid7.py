@@ -0,0 +1,28 @@
+"""
+Unit tests for time-ordered UUIDv7 primary keys
+"""
+import time
+
+from app.core.uuid7 import _uuid7
+
+
+def test_uuid7_version_and_variant():
+    """Generated ids are RFC 9562 version 7 UUIDs"""
+    value = _uuid7()
+    assert value.version == 7
+    assert value.variant == "specified in RFC 4122"
+
+
+def test_uuid7_embeds_current_millisecond_timestamp():
+    """The leading 48 bits are the Unix time in milliseconds"""
+    before = time.time_ns() // 1_000_000
+    value = _uuid7()
+    after = time.time_ns() // 1_000_000
+    assert before <= value.int >> 80 <= after
+
+
+def test_uuid7_sorts_by_creation_time():
+    """Ids from later milliseconds sort after earlier ones"""
+    first = _uuid7()
+    time.sleep(0.002)
+    assert _uuid7() > first